@@ -0,0 +1,53 @@
+"""
+Custom gesture classifier benchmark: µs per frame for 1-50 classes.
+
+    python -m benchmarks.classifier_benchmark
+
+Compares the batched, preallocated classify_hands() path (both hands in one
+matmul) against classifying each hand separately with fresh arrays.
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from core.landmark_classifier import LandmarkClassifier, NUM_FEATURES
+
+FRAMES = 5000
+CLASS_COUNTS = [1, 2, 5, 10, 20, 50]
+
+
+def fake_hands(rng, hands=2):
+    return [[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in rng.random((21, 3))] for _ in range(hands)]
+
+
+def per_frame_us(fn, frames):
+    start = time.perf_counter()
+    for hands in frames:
+        fn(hands)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frames = [fake_hands(rng) for _ in range(64)] * (FRAMES // 64)
+
+    print(f"{'classes':>8}{'batched':>12}{'batched w=5':>14}{'per-hand':>12}   (µs/frame, 2 hands)")
+    for num_classes in CLASS_COUNTS:
+        classes = [f"g{i}" for i in range(num_classes)]
+        weights = rng.normal(size=(NUM_FEATURES, num_classes)).astype(np.float32)
+        bias = np.zeros(num_classes, dtype=np.float32)
+
+        batched = LandmarkClassifier(classes, weights, bias)
+        windowed = LandmarkClassifier(classes, weights, bias, window=5)
+        naive = LandmarkClassifier(classes, weights, bias)
+
+        def per_hand(hands):
+            return [naive.predict([[(l.x, l.y, l.z) for l in lm]])[0] for lm in hands]
+
+        print(f"{num_classes:>8}{per_frame_us(batched.classify_hands, frames):>12.1f}"
+              f"{per_frame_us(windowed.classify_hands, frames):>14.1f}{per_frame_us(per_hand, frames):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
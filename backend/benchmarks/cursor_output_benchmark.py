@@ -0,0 +1,62 @@
+"""
+Cursor output benchmark: per-call injection cost and achieved move rate.
+
+    xvfb-run -s "-screen 0 1920x1080x24" python -m benchmarks.cursor_output_benchmark
+
+Runs each available input backend: raw move() cost, then a CursorOutput fed
+with 30 Hz landmark-rate updates of a circular path, reporting how many
+distinct cursor positions per second actually reach the OS.
+"""
+import math
+import time
+
+from core.cursor_output import CursorOutput
+from core.input_backend import PyAutoGUIBackend, XlibBackend, XLIB_AVAILABLE
+
+CALLS = 2000
+SECONDS = 3.0
+CAMERA_FPS = 30
+
+
+def time_moves(backend):
+    start = time.perf_counter()
+    for i in range(CALLS):
+        backend.move(100 + i % 500, 100 + i % 300)
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+def output_rate(backend, rate_hz):
+    output = CursorOutput(backend, rate_hz=rate_hz)
+    output.start()
+    start = time.perf_counter()
+    radius, omega = 300, 2 * math.pi * 0.5
+    while time.perf_counter() - start < SECONDS:
+        t = time.perf_counter() - start
+        x, y = 960 + radius * math.cos(omega * t), 540 + radius * math.sin(omega * t)
+        vx, vy = -radius * omega * math.sin(omega * t), radius * omega * math.cos(omega * t)
+        output.update(x, y, vx, vy)
+        time.sleep(1 / CAMERA_FPS)
+    output.stop()
+    return output.moves / SECONDS
+
+
+def main():
+    backends = [("pyautogui", PyAutoGUIBackend)]
+    if XLIB_AVAILABLE: backends.append(("xlib", XlibBackend))
+
+    print(f"{'backend':<12}{'us/move':>10}{'moves/s @144Hz':>17}{'moves/s @240Hz':>17}")
+    for name, factory in backends:
+        try: backend = factory()
+        except Exception as e:
+            print(f"{name:<12} unavailable: {e}")
+            continue
+        cost = time_moves(backend)
+        rate_144 = output_rate(backend, 144)
+        rate_240 = output_rate(backend, 240)
+        backend.close()
+        print(f"{name:<12}{cost:>10.1f}{rate_144:>17.1f}{rate_240:>17.1f}")
+    print(f"(camera updates: {CAMERA_FPS}/s)")
+
+
+if __name__ == "__main__":
+    main()
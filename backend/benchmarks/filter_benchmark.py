@@ -0,0 +1,96 @@
+"""
+Cursor filter benchmark: lag and jitter per filter on a recorded or synthetic trace.
+
+    python -m benchmarks.filter_benchmark                 # synthetic 30 fps trace
+    python -m benchmarks.filter_benchmark trace.csv       # recorded "t,x,y" rows (seconds, pixels)
+
+Lag   = time shift (ms) that best aligns the filtered path with the reference path.
+Jitter = RMS deviation (px) from the reference while the hand is (nearly) still.
+The reference is the ground truth for synthetic traces, and a zero-phase
+moving average of the raw samples for recorded ones.
+"""
+import sys
+import numpy as np
+
+from core.filters import EMAFilter, OneEuroFilter, KalmanFilter
+
+FPS = 30
+PIPELINE_DELAY = 0.045  # Typical capture -> landmarks delay on a laptop CPU
+
+
+def synthetic_trace(seconds=12, noise_px=2.5, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(0, seconds, 1 / FPS)
+    x = np.zeros_like(t)
+    y = np.zeros_like(t)
+    # Alternate still holds and fast sweeps, like real pointing
+    for start in np.arange(0, seconds, 3.0):
+        hold = (t >= start) & (t < start + 1.5)
+        sweep = (t >= start + 1.5) & (t < start + 3.0)
+        phase = (t[sweep] - start - 1.5) / 1.5
+        x[hold] = 400 + 300 * ((start // 3) % 2)
+        y[hold] = 300
+        direction = 1 if (start // 3) % 2 == 0 else -1
+        x[sweep] = x[hold][0] + direction * 300 * (0.5 - 0.5 * np.cos(np.pi * phase))
+        y[sweep] = 300 + 120 * np.sin(2 * np.pi * phase)
+    truth = np.stack([x, y], axis=1)
+    raw = truth + rng.normal(0, noise_px, truth.shape)
+    return t, raw, truth
+
+
+def load_trace(path):
+    data = np.loadtxt(path, delimiter=",", ndmin=2)
+    t, raw = data[:, 0], data[:, 1:3]
+    kernel = np.ones(5) / 5
+    reference = np.stack([np.convolve(raw[:, i], kernel, mode="same") for i in range(2)], axis=1)
+    return t, raw, reference
+
+
+def run(filt, t, raw):
+    return np.array([filt(p, ts) for p, ts in zip(raw, t)])
+
+
+def lag_ms(t, out, reference, max_shift=15):
+    dt = np.median(np.diff(t))
+    errors = []
+    for s in range(0, max_shift + 1):
+        a = out[s:] if s else out
+        b = reference[:len(reference) - s]
+        errors.append(np.mean(np.sum((a - b) ** 2, axis=1)))
+    # Negative shifts = filter is ahead of the reference (over-prediction)
+    for s in range(1, max_shift + 1):
+        errors.insert(0, np.mean(np.sum((out[:-s] - reference[s:]) ** 2, axis=1)))
+    return (int(np.argmin(errors)) - max_shift) * dt * 1000
+
+
+def jitter_px(out, reference, speed_limit=20):
+    speed = np.linalg.norm(np.gradient(reference, axis=0), axis=1)
+    still = speed < speed_limit / FPS
+    if not still.any():
+        return float("nan")
+    return float(np.sqrt(np.mean(np.sum((out[still] - reference[still]) ** 2, axis=1))))
+
+
+def main(argv):
+    if len(argv) > 1:
+        t, raw, reference = load_trace(argv[1])
+    else:
+        t, raw, reference = synthetic_trace()
+
+    candidates = {
+        "ema (legacy smooth=5)": EMAFilter(alpha=0.2),
+        "one_euro": OneEuroFilter(min_cutoff=1.0, beta=0.007),
+        "one_euro + lead": OneEuroFilter(min_cutoff=1.0, beta=0.007, lead=PIPELINE_DELAY),
+        "kalman": KalmanFilter(process_noise=2e5, measurement_noise=6.0),
+        "kalman + lead": KalmanFilter(process_noise=2e5, measurement_noise=6.0, lead=PIPELINE_DELAY),
+    }
+
+    print(f"{'filter':<24}{'lag (ms)':>10}{'jitter (px)':>13}")
+    print(f"{'raw':<24}{lag_ms(t, raw, reference):>10.1f}{jitter_px(raw, reference):>13.2f}")
+    for name, filt in candidates.items():
+        out = run(filt, t, raw)
+        print(f"{name:<24}{lag_ms(t, out, reference):>10.1f}{jitter_px(out, reference):>13.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
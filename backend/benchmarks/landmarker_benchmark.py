@@ -0,0 +1,114 @@
+"""
+Hand landmarker benchmark: frames per second per LandmarkerOptions configuration.
+
+    python -m benchmarks.landmarker_benchmark [--video clip.mp4] [--frames 300]
+        [--hands 1 2] [--threads 0 1 2 4] [--cpus all 0-1 0-3] [--delegate cpu gpu]
+
+Every combination builds a landmarker through core.landmarker.create_landmarker
+(warm-up disabled, so the cold first frame is visible) and runs the vision
+loop's landmark stage on each frame: flip, BGR->RGB, detect. Reported:
+  build     create_landmarker()
+  first     first detect() on a fresh landmarker (what warm-up absorbs)
+  p50/p95   per-frame latency after the first frame
+  fps       frames / wall time, single vision thread
+Use a clip with hands in it (--video) to size hardware: without one the
+frames are blank and only palm detection runs. threads 0 = OpenCV default.
+"""
+import argparse
+import itertools
+import os
+import statistics
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from core.landmarker import FRAME_SHAPE, LandmarkerOptions, create_landmarker, pin_current_thread
+
+MODEL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "hand_landmarker.task")
+
+
+def load_frames(video, count):
+    if video is None:
+        return [np.zeros(FRAME_SHAPE, dtype=np.uint8)] * count
+    cap = cv2.VideoCapture(video)
+    frames = []
+    while len(frames) < count:
+        ok, frame = cap.read()
+        if not ok:
+            if not frames: raise SystemExit(f"Cannot read {video}")
+            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)  # Loop short clips
+            continue
+        frames.append(cv2.resize(frame, (FRAME_SHAPE[1], FRAME_SHAPE[0])))
+    cap.release()
+    return frames
+
+
+def parse_cpus(text):
+    if text == "all": return None
+    cpus = set()
+    for part in text.split(","):
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return tuple(sorted(cpus))
+
+
+def detect(detector, frame):
+    rgb = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+    return detector.detect(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb))
+
+
+def run(options, num_hands, frames):
+    start = time.perf_counter()
+    detector = create_landmarker(options, num_hands)
+    built = time.perf_counter()
+    pin_current_thread(options.cpu_affinity)  # As GestureEngine._run_loop does
+    try:
+        detect(detector, frames[0])
+        first = time.perf_counter()
+        latencies = []
+        for frame in frames[1:]:
+            t = time.perf_counter()
+            detect(detector, frame)
+            latencies.append(time.perf_counter() - t)
+        total = time.perf_counter() - first
+    finally:
+        pin_current_thread(None)
+        detector.close()
+    latencies.sort()
+    return {
+        "build": (built - start) * 1e3, "first": (first - built) * 1e3,
+        "p50": statistics.median(latencies) * 1e3, "p95": latencies[int(len(latencies) * 0.95)] * 1e3,
+        "fps": len(latencies) / total,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=MODEL)
+    parser.add_argument("--video", help="Clip to replay (default: blank frames)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--hands", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--threads", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--cpus", nargs="+", default=["all"], help='CPU sets like "0-1" or "0,2"; "all" = no pinning')
+    parser.add_argument("--delegate", nargs="+", default=["cpu"])
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, max(args.frames, 2))
+    print(f"{os.cpu_count()} CPUs, {len(frames)} frames from {args.video or 'blank frames (palm detection only)'}")
+    print(f"{'hands':>5}{'threads':>8}{'cpus':>8}{'delegate':>9}{'build ms':>10}{'first ms':>10}{'p50 ms':>8}{'p95 ms':>8}{'fps':>8}")
+    for hands, threads, cpus, delegate in itertools.product(args.hands, args.threads, args.cpus, args.delegate):
+        label = f"{hands:>5}{threads or 'def':>8}{cpus:>8}{delegate:>9}"
+        try:
+            options = LandmarkerOptions(args.model, num_hands=hands, threads=threads or None,
+                                        cpu_affinity=parse_cpus(cpus), delegate=delegate, warm_up_frames=0)
+            r = run(options, hands, frames)
+        except Exception as e:
+            print(f"{label}  failed: {e}")
+            continue
+        print(f"{label}{r['build']:>10.1f}{r['first']:>10.1f}{r['p50']:>8.2f}{r['p95']:>8.2f}{r['fps']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Macro benchmark: wall time of common key macros per injection path.
+
+    xvfb-run -s "-screen 0 1920x1080x24" python -m benchmarks.macro_benchmark
+
+Compares the old per-key pyautogui calls (hotkey with interval=0.05 and the
+engine's global PAUSE) against MacroEngine batches on each available
+backend. Injected keys land in the Xvfb session, not your desktop.
+"""
+import time
+
+import pyautogui
+
+from core.input_backend import PyAutoGUIBackend, XlibBackend, XLIB_AVAILABLE
+from core.macros import MacroEngine
+
+RUNS = 50
+TEXT = "Hello, World! 123"
+MACROS = {
+    "ctrl+c": ["ctrl", "c"],
+    "shift+down x5": [{"hold": "shift", "steps": [{"press": "down", "repeat": 5}]}],
+    "text (17 chars)": [{"text": TEXT}],
+}
+
+
+def time_call(fn, runs=RUNS):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1e3
+
+
+def legacy_times():
+    pyautogui.PAUSE = 0.01  # Engine default
+    return {
+        "ctrl+c": time_call(lambda: pyautogui.hotkey("ctrl", "c", interval=0.05), runs=5),
+        "shift+down x5": time_call(lambda: [pyautogui.hotkey("shift", "down") for _ in range(5)], runs=5),
+        "text (17 chars)": time_call(lambda: pyautogui.write(TEXT), runs=5),
+    }
+
+
+def macro_times(backend):
+    macros = MacroEngine(backend)
+    compiled = {name: macros.compile(spec) for name, spec in MACROS.items()}
+    return {name: time_call(lambda m=macro: macros.execute(m)) for name, macro in compiled.items()}
+
+
+def main():
+    columns = [("pyautogui (legacy)", legacy_times())]
+    backends = [("pyautogui", PyAutoGUIBackend)]
+    if XLIB_AVAILABLE: backends.append(("xlib", XlibBackend))
+    for name, factory in backends:
+        try: backend = factory()
+        except Exception as e:
+            print(f"{name} unavailable: {e}")
+            continue
+        columns.append((f"macro/{name}", macro_times(backend)))
+        backend.close()
+
+    print(f"{'ms per macro':<18}" + "".join(f"{title:>22}" for title, _ in columns))
+    for name in MACROS:
+        print(f"{name:<18}" + "".join(f"{times[name]:>22.2f}" for _, times in columns))
+
+
+if __name__ == "__main__":
+    main()
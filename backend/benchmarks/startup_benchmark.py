@@ -0,0 +1,68 @@
+"""
+Startup benchmark: server import, first API response and engine warm-up.
+
+    python -m benchmarks.startup_benchmark [--runs 5] [--warm-up]
+
+Each run is a fresh interpreter (ENGINE_WARMUP=0, so nothing loads in the
+background) reporting:
+  import      `import server` (constructs the lightweight GestureEngine)
+  first GET   first /api/ response through the ASGI app, after import
+  warm-up     GestureEngine.warm_up(): mediapipe, model, gesture modules,
+              OS backends (only with --warm-up; needs the full vision stack)
+Also lists which heavy modules the import pulled in (should be none).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY = ("cv2", "mediapipe", "pyautogui", "Xlib", "pycaw", "comtypes", "pulsectl")
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import server
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(server.app)
+t2 = time.perf_counter()
+assert client.get("/api/").status_code == 200
+t3 = time.perf_counter()
+result = {"import": t1 - t0, "first_get": t3 - t2, "heavy": [m for m in HEAVY if m in sys.modules]}
+if WARM_UP:
+    t4 = time.perf_counter()
+    server.gesture_engine.warm_up()
+    result["warm_up"] = time.perf_counter() - t4
+print(json.dumps(result))
+"""
+
+
+def run_once(warm_up):
+    env = dict(os.environ, ENGINE_WARMUP="0")
+    code = f"HEAVY = {HEAVY!r}\nWARM_UP = {warm_up!r}\n" + PROBE
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=backend_dir, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr else "probe failed")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warm-up", action="store_true", help="Also time GestureEngine.warm_up()")
+    args = parser.parse_args()
+
+    results = [run_once(args.warm_up) for _ in range(args.runs)]
+    keys = ["import", "first_get"] + (["warm_up"] if args.warm_up else [])
+    print(f"{'stage':<12}{'median ms':>12}{'max ms':>10}")
+    for key in keys:
+        values = [r[key] * 1e3 for r in results]
+        print(f"{key:<12}{statistics.median(values):>12.1f}{max(values):>10.1f}")
+    print(f"heavy modules after import: {results[0]['heavy'] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Keyframe tracking benchmark: landmarker CPU saved vs landmark error.
+
+    python -m benchmarks.tracking_benchmark --video clip_with_hands.mp4 [--frames 300] [--intervals 2 3 4 6]
+
+Replays the clip through the engine's landmark stage (flip, grayscale,
+LandmarkTracker.track) once with the landmarker on every frame, which is
+also the reference, then once per max_interval. Reported per row:
+  ms/frame     landmark stage cost per frame
+  detect       fraction of frames that ran the landmarker
+  drift        forward-backward resets
+  err px       mean / p95 landmark distance to the every-frame reference
+               (frames where both found the same number of hands)
+"""
+import argparse
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from benchmarks.landmarker_benchmark import MODEL, load_frames
+from core.landmark_tracker import LandmarkTracker
+from core.landmarker import LandmarkerOptions, create_landmarker
+
+
+def run(detector, frames, max_interval):
+    tracker = LandmarkTracker(max_interval=max_interval)
+    h, w = frames[0].shape[:2]
+
+    def detect(frame):
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return detector.detect(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb))
+
+    landmarks = []
+    start = time.perf_counter()
+    for frame in frames:
+        frame = cv2.flip(frame, 1)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if tracker.enabled else None
+        result = tracker.track(gray, lambda: detect(frame))
+        landmarks.append(np.array([[(l.x * w, l.y * h) for l in hand] for hand in result.hand_landmarks]))
+    elapsed = time.perf_counter() - start
+    return landmarks, elapsed / len(frames) * 1e3, tracker.stats()
+
+
+def errors(landmarks, reference):
+    distances = [
+        np.linalg.norm(a - b, axis=-1).ravel()
+        for a, b in zip(landmarks, reference) if len(a) and a.shape == b.shape
+    ]
+    if not distances: return float("nan"), float("nan")
+    distances = np.concatenate(distances)
+    return float(distances.mean()), float(np.percentile(distances, 95))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=MODEL)
+    parser.add_argument("--video", required=True, help="Clip with hands in it")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--hands", type=int, default=2)
+    parser.add_argument("--intervals", type=int, nargs="+", default=[2, 3, 4, 6])
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.frames)
+    detector = create_landmarker(LandmarkerOptions(args.model, num_hands=args.hands), args.hands)
+    reference, base_ms, _ = run(detector, frames, 1)
+
+    print(f"{'max_interval':>12}{'ms/frame':>10}{'detect':>8}{'drift':>7}{'err px':>8}{'p95 px':>8}")
+    print(f"{1:>12}{base_ms:>10.2f}{1.0:>8.2f}{0:>7}{0.0:>8.2f}{0.0:>8.2f}")
+    for interval in args.intervals:
+        landmarks, ms, stats = run(detector, frames, interval)
+        mean, p95 = errors(landmarks, reference)
+        print(f"{interval:>12}{ms:>10.2f}{stats['detect_ratio']:>8.2f}{stats['drift_resets']:>7}{mean:>8.2f}{p95:>8.2f}")
+    detector.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# --- ACTIVITY HISTORY ---
+# record() is all the vision thread pays: one tuple onto a queue. A writer
+# thread drains the queue in batches and, in one SQLite (WAL) transaction,
+# appends the raw events and bumps per-gesture counters in minute / hour /
+# day rollup tables. History queries read only the rollups, so a year of
+# usage at hour resolution is a primary-key range scan. Buckets are aligned
+# to local wall-clock time (days start at local midnight), matching how the
+# history endpoint renders them.
+
+BUCKETS = {"minute": 60, "hour": 3600, "day": 86400}
+RETENTION = {"events": 30 * 86400, "minute": 7 * 86400}  # Hour / day rollups are kept forever
+PRUNE_INTERVAL = 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (ts REAL NOT NULL, gesture TEXT NOT NULL, action TEXT);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE TABLE IF NOT EXISTS rollups (
+    bucket INTEGER NOT NULL, gesture TEXT NOT NULL, start INTEGER NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (bucket, gesture, start)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rollups_time ON rollups (bucket, start);
+"""
+
+
+def bucket_start(ts, size):
+    """Epoch start of the local-time bucket holding ts."""
+    local = time.localtime(ts)
+    if size >= BUCKETS["day"]:
+        # Local midnight via mktime: DST days are 23 / 25 hours long
+        return int(time.mktime((local.tm_year, local.tm_mon, local.tm_mday, 0, 0, 0, 0, 0, -1)))
+    return int(ts - (ts + local.tm_gmtoff) % size)  # Half-hour UTC offsets shift hour buckets too
+
+
+def activity_entry(record):
+    """API form of an activity record (ts, gesture, action)."""
+    ts, gesture, action = record
+    return {"id": f"{ts:.6f}", "gesture": gesture, "action": action, "time": datetime.fromtimestamp(ts).isoformat()}
+
+
+class ActivityStore:
+    def __init__(self, path, max_batch=1000):
+        self.path = path
+        self.max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._local = threading.local()  # One read connection per API worker thread
+        self._ready = threading.Event()
+        self.error = None
+        self.written = 0
+
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def record(self, ts, gesture, action):
+        self._queue.put((ts, gesture, action))
+
+    def close(self):
+        """Flush everything recorded so far and stop the writer."""
+        self._queue.put(None)
+        self._writer.join()
+
+    # ---------------- WRITER ----------------
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _write_loop(self):
+        try:
+            conn = self._connect()
+            conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            self.error = str(e)
+            print(f"Activity Store Error: {e}")
+            self._ready.set()
+            while self._queue.get() is not None: pass  # Keep record() cheap; drop until closed
+            return
+        self._ready.set()
+
+        last_prune = 0.0
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.max_batch: break
+                try: item = self._queue.get_nowait()  # Whatever queued up during the last write
+                except queue.Empty: break
+            else:
+                stopping = True
+
+            try:
+                if batch: self._write_batch(conn, batch)
+                if time.time() - last_prune > PRUNE_INTERVAL:
+                    self._prune(conn)
+                    last_prune = time.time()
+            except sqlite3.Error as e: print(f"Activity Store Error: {e}")
+        conn.close()
+
+    def _write_batch(self, conn, batch):
+        counts = {}
+        for ts, gesture, _ in batch:
+            for size in BUCKETS.values():
+                key = (size, gesture, bucket_start(ts, size))
+                counts[key] = counts.get(key, 0) + 1
+        with conn:
+            conn.executemany("INSERT INTO events (ts, gesture, action) VALUES (?, ?, ?)", batch)
+            conn.executemany(
+                "INSERT INTO rollups (bucket, gesture, start, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (bucket, gesture, start) DO UPDATE SET count = count + excluded.count",
+                [(*key, n) for key, n in counts.items()],
+            )
+        self.written += len(batch)
+
+    def _prune(self, conn):
+        now = time.time()
+        with conn:
+            conn.execute("DELETE FROM events WHERE ts < ?", (now - RETENTION["events"],))
+            conn.execute("DELETE FROM rollups WHERE bucket = ? AND start < ?", (BUCKETS["minute"], now - RETENTION["minute"]))
+
+    # ---------------- QUERIES (any thread) ----------------
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self._ready.wait()  # Schema exists before the first read
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=5)
+        return conn
+
+    def history(self, gesture=None, start=None, end=None, bucket="hour"):
+        """[(bucket_start_epoch, gesture, count)] from the rollups, oldest first."""
+        size = BUCKETS[bucket]
+        end = time.time() if end is None else end
+        start = end - 24 * 3600 if start is None else start
+        query = "SELECT start, gesture, count FROM rollups WHERE bucket = ? AND start >= ? AND start < ?"
+        params = [size, bucket_start(start, size), end]
+        if gesture is not None:
+            query += " AND gesture = ?"
+            params.append(gesture)
+        return self._reader().execute(query + " ORDER BY start, gesture", params).fetchall()
+
+    def recent(self, limit=20):
+        """[(ts, gesture, action)] newest first."""
+        return self._reader().execute(
+            "SELECT ts, gesture, action FROM events ORDER BY ts DESC LIMIT ?", (limit,)
+        ).fetchall()
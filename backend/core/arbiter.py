@@ -0,0 +1,74 @@
+# --- GESTURE ARBITRATION ---
+# Per-frame finite-state machine. The engine proposes a mode from the
+# current poses; while a mode is active only its compatible gestures are
+# evaluated, and at most one one-shot gesture may fire per frame.
+
+IDLE = "idle"
+
+# Mode -> gestures allowed to run while it is active (idle allows everything)
+MODE_GESTURES = {
+    "zoom": {"zoom"},
+    "volume": {"volume", "mouse_beta"},
+    "mouse": {"mouse_beta", "volume", "snap"},
+    "text": {"text_mode", "volume", "snap"},
+    "drawing_circle": {"circular", "volume", "snap"},
+}
+
+# Continuous controls are never locked out by a one-shot firing in the same frame
+CONTINUOUS = {"zoom", "volume", "mouse_beta", "text_mode"}
+
+# Gestures that only run inside their own mode (their pose defines the mode)
+MODE_OWNER = {"zoom": "zoom", "text_mode": "text", "circular": "drawing_circle"}
+
+# Highest priority first when several mode poses are present at once
+MODE_PRIORITY = ["zoom", "volume", "mouse", "text", "drawing_circle"]
+
+
+class GestureArbiter:
+    def __init__(self, release_frames=3):
+        self.mode = IDLE
+        self.release_frames = release_frames  # Frames a mode survives without its pose (hysteresis)
+        self.claimed = None                   # One-shot gesture that fired this frame
+        self._misses = 0
+        self.transitions = 0
+
+    def propose(self, candidates):
+        """
+        candidates: set of mode names whose entry poses are present this frame.
+        Returns the active mode for this frame.
+        """
+        self.claimed = None
+        candidate = next((m for m in MODE_PRIORITY if m in candidates), IDLE)
+
+        if candidate == self.mode:
+            self._misses = 0
+        elif self.mode == IDLE:
+            self._switch(candidate)
+        elif candidate != IDLE and MODE_PRIORITY.index(candidate) < MODE_PRIORITY.index(self.mode):
+            self._switch(candidate)  # Higher-priority pose pre-empts immediately
+        else:
+            self._misses += 1
+            if self._misses >= self.release_frames: self._switch(candidate)
+        return self.mode
+
+    def _switch(self, mode):
+        self.mode = mode
+        self._misses = 0
+        self.transitions += 1
+
+    def allows(self, gesture_id):
+        if self.claimed is not None and gesture_id != self.claimed and gesture_id not in CONTINUOUS:
+            return False
+        owner = MODE_OWNER.get(gesture_id)
+        if owner is not None:
+            return self.mode == owner
+        return self.mode == IDLE or gesture_id in MODE_GESTURES[self.mode]
+
+    def claim(self, gesture_id):
+        """Record that a one-shot gesture fired; other one-shots are locked out this frame."""
+        self.claimed = gesture_id
+
+    def reset(self):
+        self.mode = IDLE
+        self.claimed = None
+        self._misses = 0
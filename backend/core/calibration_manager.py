@@ -3,8 +3,30 @@ import time
 import json
 import os
 
+from gestures.hand_scale import REFERENCE_PALM_SIZE
+
+# Stock thresholds: {"module.attribute": value at the reference palm size}.
+# Modules rescale these per frame by the on-screen palm size, so calibration
+# only has to capture what differs between users: hand proportions and jitter.
+DEFAULT_THRESHOLDS = {
+    "pro_snap.touch_dist": 0.05,
+    "copy_paste.trigger_threshold": 0.04,
+    "virtual_mouse.PINCH_THRESHOLD": 30,       # pixels
+    "swipe_tabs.speed_threshold": 0.23,        # frame widths per second
+    "screenshot.speed_threshold": 2.2,         # frame heights per second
+}
+
+REFERENCE_FINGER_RATIO = 0.85  # Middle finger (MCP -> tip) / palm size on the reference hand
+REFERENCE_FRAME_WIDTH = 640    # Pixel thresholds assume the engine's capture width
+CAPTURE_FPS = 30               # Calibration frames arrive at the camera rate: per-frame jitter -> per second
+NOISE_MARGIN = 3.0             # Thresholds stay this many jitter-percentiles above noise
+PALM_IDS = [0, 5, 9, 13, 17]
+TIP_IDS = [4, 8, 12]
+
 class CalibrationManager:
-    def __init__(self):
+    def __init__(self, store=None):
+        self.store = store  # Optional CalibrationStore for persisting sessions
+        self.gesture_name = None
         self.is_active = False
         self.current_task_idx = 0
         self.progress = 0  # 0 to 100 for the active task
@@ -69,10 +91,65 @@ class CalibrationManager:
         # Add Left/Right tilt checks using landmarks 0, 5, and 17
         return True
 
+    @property
+    def complete(self):
+        """True once the last task has collected all its frames."""
+        return self.current_task_idx == len(self.tasks) - 1 and self.status == "success"
+
     def get_ui_state(self):
         return {
+            "gesture": self.gesture_name,
             "task_idx": self.current_task_idx,
+            "task_count": len(self.tasks),
             "progress": self.progress,
             "status": self.status,
-            "desc": self.tasks[self.current_task_idx]["desc"]
-        }
\ No newline at end of file
+            "desc": self.tasks[self.current_task_idx]["desc"],
+            "complete": self.complete,
+        }
+
+    def derive_thresholds(self):
+        """
+        Derive per-user thresholds (same units as DEFAULT_THRESHOLDS) from the session.
+        Hand proportions scale the distance thresholds; landmark jitter measured
+        during the "hold still" task sets a floor under every threshold.
+        """
+        frames = [f for t in sorted(self.collected_data) for f in self.collected_data[t]]
+        if not frames:
+            return {}
+        data = np.asarray(frames, dtype=np.float32)[:, :, :2]
+        palm = np.maximum(np.linalg.norm(data[:, 9] - data[:, 0], axis=1), 1e-3)
+
+        finger_ratio = np.median(np.linalg.norm(data[:, 12] - data[:, 9], axis=1) / palm)
+        proportion = float(np.clip(finger_ratio / REFERENCE_FINGER_RATIO, 0.7, 1.4))
+
+        # Per-frame jitter in palm units while the hand is held still. Differences
+        # are taken on the raw positions and then scaled by the session's median
+        # palm size: dividing each frame by its own (noisy) palm size first would
+        # multiply that noise by the hand's distance from the image origin
+        motion_noise, tip_noise = 0.0, 0.0
+        still = np.asarray(self.collected_data.get(0, []), dtype=np.float32)
+        if len(still) >= 3:
+            still = still[:, :, :2]
+            still_palm = max(float(np.median(np.linalg.norm(still[:, 9] - still[:, 0], axis=1))), 1e-3)
+            center = still[:, PALM_IDS].mean(axis=1)
+            motion_noise = float(np.percentile(np.linalg.norm(np.diff(center, axis=0), axis=1), 95)) / still_palm
+            tip_noise = float(np.percentile(np.linalg.norm(np.diff(still[:, TIP_IDS], axis=0), axis=2), 95)) / still_palm
+
+        # Palm units -> the reference-palm units the modules expect
+        tip_floor = NOISE_MARGIN * tip_noise * REFERENCE_PALM_SIZE
+        motion_floor = NOISE_MARGIN * motion_noise * REFERENCE_PALM_SIZE * CAPTURE_FPS
+        d = DEFAULT_THRESHOLDS
+        thresholds = {
+            "pro_snap.touch_dist": max(d["pro_snap.touch_dist"] * proportion, tip_floor),
+            "copy_paste.trigger_threshold": max(d["copy_paste.trigger_threshold"] * proportion, tip_floor),
+            "virtual_mouse.PINCH_THRESHOLD": max(d["virtual_mouse.PINCH_THRESHOLD"] * proportion, tip_floor * REFERENCE_FRAME_WIDTH),
+            "swipe_tabs.speed_threshold": max(d["swipe_tabs.speed_threshold"], motion_floor),
+            "screenshot.speed_threshold": max(d["screenshot.speed_threshold"], motion_floor),
+        }
+        return {name: round(float(value), 4) for name, value in thresholds.items()}
+
+    def save_profile(self, user_id="default"):
+        """Persist the current session as a compact binary profile."""
+        if self.store is None or not self.gesture_name:
+            return None
+        return self.store.save(user_id, self.gesture_name, self.collected_data, self.derive_thresholds())
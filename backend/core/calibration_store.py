@@ -0,0 +1,159 @@
+import numpy as np
+import json
+import os
+import struct
+import time
+
+# --- FILE FORMAT ---
+# [MAGIC 4B][header_len uint32][JSON header, padded to 16B][landmark array]
+# The array is stored raw so it can be memory-mapped straight off disk.
+MAGIC = b"XLCP"
+VERSION = 1
+ALIGN = 16
+PROFILE_EXT = ".xlcp"
+
+
+class CalibrationProfile:
+    """
+    One saved calibration session (one user, one gesture).
+    Only the small header is read on first access; the landmark frames are
+    memory-mapped so large sessions cost nothing until actually used.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._header = None
+        self._frames = None
+
+    @property
+    def header(self):
+        if self._header is None:
+            with open(self.path, "rb") as f:
+                magic, header_len = struct.unpack("<4sI", f.read(8))
+                if magic != MAGIC:
+                    raise ValueError(f"Not a calibration profile: {self.path}")
+                self._header = json.loads(f.read(header_len).rstrip(b" ").decode("utf-8"))
+        return self._header
+
+    @property
+    def thresholds(self):
+        return self.header.get("thresholds", {})
+
+    @property
+    def saved_at(self):
+        """Save time (epoch seconds); the file time for profiles written without one."""
+        return self.header.get("saved_at") or os.path.getmtime(self.path)
+
+    @property
+    def frames(self):
+        """(N, 21, 3) read-only memmap of every captured frame."""
+        if self._frames is None:
+            h = self.header
+            if h["shape"][0] == 0:
+                return np.empty(tuple(h["shape"]), dtype=np.dtype(h["dtype"]))
+            self._frames = np.memmap(
+                self.path, dtype=np.dtype(h["dtype"]), mode="r",
+                offset=h["data_offset"], shape=tuple(h["shape"])
+            )
+        return self._frames
+
+    def task_frames(self, task_id):
+        counts = self.header["task_counts"]
+        start = sum(counts[:task_id])
+        return self.frames[start:start + counts[task_id]]
+
+
+class CalibrationStore:
+    """
+    Directory of compact binary calibration profiles, laid out as
+    <root>/<user_id>/<gesture_name>.xlcp
+    Listing the store only touches directory entries, so startup stays
+    instant no matter how many profiles exist.
+    """
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self._cache = {}
+
+    def _path(self, user_id, gesture_name):
+        return os.path.join(self.root_dir, _safe_name(user_id), _safe_name(gesture_name) + PROFILE_EXT)
+
+    def list_profiles(self, user_id):
+        user_dir = os.path.join(self.root_dir, _safe_name(user_id))
+        if not os.path.isdir(user_dir):
+            return []
+        return sorted(f[:-len(PROFILE_EXT)] for f in os.listdir(user_dir) if f.endswith(PROFILE_EXT))
+
+    def load(self, user_id, gesture_name):
+        path = self._path(user_id, gesture_name)
+        if not os.path.exists(path):
+            return None
+        profile = self._cache.get(path)
+        if profile is None:
+            profile = CalibrationProfile(path)
+            self._cache[path] = profile
+        return profile
+
+    def save(self, user_id, gesture_name, collected_data, thresholds=None, dtype="float16"):
+        """
+        collected_data: {task_id: [[[x, y, z] * 21] per frame]}
+        Returns the saved CalibrationProfile.
+        """
+        task_ids = sorted(collected_data)
+        task_counts = [len(collected_data[t]) for t in task_ids]
+        frames = [f for t in task_ids for f in collected_data[t]]
+        data = np.asarray(frames, dtype=dtype).reshape(-1, 21, 3)
+
+        header = {
+            "version": VERSION,
+            "user_id": user_id,
+            "gesture": gesture_name,
+            "dtype": np.dtype(dtype).str,
+            "shape": list(data.shape),
+            "task_counts": task_counts,
+            "thresholds": thresholds or {},
+            "saved_at": time.time(),
+            "data_offset": 0,
+        }
+        # data_offset depends on the header length, so size it until it settles
+        raw = _encode_header(header)
+        while header["data_offset"] != 8 + len(raw):
+            header["data_offset"] = 8 + len(raw)
+            raw = _encode_header(header)
+
+        path = self._path(user_id, gesture_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("<4sI", MAGIC, len(raw)))
+            f.write(raw)
+            f.write(data.tobytes())
+        os.replace(tmp_path, path)
+
+        self._cache.pop(path, None)
+        return self.load(user_id, gesture_name)
+
+    def user_thresholds(self, user_id):
+        """
+        Merge the thresholds of every profile saved for a user, oldest first:
+        each value comes from the newest session that measured it.
+        """
+        profiles = []
+        for name in self.list_profiles(user_id):
+            profile = self.load(user_id, name)
+            try: profiles.append((profile.saved_at, profile.thresholds))
+            except (OSError, ValueError): pass
+        merged = {}
+        for _, thresholds in sorted(profiles, key=lambda p: p[0]):
+            merged.update(thresholds)
+        return merged
+
+
+def _encode_header(header):
+    raw = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    pad = (-(8 + len(raw))) % ALIGN
+    return raw + b" " * pad
+
+
+def _safe_name(name):
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in str(name)) or "default"
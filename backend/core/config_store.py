@@ -0,0 +1,156 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# --- WRITE-BEHIND CONFIG STORE ---
+# API handlers apply a change to the engine immediately and stage() the
+# document fields here. Pending writes are coalesced per (collection, key),
+# so a slider drag of 50 PATCHes becomes one $set, and flushed as one
+# bulk_write per collection every flush_interval seconds and at shutdown.
+#
+# If Mongo is unreachable the batch goes to an append-only JSON-lines
+# journal instead. The journal is replayed over the Mongo state at startup
+# and pushed to Mongo (then truncated) once it is reachable again.
+
+COMPACT_LINES = 1000  # Rewrite the journal coalesced past this many lines
+
+
+class ConfigStore:
+    def __init__(self, db, journal_path, flush_interval=1.0, retry_interval=30.0):
+        self.db = db
+        self.journal_path = journal_path
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval  # Seconds between Mongo retries while it is down
+
+        self._pending = {}  # (collection, key_field, key) -> fields
+        self._lock = threading.Lock()
+        self._task = None
+        self._mongo_down_since = None
+        self._journal_lines = None
+        self.flushes = 0
+        self.writes = 0
+
+    # ---------------- STAGING ----------------
+    def stage(self, collection, key_field, key, fields):
+        """Queue a $set of `fields` on the document {key_field: key}. Later stages win per field."""
+        with self._lock:
+            self._pending.setdefault((collection, key_field, key), {}).update(fields)
+
+    def pending(self):
+        with self._lock: return len(self._pending)
+
+    # ---------------- FLUSHING ----------------
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Stop the background task and flush everything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try: await self._task
+            except asyncio.CancelledError: pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try: await self.flush()
+            except Exception as e: logger.warning(f"Config flush failed: {e}")
+
+    async def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if self._mongo_ready() and await self._journal_has_entries():
+            # Mongo may be back: journaled writes go first, this batch on top
+            merged = await asyncio.to_thread(self._read_journal)
+            for k, fields in batch.items(): merged.setdefault(k, {}).update(fields)
+            if await self._write_mongo(merged): await asyncio.to_thread(self._truncate_journal)
+            else: await asyncio.to_thread(self._rewrite_journal, merged)
+            return
+
+        if not batch: return
+        if self._mongo_ready() and await self._write_mongo(batch): return
+        await asyncio.to_thread(self._append_journal, batch)
+
+    def _mongo_ready(self):
+        if self.db is None: return False
+        return self._mongo_down_since is None or time.monotonic() - self._mongo_down_since > self.retry_interval
+
+    async def _write_mongo(self, batch):
+        from pymongo import UpdateOne
+
+        by_collection = {}
+        for (collection, key_field, key), fields in batch.items():
+            by_collection.setdefault(collection, []).append(UpdateOne({key_field: key}, {"$set": fields}, upsert=True))
+        try:
+            for collection, ops in by_collection.items():
+                await self.db[collection].bulk_write(ops, ordered=False)
+        except Exception as e:
+            if self._mongo_down_since is None: logger.warning(f"MongoDB write failed, journaling config: {e}")
+            self._mongo_down_since = time.monotonic()
+            return False
+        self._mongo_down_since = None
+        self.flushes += 1
+        self.writes += len(batch)
+        return True
+
+    # ---------------- JOURNAL ----------------
+    def journaled(self):
+        """Coalesced journal contents: {(collection, key_field, key): fields}. Call before start()."""
+        return self._read_journal()
+
+    async def _journal_has_entries(self):
+        if self._journal_lines is None:
+            self._journal_lines = await asyncio.to_thread(self._count_journal)
+        return self._journal_lines > 0
+
+    def _count_journal(self):
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f: return sum(1 for _ in f)
+        except FileNotFoundError: return 0
+
+    def _read_journal(self):
+        state = {}
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try: entry = json.loads(line)
+                    except ValueError: continue  # Torn last line after a crash
+                    key = (entry["collection"], entry["key_field"], entry["key"])
+                    state.setdefault(key, {}).update(entry["fields"])
+        except FileNotFoundError: pass
+        return state
+
+    def _append_journal(self, batch):
+        if self._journal_lines is None: self._journal_lines = self._count_journal()
+        os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            for (collection, key_field, key), fields in batch.items():
+                f.write(json.dumps({"collection": collection, "key_field": key_field, "key": key, "fields": fields, "ts": time.time()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lines += len(batch)
+        if self._journal_lines > COMPACT_LINES:
+            self._rewrite_journal(self._read_journal())
+
+    def _rewrite_journal(self, state):
+        tmp = self.journal_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for (collection, key_field, key), fields in state.items():
+                f.write(json.dumps({"collection": collection, "key_field": key_field, "key": key, "fields": fields, "ts": time.time()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal_path)
+        self._journal_lines = len(state)
+
+    def _truncate_journal(self):
+        try: os.remove(self.journal_path)
+        except FileNotFoundError: pass
+        self._journal_lines = 0
@@ -0,0 +1,83 @@
+import threading
+import time
+
+
+class CursorOutput:
+    """
+    Moves the OS cursor at display rate, independent of camera fps.
+    The vision thread publishes (position, velocity) samples with update();
+    a worker thread extrapolates from the latest sample every tick and only
+    calls the backend when the rounded pixel position actually changes.
+    """
+
+    def __init__(self, backend, rate_hz=144, max_extrapolation=0.1, catch_up=0.35):
+        self.backend = backend
+        self.rate_hz = rate_hz
+        self.max_extrapolation = max_extrapolation  # Stop predicting past this (s) without new data
+        self.catch_up = catch_up                    # Fraction of the remaining error closed per tick
+
+        self.running = False
+        self.thread = None
+        self._sample = None            # (x, y, vx, vy, t) - replaced atomically
+        self._wake = threading.Event()
+        self.moves = 0                 # Backend calls made (for benchmarks)
+
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+        if self.thread: self.thread.join()
+        self.thread = None
+
+    def update(self, x, y, vx=0.0, vy=0.0, t=None):
+        """Publish a new target (screen pixels) and velocity (pixels/s)."""
+        self._sample = (x, y, vx, vy, time.perf_counter() if t is None else t)
+        self._wake.set()
+
+    def _run_loop(self):
+        period = 1.0 / self.rate_hz
+        out_x = out_y = None
+        last_pixel = None
+        next_tick = time.perf_counter()
+
+        while self.running:
+            sample = self._sample
+            now = time.perf_counter()
+
+            if sample is None or now - sample[4] > self.max_extrapolation:
+                # Idle: nothing new to show, sleep until the next update
+                self._wake.clear()
+                sample = self._sample  # Re-check: an update may have raced the clear
+                if sample is None or time.perf_counter() - sample[4] > self.max_extrapolation:
+                    self._wake.wait()
+                out_x = out_y = None
+                next_tick = time.perf_counter()
+                continue
+
+            x, y, vx, vy, t = sample
+            ahead = now - t
+            target_x, target_y = x + vx * ahead, y + vy * ahead
+
+            if out_x is None:
+                out_x, out_y = target_x, target_y
+            else:
+                out_x += (target_x - out_x) * self.catch_up
+                out_y += (target_y - out_y) * self.catch_up
+
+            pixel = (int(round(out_x)), int(round(out_y)))
+            if pixel != last_pixel:
+                try:
+                    self.backend.move(*pixel)
+                    self.moves += 1
+                except Exception: pass
+                last_pixel = pixel
+
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay > 0: time.sleep(delay)
+            else: next_tick = time.perf_counter()
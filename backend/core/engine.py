@@ -1,31 +1,51 @@
-import cv2
-import mediapipe as mp
 import numpy as np
 import os
 import threading
 import asyncio
-import pyautogui
 import time
-import uuid
-from datetime import datetime
 from collections import deque
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
+from dataclasses import replace
 
-# --- GESTURE MODULES ---
+# --- LIGHT GESTURE HELPERS (pure python) ---
 from gestures.circular_undo_redo import compute_circular_command
-from gestures.volume_control import VolumeControl
-from gestures.two_hand_zoom import TwoHandZoom
-from gestures.swipe_tabs import SwipeTabs
-from gestures.Pro_snap import ProSnap
-from gestures.copy_paste import CopyPaste
-from gestures.screenshot import Screenshot
-from gestures.text_joystick import compute_text_joystick
-from gestures.virtual_mouse import VirtualMouse 
-
-# --- SETUP ---
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0.01
+from gestures.text_joystick import text_joystick_deflection
+from gestures.hand_scale import palm_scale, palm_size
+
+from core.calibration_manager import CalibrationManager
+from core.calibration_store import CalibrationStore
+from core.cursor_output import CursorOutput
+from core.scroll_output import ScrollOutput
+from core.macros import MacroEngine
+from core.joystick_driver import JoystickDriver
+from core.zoom_driver import ZoomDriver
+from core.screenshot_service import ScreenshotService
+from core.landmark_classifier import LandmarkClassifier
+from core.sequence_matcher import SequenceMatcher
+from core.arbiter import GestureArbiter
+from core.hand_tracker import HandTracker
+from core.motion import MotionTrack
+from core.module_guard import ModuleGuard
+from core.settings import SettingsStore
+from core.events import EventBus
+from core.activity_store import ActivityStore
+from core.landmark_tracker import LandmarkTracker
+from core.motion_gate import MotionGate
+from core.landmarker import FIELDS as LANDMARKER_FIELDS, NULLABLE as LANDMARKER_NULLABLE, LandmarkerOptions, create_landmarker, pin_current_thread
+
+# --- HEAVY DEPENDENCIES (deferred) ---
+# cv2, mediapipe, pyautogui, the model and the OS backends load on first
+# start() or warm_up(), so importing the server (API-only workers, tests)
+# never pays for them.
+cv2 = mp = pyautogui = None
+
+def _import_vision():
+    global cv2, mp, pyautogui
+    import cv2
+    import mediapipe as mp
+    import pyautogui
+
+    pyautogui.FAILSAFE = False
+    pyautogui.PAUSE = 0.01
 
 class GestureEngine:
     def __init__(self):
@@ -35,32 +55,45 @@ class GestureEngine:
         self.current_frame = None
         self.processing_thread = None
         
-        self.activity_log = deque(maxlen=20)
+        self.activity_log = deque(maxlen=20)  # (ts, gesture, action), newest first
         self.total_gesture_count = 0 
+        self.events = EventBus()  # Pushed to dashboards over /ws/events
+        self.last_mode = "idle"
         self.custom_actions = {} 
         self.os_type = "windows"  # Default to Windows 
         
-        # Load Model
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        model_path = os.path.join(base_path, 'hand_landmarker.task')
-        base_options = python.BaseOptions(model_asset_path=model_path)
-        options = vision.HandLandmarkerOptions(
-            base_options=base_options, num_hands=2,
-            min_hand_detection_confidence=0.7, min_hand_presence_confidence=0.7, min_tracking_confidence=0.7
-        )
-        self.detector = vision.HandLandmarker.create_from_options(options)
-
-        # Initialize Modules
-        self.copy_paste = CopyPaste()
-        self.screenshot = Screenshot()
-        self.pro_snap = ProSnap()
-        self.volume_control = VolumeControl()
-        self.two_hand_zoom = TwoHandZoom()
-        self.swipe_tabs = SwipeTabs()
-        self.virtual_mouse = VirtualMouse() 
-
-        # Config
-        self.gesture_settings = {
+        # Model + gesture modules + OS backends: built by _build_runtime()
+        base_path = self.base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.landmarker_options = LandmarkerOptions(os.path.join(base_path, 'hand_landmarker.task'))
+        self.detector = None
+        self._detector_key = None  # (options, num_hands) the detector was built with
+        self._failed_key = None
+        self._runtime_lock = threading.Lock()
+        self._lifecycle_lock = threading.Lock()  # Serializes start() / stop(): one vision loop, one capture
+        self.landmark_tracker = LandmarkTracker()  # Keyframe detection + optical flow (off until configured)
+        self.motion_gate = MotionGate()  # Reuse the last detection while the hand is still (off until configured)
+
+        # Durable activity history (SQLite, background writer); seeds the recent log
+        self.activity_store = ActivityStore(os.path.join(base_path, 'activity.db'))
+        try: self.activity_log.extend(self.activity_store.recent(self.activity_log.maxlen))
+        except Exception as e: print(f"Activity History Load Error: {e}")
+
+        # Calibration Profiles (read lazily, applied on start)
+        self.user_id = "default"
+        self.calibration_store = CalibrationStore(os.path.join(base_path, 'calibration_profiles'))
+        self.calibration = None  # Active CalibrationManager session, fed by the vision loop
+        self.calibration_user = None
+
+        # Custom actions: specs kept so they can be compiled for the real backend
+        self.custom_action_specs = {}
+        self._macro_check = MacroEngine(None)  # Validates specs before the runtime exists
+        self.text_direction = None
+
+        # Screenshots: grab/encode in a worker pool, write-behind to disk
+        self.screenshots = ScreenshotService(os.path.join(os.path.expanduser("~"), "Pictures", "Screenshots"))
+
+        # Config (immutable snapshots; see core.settings)
+        self.settings = SettingsStore({
             "volume": {"name": "Volume Control", "enabled": True, "sensitivity": 0.7, "cooldown": 0.1, "trigger": "volume_control"},
             "zoom": {"name": "Two-Hand Zoom", "enabled": True, "sensitivity": 0.7, "cooldown": 0.2, "trigger": "zoom_control"},
             "swipe": {"name": "Swipe Tabs", "enabled": True, "sensitivity": 0.7, "cooldown": 0.8, "trigger": "switch_tabs"},
@@ -71,19 +104,217 @@ class GestureEngine:
             "text_mode": {"name": "Text Joystick", "enabled": True, "sensitivity": 0.7, "cooldown": 0.15, "trigger": "arrow_keys"},
             "circular": {"name": "Undo/Redo Menu", "enabled": True, "sensitivity": 0.7, "cooldown": 1.0, "trigger": "undo_redo"},
             "mouse_beta": {"name": "Virtual Mouse (Beta)", "enabled": False, "trigger": "virtual_mouse_beta"}
-        }
-
-        self.position_buffer = deque(maxlen=20)
-        self.alpha = 0.7
+        })
+
+        self.hand_tracker = HandTracker()  # Stable hand identities; per-hand state lives on the tracks
+        self.palm_track = MotionTrack()  # Timestamped palm path of the current right hand (its HandState.track)
+        self.left_hand_id = None
+        self.zoom_hand_ids = None  # Pair the zoom anchors belong to (kept through a brief dropout)
+        self.sequence_matcher = SequenceMatcher()  # Motion templates over the palm path
+        self.arbiter = GestureArbiter()
+        self.swipe_rearm_until = 0.0  # Capture time before which swipe may not fire again
+        # Gesture modules run through the guard: timed, throttled over budget, disabled after repeated errors
+        self.module_guard = ModuleGuard(on_state=lambda name, state: self.events.publish("module", name=name, state=state))
+
+        # Latency: capture -> landmarks, smoothed. Fed to the cursor filter as look-ahead
+        # only when cursor_lead is on: in benchmarks.filter_benchmark it removes the
+        # One Euro lag (33 ms) but raises still-hand jitter from 1.7 to 2.8 px.
+        self.frame_time = None
+        self.pipeline_delay = 0.0
+        self.cursor_lead = False
         self.prev_volume = 0
         self.prev_zoom = 100
-        self.last_triggered = {key: 0 for key in self.gesture_settings}
-
-    def register_custom_action(self, action_id, keys):
-        self.custom_actions[action_id] = keys
+        self.last_triggered = {key: 0 for key in self.settings.gestures}
+
+        # Custom Gesture Classifier (trained by core.training, hot-swapped)
+        self.model_path = os.path.join(base_path, 'models', 'custom_classifier.npz')
+        self.classifier = None
+        if os.path.exists(self.model_path):
+            try: self.set_classifier(LandmarkClassifier.load(self.model_path))
+            except Exception as e: print(f"Custom Classifier Load Error: {e}")
+
+    def set_classifier(self, classifier):
+        """
+        Hot-swap the custom gesture classifier. Each class becomes a
+        "custom_<label>" gesture, registered disabled: it fires only once the
+        user enables it and maps its trigger. The vision thread picks the new
+        model up on its next frame.
+        """
+        for label in classifier.classes:
+            self.settings.add(f"custom_{label}", name=label, trigger=label, enabled=False)  # Off until the user maps it
+        self.classifier = classifier
+
+    def register_motion_template(self, name, points, threshold=4.0):
+        """Add a motion gesture ("motion_<name>") matched against the right palm path. Raises ValueError if invalid."""
+        self.sequence_matcher.add_template(name, points, threshold)
+        self.settings.add(f"motion_{name}", name=name, trigger=name)
+
+    def register_custom_action(self, action_id, keys, macro=None):
+        """Compile a custom action (a key chord or a full macro spec). Raises ValueError if invalid."""
+        spec = macro or keys
+        with self._runtime_lock:
+            if self.detector is None:
+                self._macro_check.compile(spec)  # Compiled for the backend in _build_runtime()
+            else:
+                self.custom_actions[action_id] = self.macros.compile(spec)
+            self.custom_action_specs[action_id] = spec
+
+    @property
+    def ready(self):
+        return self.detector is not None
+
+    def warm_up(self):
+        """Build the runtime ahead of the first start (e.g. in a background task)."""
+        self._build_runtime()
+
+    def _build_runtime(self):
+        with self._runtime_lock:
+            if self.detector is not None: return
+            _import_vision()
+            from gestures.volume_control import VolumeControl
+            from gestures.two_hand_zoom import TwoHandZoom
+            from gestures.swipe_tabs import SwipeTabs
+            from gestures.Pro_snap import ProSnap
+            from gestures.copy_paste import CopyPaste
+            from gestures.screenshot import Screenshot
+            from gestures.virtual_mouse import VirtualMouse
+            from core.input_backend import get_input_backend
+
+            # Load Model (warmed up on synthetic frames, see core.landmarker)
+            key = self._landmarker_key()
+            detector = create_landmarker(*key)
+
+            # Initialize Modules
+            self.copy_paste = CopyPaste()
+            self.screenshot = Screenshot()
+            self.pro_snap = ProSnap()
+            self.volume_control = VolumeControl()
+            self.two_hand_zoom = TwoHandZoom()
+            self.swipe_tabs = SwipeTabs()
+            self.virtual_mouse = VirtualMouse() 
+
+            # Display-rate cursor output (decoupled from camera fps)
+            self.input_backend = get_input_backend()
+            self.cursor_output = CursorOutput(self.input_backend)
+            self.virtual_mouse.cursor_output = self.cursor_output
+            self.scroll_output = ScrollOutput(self.input_backend)  # Inertial wheel output (own thread)
+            self.virtual_mouse.scroll_output = self.scroll_output
+
+            # Key injection: compiled macros run on their own worker thread
+            self.macros = MacroEngine(self.input_backend)
+            self.joystick = JoystickDriver(self.macros)  # Text joystick key repeat (own timer thread)
+            self.zoom_driver = ZoomDriver(self.macros, self.input_backend)  # Zoom steps toward the pinch level (own thread)
+            for action_id, spec in self.custom_action_specs.items():
+                try: self.custom_actions[action_id] = self.macros.compile(spec)
+                except ValueError as e: print(f"Custom Action {action_id} Error: {e}")
+
+            self._detector_key = key
+            self.detector = detector  # Last: marks the runtime ready
+
+    # ---------------- LANDMARKER OPTIONS ----------------
+    def landmarker_num_hands(self, options=None):
+        options = options or self.landmarker_options
+        if options.num_hands is not None: return options.num_hands
+        return 2 if self.settings.gestures["zoom"].enabled else 1  # Only two-hand zoom needs a second hand
+
+    def _landmarker_key(self):
+        options = self.landmarker_options
+        return options, self.landmarker_num_hands(options)
+
+    def configure_landmarker(self, **changes):
+        """
+        Apply landmarker options (fields of core.landmarker.LandmarkerOptions).
+        Raises ValueError if invalid. A running engine rebuilds its detector
+        on the vision thread before the next frame; otherwise on start().
+        """
+        changes = {k: v for k, v in changes.items() if k in LANDMARKER_FIELDS and (v is not None or k in LANDMARKER_NULLABLE)}
+        if "model_path" in changes:
+            path = os.path.join(self.base_path, changes["model_path"])  # Relative to backend/
+            if not os.path.isfile(path): raise ValueError(f"Model not found: {path}")
+            changes["model_path"] = path
+        try: self.landmarker_options = replace(self.landmarker_options, **changes)
+        except TypeError as e: raise ValueError(str(e))
+        return self.landmarker_options
+
+    def landmarker_config(self):
+        key = self._detector_key
+        return {**self.landmarker_options.to_dict(), "active_num_hands": key[1] if key else None,
+                "applied": key == self._landmarker_key()}
+
+    def _refresh_detector(self):
+        """Rebuild the landmarker if its options (or, for automatic num_hands, the zoom toggle) changed."""
+        key = self._landmarker_key()
+        if key == self._detector_key: return
+        old, self.detector = self.detector, create_landmarker(*key)
+        self._detector_key, self._failed_key = key, None
+        old.close()
+
+    def apply_calibration(self):
+        """Push the active user's calibrated thresholds ("module.attribute": value) into the gesture modules."""
+        try: thresholds = self.calibration_store.user_thresholds(self.user_id)
+        except OSError: return
+        for name, value in thresholds.items():
+            module_name, _, attr = name.partition(".")
+            module = getattr(self, module_name, None)
+            if module is not None and hasattr(module, attr): setattr(module, attr, value)
+
+    # ---------------- CALIBRATION ----------------
+    def start_calibration(self, gesture_name, user_id="default"):
+        """
+        Begin a calibration session for one gesture (replacing any active one).
+        While it runs, the vision loop feeds it the first tracked hand and no
+        gesture actions fire.
+        """
+        session = CalibrationManager(self.calibration_store)
+        session.start_session(gesture_name)
+        self.calibration_user = user_id
+        self.calibration = session
+        return session.get_ui_state()
+
+    def calibration_state(self):
+        session = self.calibration
+        return None if session is None else session.get_ui_state()
+
+    def next_calibration_task(self):
+        """Move on once the current task is done. Raises ValueError otherwise, LookupError without a session."""
+        session = self._calibration_session()
+        if session.status != "success": raise ValueError("Current calibration task is not finished")
+        if not session.next_task(): raise ValueError("No calibration tasks left; save the session")
+        return session.get_ui_state()
+
+    def save_calibration(self):
+        """
+        Save the finished session as a profile (training samples + thresholds),
+        apply the user's thresholds and end the session. Raises ValueError if
+        the session is not finished, LookupError without a session.
+        """
+        session = self._calibration_session()
+        if not session.complete: raise ValueError("Calibration is not finished")
+        profile = session.save_profile(self.calibration_user)
+        self.calibration = None
+        if self.calibration_user == self.user_id: self.apply_calibration()
+        return profile
+
+    def cancel_calibration(self):
+        self.calibration = None
+
+    def _calibration_session(self):
+        session = self.calibration
+        if session is None: raise LookupError("No calibration session")
+        return session
 
     def start(self):
-        if self.running: return
+        with self._lifecycle_lock:  # Concurrent starts: the second sees running and returns
+            if self.running: return
+            self._start()
+
+    def _start(self):
+        self._build_runtime()
+        with self._runtime_lock: self._refresh_detector()  # Options changed since warm-up
+        self.landmark_tracker.reset()
+        self.motion_gate.reset()
+        self.hand_tracker.reset()
+        self.apply_calibration()
         self.cap = cv2.VideoCapture(0)
         
         # Performance Optimizations
@@ -92,20 +323,51 @@ class GestureEngine:
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         
         self.running = True
+        self.cursor_output.start()
+        self.scroll_output.start()
+        self.macros.start()
+        self.joystick.start()
+        self.zoom_driver.reset()
+        self.zoom_driver.start()
+        self.screenshots.start()
+        self.volume_control.start()
         self.processing_thread = threading.Thread(target=self._run_loop, daemon=True)
         self.processing_thread.start()
+        self.events.publish("engine", running=True)
 
     def stop(self):
-        self.running = False
+        with self._lifecycle_lock: self._stop()
+
+    def _stop(self):
+        was_running, self.running = self.running, False
+        if self.detector is None: return  # Never started: nothing was built
         if self.processing_thread: self.processing_thread.join()
+        self.cursor_output.stop()
+        self.scroll_output.stop()
+        self.joystick.stop()
+        self.zoom_driver.stop()
+        self.macros.stop()
+        self.screenshots.stop()
+        self.volume_control.close()
         if self.cap: self.cap.release()
+        if was_running: self.events.publish("engine", running=False)
 
     def _run_loop(self):
+        pin_current_thread(self.landmarker_options.cpu_affinity)
         while self.running and self.cap.isOpened():
+            key = self._landmarker_key()
+            if key != self._detector_key and key != self._failed_key:
+                try:
+                    with self._runtime_lock: self._refresh_detector()
+                    pin_current_thread(self._detector_key[0].cpu_affinity)
+                except Exception as e:
+                    self._failed_key = key  # Keep the old detector; retried when the options change again
+                    print(f"Landmarker Rebuild Error: {e}")
             success, frame = self.cap.read()
             if not success:
                 time.sleep(0.1)
                 continue
+            self.frame_time = time.perf_counter()
             try:
                 processed_frame = self._process_frame(frame)
                 ret, buffer = cv2.imencode('.jpg', processed_frame, [int(cv2.IMWRITE_JPEG_QUALITY), 50])
@@ -120,69 +382,75 @@ class GestureEngine:
             if frame: yield frame
             await asyncio.sleep(0.033)
 
-    def update_gesture_config(self, gesture_id, config):
-        if gesture_id in self.gesture_settings:
-            for key, value in config.items():
-                if key in self.gesture_settings[gesture_id]:
-                    self.gesture_settings[gesture_id][key] = value
-            return True
-        return False
+    @property
+    def gesture_settings(self):
+        """Current settings (read-only mapping of gesture_id -> GestureConfig)."""
+        return self.settings.gestures
 
-    def _check_cooldown(self, gesture_id):
+    def update_gesture_config(self, gesture_id, config):
+        """Publish a new settings version; the vision thread sees it on its next frame."""
+        version = self.settings.current.version
+        if not self.settings.update(gesture_id, config): return False
+        if self.settings.current.version != version:
+            self.events.publish("config", gesture_id=gesture_id, version=self.settings.current.version)
+        return True
+
+    def _check_cooldown(self, gesture_id, cooldown):
         now = time.time()
         last = self.last_triggered.get(gesture_id, 0)
-        cooldown = self.gesture_settings[gesture_id]["cooldown"]
         if now - last > cooldown:
             self.last_triggered[gesture_id] = now
             return True
         return False
 
     def _log_activity(self, gesture_name, action_id):
+        # Hot path: a tuple and two enqueues; formatting happens when the log is read
         self.total_gesture_count += 1
-        entry = {"id": str(uuid.uuid4()), "gesture": gesture_name, "action": action_id, "time": datetime.now().isoformat()}
-        self.activity_log.appendleft(entry)
+        record = (time.time(), gesture_name, action_id)
+        self.activity_log.appendleft(record)
+        self.activity_store.record(*record)
+        self.events.publish("activity", ts=record[0], gesture=gesture_name, action=action_id, count=self.total_gesture_count)
 
     def trigger_action(self, gesture_id, sub_action=None):
-        if not self.gesture_settings[gesture_id]["enabled"]: return
-        target_action = self.gesture_settings[gesture_id]["trigger"]
-        gesture_name = self.gesture_settings[gesture_id]["name"]
+        """True if an action actually fired (enabled, mapped and off cooldown)."""
+        config = self.settings.gestures[gesture_id]  # One snapshot for the whole action
+        if not config.enabled: return False
+        target_action = config.trigger
+        gesture_name = config.name
         
         # 1. Custom Actions
-        if target_action in self.custom_actions and self._check_cooldown(gesture_id):
+        if target_action in self.custom_actions and self._check_cooldown(gesture_id, config.cooldown):
             try:
-                keys = self.custom_actions[target_action]
-                pyautogui.hotkey(*keys)
+                self.macros.run(self.custom_actions[target_action])
                 self._log_activity(gesture_name, f"Custom: {target_action}")
-                return 
+                return True
             except Exception: pass
 
         # Determine Modifier Keys
         ctrl_key = 'command' if self.os_type == 'mac' else 'ctrl'
         win_key = 'command' if self.os_type == 'mac' else 'win'
         
-        # Dynamic Mapping
+        # Dynamic Mapping (compiled chords are cached by MacroEngine)
         # Note: 'switch_tabs' now handles both Apps (Virtual Desktops) and Tabs
-        # Dynamic Mapping
-        # Dynamic Mapping
-        # Dynamic Mapping
+        hotkey = self.macros.press_hotkey
         mapping = {
-            "save_file": lambda: pyautogui.hotkey(ctrl_key, 's', interval=0.05),
-            "copy": lambda: pyautogui.hotkey(ctrl_key, 'c', interval=0.05),
-            "paste": lambda: pyautogui.hotkey(ctrl_key, 'v', interval=0.05),
-            "show_desktop": lambda: pyautogui.hotkey(win_key, 'd', interval=0.05), 
-            "volume_control": lambda: pyautogui.press(sub_action),
-            "zoom_control": lambda: pyautogui.hotkey(ctrl_key, sub_action, interval=0.05),
+            "save_file": lambda: hotkey(ctrl_key, 's'),
+            "copy": lambda: hotkey(ctrl_key, 'c'),
+            "paste": lambda: hotkey(ctrl_key, 'v'),
+            "show_desktop": lambda: hotkey(win_key, 'd'), 
+            "volume_control": lambda: hotkey(sub_action),
+            "zoom_control": lambda: hotkey(ctrl_key, sub_action),
             "arrow_keys": lambda: self._execute_joystick(sub_action),
             "screenshot": lambda: self.take_screenshot(),
-            "undo_redo": lambda: pyautogui.hotkey(ctrl_key, sub_action, interval=0.05),
+            "undo_redo": lambda: hotkey(ctrl_key, sub_action),
             
             # --- Browser Tabs ---
-            "switch_tabs_next_tab": lambda: pyautogui.hotkey('ctrl', 'tab', interval=0.05) if self.os_type == 'windows' else pyautogui.hotkey('command', 'shift', ']', interval=0.05),
-            "switch_tabs_prev_tab": lambda: pyautogui.hotkey('ctrl', 'shift', 'tab', interval=0.05) if self.os_type == 'windows' else pyautogui.hotkey('command', 'shift', '[', interval=0.05),
+            "switch_tabs_next_tab": lambda: hotkey('ctrl', 'tab') if self.os_type == 'windows' else hotkey('command', 'shift', ']'),
+            "switch_tabs_prev_tab": lambda: hotkey('ctrl', 'shift', 'tab') if self.os_type == 'windows' else hotkey('command', 'shift', '['),
             
             # --- Switch Apps in SAME Desktop (Alt+Tab / Cmd+Tab) ---
-            "switch_tabs_next_app": lambda: pyautogui.hotkey('alt', 'tab', interval=0.05) if self.os_type == 'windows' else pyautogui.hotkey('command', 'tab', interval=0.05),
-            "switch_tabs_prev_app": lambda: pyautogui.hotkey('alt', 'shift', 'tab', interval=0.05) if self.os_type == 'windows' else pyautogui.hotkey('command', 'shift', 'tab', interval=0.05),
+            "switch_tabs_next_app": lambda: hotkey('alt', 'tab') if self.os_type == 'windows' else hotkey('command', 'tab'),
+            "switch_tabs_prev_app": lambda: hotkey('alt', 'shift', 'tab') if self.os_type == 'windows' else hotkey('command', 'shift', 'tab'),
         }   
 
         # Resolve Lookup Key
@@ -193,30 +461,25 @@ class GestureEngine:
             # Fallback for simple subactions like 'z' or 'y'
             pass 
 
-        if lookup_key in mapping and self._check_cooldown(gesture_id):
+        if lookup_key in mapping and self._check_cooldown(gesture_id, config.cooldown):
             try:
                 mapping[lookup_key]()
                 self._log_activity(gesture_name, lookup_key)
+                return True
             except Exception: pass
         elif sub_action and target_action == "switch_tabs": 
             # Fallback if mapping lookup failed but we have sub_action
             # This handles cases where sub_action isn't pre-mapped
             pass
+        return False
 
     def _execute_joystick(self, direction):
         if direction and direction != "NONE":
-            pyautogui.keyDown('shift')
-            pyautogui.press(direction.lower())
-            pyautogui.keyUp('shift')
+            self.macros.press_hotkey('shift', direction.lower())
 
     def take_screenshot(self):
-        try:
-            save_dir = os.path.join(os.path.expanduser("~"), "Pictures", "Screenshots")
-            if not os.path.exists(save_dir): os.makedirs(save_dir)
-            path = os.path.join(save_dir, f"GestureOS_{int(time.time())}.png")
-            pyautogui.screenshot(path)
-            return True
-        except: return False
+        """Queue a capture; grab, encode and write happen off the vision thread."""
+        return self.screenshots.capture()
 
     def _draw_hand(self, image, landmarks):
         h, w, _ = image.shape
@@ -235,54 +498,108 @@ class GestureEngine:
         for tip, pip in [(8,6), (12,10), (16,14), (20,18)]: fingers.append(1 if landmarks[tip].y < landmarks[pip].y else 0)
         return fingers
 
+    def _detect(self, frame, gray):
+        gate = self.motion_gate
+        if gray is not None and gate.reuse(gray): return gate.result  # Static hand: nothing new to see
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        result = self.detector.detect(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb))
+        gate.update(gray, result)
+        return result
+
     def _process_frame(self, frame):
         frame = cv2.flip(frame, 1)  
         h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-        result = self.detector.detect(mp_image)
+        tracker = self.landmark_tracker
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if tracker.enabled or self.motion_gate.enabled else None
+        result = tracker.track(gray, lambda: self._detect(frame, gray))  # Landmarker on keyframes only
+        if self.frame_time is not None:
+            self.pipeline_delay = 0.9 * self.pipeline_delay + 0.1 * (time.perf_counter() - self.frame_time)
+            self.virtual_mouse.cursor_filter.lead = self.pipeline_delay if self.cursor_lead else 0.0
         
-        hands_data = []
-        handedness_list = []
+        # Identity across frames: labels are hysteresis-smoothed per tracked hand
+        labels = ["Right" if h[0].category_name == "Left" else "Left" for h in result.handedness] if result.hand_landmarks else []
+        hands = self.hand_tracker.update(result.hand_landmarks or [], labels)
 
-        if result.hand_landmarks:
-            for idx, lm_list in enumerate(result.hand_landmarks):
-                self._draw_hand(frame, lm_list)
-                raw_label = result.handedness[idx][0].category_name
-                handedness = "Right" if raw_label == "Left" else "Left"
-                handedness_list.append(handedness)
+        class LandmarkWrapper:
+            def __init__(self, l): self.landmark = l
 
-                class LandmarkWrapper:
-                    def __init__(self, l): self.landmark = l
-                
-                fingers = self._get_finger_states(lm_list, handedness)
-                hands_data.append((LandmarkWrapper(lm_list), fingers))
+        hands_data = []
+        for hand in hands:
+            self._draw_hand(frame, hand.landmarks)
+            fingers = self._get_finger_states(hand.landmarks, hand.label)
+            hands_data.append((LandmarkWrapper(hand.landmarks), fingers))
+
+        # Calibration: the first tracked hand's frames are the session's samples; nothing fires meanwhile
+        calibration = self.calibration  # Single reference load: the API may end the session
+        if calibration is not None:
+            if hands: calibration.process_landmarks(hands[0].landmarks)
+            self.joystick.release()
+            return frame
 
         # Split Hands
-        left_hand_data = [hd for i, hd in enumerate(hands_data) if handedness_list[i] == "Left"]
-        right_hand_data = [hd for i, hd in enumerate(hands_data) if handedness_list[i] == "Right"]
+        right_hands = [hand for hand in hands if hand.label == "Right"]
+        left_hand_data = [hd for hand, hd in zip(hands, hands_data) if hand.label == "Left"]
+        right_hand_data = [hd for hand, hd in zip(hands, hands_data) if hand.label == "Right"]
+
+        self._assign_hands(hands)
+
+        # --- ARBITRATION: pick one mode, lock out incompatible gestures ---
+        gestures = self.settings.gestures  # Single reference load: consistent for the whole frame
+        mode = self.arbiter.propose(self._mode_candidates(gestures, hands_data, left_hand_data, right_hand_data))
+        arbiter = self.arbiter
+        if mode != self.last_mode:
+            self.last_mode = mode
+            self.events.publish("mode", mode=mode)
+        if mode != "text":
+            self.joystick.release()
+            self.text_direction = None
+
+        # Custom Gestures (single reference load: safe against a concurrent swap)
+        classifier = self.classifier
+        if classifier is not None and hands:
+            for label, _ in classifier.classify_hands([hand.landmarks for hand in hands]):  # Track order: stable rows
+                if label is not None and arbiter.allows(f"custom_{label}"):
+                    if self.trigger_action(f"custom_{label}"): arbiter.claim(f"custom_{label}")
 
         # Track Right Hand Position Buffer
         if right_hand_data:
             lm_list = right_hand_data[0][0].landmark
+            state = right_hands[0].state
+            self.palm_track = state.track
             palm_ids = [0,5,9,13,17]
             raw_cx = int(np.mean([lm_list[i].x for i in palm_ids]) * w)
             raw_cy = int(np.mean([lm_list[i].y for i in palm_ids]) * h)
-            if self.position_buffer:
-                prev_x, prev_y = self.position_buffer[-1]
-                cx = int(self.alpha * prev_x + (1-self.alpha) * raw_cx)
-                cy = int(self.alpha * prev_y + (1-self.alpha) * raw_cy)
-            else: 
-                cx, cy = raw_cx, raw_cy
-            self.position_buffer.append((cx,cy))
+            if not self.palm_track: state.palm_filter.reset()
+            cx, cy = state.palm_filter((raw_cx, raw_cy), self.frame_time)
+            self.palm_track.push(self.frame_time, cx / w, cy / h)  # Normalized, stamped with the capture time
+
+            # Motion templates see the palm path in palm units (distance-invariant)
+            palm = max(palm_size(lm_list), 1e-3)
+            self.sequence_matcher.push((raw_cx / w / palm, raw_cy / h / palm))
+            if mode == "idle":
+                motion = self.sequence_matcher.match()
+                if motion and arbiter.allows(f"motion_{motion}"):
+                    if self.trigger_action(f"motion_{motion}"): arbiter.claim(f"motion_{motion}")
         else:
-            self.position_buffer.clear()
+            if self.palm_track: self.palm_track = MotionTrack()  # The hand's own path stays with its track
+            self.sequence_matcher.reset()
 
         # --- 1. TWO HANDS: ZOOM ---
-        if len(hands_data) == 2 and self.gesture_settings["zoom"]["enabled"]:
-            self.position_buffer.clear()
-            frame, zoom_val = self.two_hand_zoom.process(frame, hands_data, w, h)
-            if abs(zoom_val - self.prev_zoom) > 2:
+        guard = self.module_guard  # Skipped / failed module calls return None: no gesture this frame
+        if arbiter.allows("zoom") and len(hands_data) == 2:
+            self.palm_track.clear()
+            out = guard.call("zoom", self.two_hand_zoom.process, frame, hands_data, w, h)
+            if out is None: return frame
+            frame, zoom_val = out
+            zoom = gestures["zoom"]
+            if zoom.enabled and zoom.trigger == "zoom_control":
+                # Steps go out on the driver thread at a rate proportional to the remaining error
+                self.zoom_driver.modifier = 'command' if self.os_type == 'mac' else 'ctrl'
+                self.zoom_driver.update(self.two_hand_zoom.current_zoom)
+                if abs(zoom_val - self.prev_zoom) > 2 and self._check_cooldown("zoom", zoom.cooldown):
+                    self._log_activity(zoom.name, "zoom_in" if zoom_val > self.prev_zoom else "zoom_out")
+                    self.prev_zoom = zoom_val
+            elif abs(zoom_val - self.prev_zoom) > 2:
                 sub = '+' if zoom_val > self.prev_zoom else '-'
                 self.trigger_action("zoom", sub)
                 self.prev_zoom = zoom_val
@@ -292,17 +609,18 @@ class GestureEngine:
         if left_hand_data:
             hand_wrapper, fingers = left_hand_data[0]
             
-            if self.gesture_settings["volume"]["enabled"]:
-                frame, vol_percent = self.volume_control.process(frame, hand_wrapper, fingers, w, h)
+            if gestures["volume"].enabled and arbiter.allows("volume"):
+                frame, vol_percent = guard.call("volume", self.volume_control.process, frame, hand_wrapper, fingers, w, h) or (frame, self.prev_volume)
                 if self.volume_control.volume_mode and abs(vol_percent - self.prev_volume) > 5:
                     self.prev_volume = vol_percent
                     if self.total_gesture_count % 10 == 0: 
                         self._log_activity("Volume Control", f"Set to {vol_percent}%")
                         
-            if self.gesture_settings["snap"]["enabled"]:
-                frame, snap_action = self.pro_snap.process(frame, left_hand_data)
-                if snap_action == "RUN_CODE": 
-                    self.trigger_action("snap")
+            if gestures["snap"].enabled and arbiter.allows("snap"):
+                frame, snap_action = guard.call("snap", self.pro_snap.process, frame, left_hand_data) or (frame, None)
+                if snap_action == "RUN_CODE" and self.trigger_action("snap"): arbiter.claim("snap")
+        elif self.volume_control.volume_mode:
+            self.volume_control.volume_mode = False  # Hand gone: leave pinch mode
 
         # --- 3. RIGHT HAND (Mouse OR Normal Gestures) ---
         if right_hand_data:
@@ -310,77 +628,109 @@ class GestureEngine:
             lm_list = hand_wrapper.landmark
             
             # A: VIRTUAL MOUSE
-            if self.gesture_settings["mouse_beta"]["enabled"]:
-                frame, mouse_action = self.virtual_mouse.process(frame, lm_list, "Right", w, h)
-            
+            if gestures["mouse_beta"].enabled:
+                if arbiter.allows("mouse_beta"):
+                    frame, mouse_action = guard.call("mouse_beta", self.virtual_mouse.process, frame, lm_list, "Right", w, h) or (frame, None)
+
             # B: STANDARD GESTURES
             else:
                 thumb, index, middle, ring, pinky = fingers
                 
                 # STRICT POSES:
                 is_open_palm = index and middle and ring and pinky
-                is_index_only = index and not middle and not ring and not pinky
-                is_peace_sign = index and middle and not ring and not pinky
 
-                # 1. Swipe Tabs / Apps
-                if self.gesture_settings["swipe"]["enabled"] and is_open_palm and len(self.position_buffer) >= 5:
+                # 1. Swipe Tabs / Apps (palm speed over the last 150 ms; re-armed 170 ms after a swipe)
+                if gestures["swipe"].enabled and arbiter.allows("swipe") and is_open_palm and self.palm_track.span(0.15) >= 0.09 and self.frame_time >= self.swipe_rearm_until:
                     
-                    vx = self.position_buffer[-1][0] - self.position_buffer[-5][0]
+                    vx = self.palm_track.velocity(0.15)[0]  # Frame widths/s
                     
-                    # Threshold to ignore micro-jitters
-                    if abs(vx) > 30:
-                        frame, swipe_action = self.swipe_tabs.process(frame, right_hand_data, vx)
+                    # Threshold to ignore micro-jitters (scaled to the on-screen hand size)
+                    if abs(vx) > 0.35 * palm_scale(lm_list):
+                        frame, swipe_action = guard.call("swipe", self.swipe_tabs.process, frame, right_hand_data, vx) or (frame, None)
                         
-                        if swipe_action == "NEXT_TAB": 
-                            self.trigger_action("swipe", "next_tab")
-                            self.position_buffer.clear() 
-                        elif swipe_action == "PREV_TAB": 
-                            self.trigger_action("swipe", "prev_tab")
-                            self.position_buffer.clear()
-                        elif swipe_action == "NEXT_APP": 
-                            self.trigger_action("swipe", "next_app")
-                            self.position_buffer.clear()
-                        elif swipe_action == "PREV_APP": 
-                            self.trigger_action("swipe", "prev_app")
-                            self.position_buffer.clear()
+                        sub = {"NEXT_TAB": "next_tab", "PREV_TAB": "prev_tab", "NEXT_APP": "next_app", "PREV_APP": "prev_app"}.get(swipe_action)
+                        if sub:
+                            if self.trigger_action("swipe", sub): arbiter.claim("swipe")
+                            self.swipe_rearm_until = self.frame_time + 0.17
                     
-                # 2. Circular Undo/Redo
-                if self.gesture_settings["circular"]["enabled"] and is_index_only:
-                    if self.position_buffer:
-                        cx, cy = self.position_buffer[-1]
+                # 2. Circular Undo/Redo (drawing_circle mode: index only)
+                if gestures["circular"].enabled and arbiter.allows("circular"):
+                    if self.palm_track:
+                        cx, cy = self.palm_track.last()
+                        cx, cy = int(cx * w), int(cy * h)
                         idx_tip = lm_list[8]
                         hx, hy = int(idx_tip.x * w), int(idx_tip.y * h)
                         
-                        circ_action = compute_circular_command(hx, hy, (cx, cy))
-                        if circ_action == "UNDO": self.trigger_action("circular", "z")
-                        elif circ_action == "REDO": self.trigger_action("circular", "y")
+                        circ_action = guard.call("circular", compute_circular_command, hx, hy, (cx, cy))
+                        key = {"UNDO": "z", "REDO": "y"}.get(circ_action)
+                        if key and self.trigger_action("circular", key): arbiter.claim("circular")
                             
-                # 3. Text Joystick
-                if self.gesture_settings["text_mode"]["enabled"] and is_peace_sign:
-                    if self.position_buffer:
-                        cx, cy = self.position_buffer[-1]
+                # 3. Text Joystick (text mode: peace sign, thumb tucked)
+                if gestures["text_mode"].enabled and arbiter.allows("text_mode"):
+                    if self.palm_track:
+                        cx, cy = self.palm_track.last()
+                        cx, cy = int(cx * w), int(cy * h)
                         idx_tip = lm_list[8]
                         hx, hy = int(idx_tip.x * w), int(idx_tip.y * h)
-                        try:
-                            text_action = compute_text_joystick(hx, hy, (cx, cy))
-                            if text_action and text_action != "NONE": 
-                                self.trigger_action("text_mode", text_action)
-                        except: pass
+                        stick = guard.call("text_mode", text_joystick_deflection, hx, hy, (cx, cy))
+                        if stick is not None:  # Throttled / tripped: the stick stays where it is
+                            direction, deflection = stick
+                            if gestures["text_mode"].trigger == "arrow_keys":
+                                # Key repeat runs on the driver thread; just publish the stick
+                                self.joystick.update(direction, deflection)
+                                if direction and direction != self.text_direction:
+                                    self._log_activity(gestures["text_mode"].name, f"arrow_keys_{direction.lower()}")
+                                self.text_direction = direction
+                            elif direction:
+                                self.trigger_action("text_mode", direction)
 
                 # 4. Copy / Paste
-                if self.gesture_settings["copy"]["enabled"] or self.gesture_settings["paste"]["enabled"]:
-                    try:
-                        frame, cp_action = self.copy_paste.process(frame, right_hand_data)
-                        if cp_action == "COPY": self.trigger_action("copy")
-                        elif cp_action == "PASTE": self.trigger_action("paste")
-                    except: pass
+                if (gestures["copy"].enabled or gestures["paste"].enabled) and arbiter.allows("copy"):
+                    frame, cp_action = guard.call("copy", self.copy_paste.process, frame, right_hand_data) or (frame, None)
+                    fired = cp_action in ("COPY", "PASTE") and self.trigger_action(cp_action.lower())
+                    if fired: arbiter.claim("copy")
                     
                 # 5. Screenshot
-                if self.gesture_settings["screenshot"]["enabled"] and len(self.position_buffer) >= 2:
-                    vy = self.position_buffer[-1][1] - self.position_buffer[-2][1]
-                    try:
-                        frame, scr_action = self.screenshot.process(frame, right_hand_data, vy)
-                        if scr_action == "SCREENSHOT": self.trigger_action("screenshot")
-                    except: pass
-
-        return frame
\ No newline at end of file
+                velocity = self.palm_track.velocity(0.1)  # None after a tracking gap
+                if gestures["screenshot"].enabled and arbiter.allows("screenshot") and velocity is not None:
+                    vy = velocity[1]  # Frame heights/s, downward positive
+                    frame, scr_action = guard.call("screenshot", self.screenshot.process, frame, right_hand_data, vy) or (frame, None)
+                    if scr_action == "SCREENSHOT" and self.trigger_action("screenshot"): arbiter.claim("screenshot")
+
+        return frame
+
+    def _assign_hands(self, hands):
+        """
+        Module state belongs to one hand (volume, snap) or one pair of hands
+        (zoom anchors): when a different hand takes the slot, even in the
+        middle of a gesture, that module starts fresh.
+        """
+        left_id = next((hand.id for hand in hands if hand.label == "Left"), None)
+        if left_id != self.left_hand_id:
+            self.left_hand_id = left_id
+            self.volume_control.volume_mode = False
+            self.pro_snap.reset()
+        if len(hands) == 2:
+            pair = (hands[0].id, hands[1].id)  # Track order: oldest first
+            if pair != self.zoom_hand_ids:
+                self.zoom_hand_ids = pair
+                self.two_hand_zoom.reset()
+
+    def _mode_candidates(self, gestures, hands_data, left_hand_data, right_hand_data):
+        """Modes whose entry pose is present this frame (the arbiter picks one)."""
+        candidates = set()
+        if len(hands_data) == 2 and gestures["zoom"].enabled:
+            candidates.add("zoom")
+        if left_hand_data and gestures["volume"].enabled:
+            f = left_hand_data[0][1]
+            if self.volume_control.volume_mode or (f[0] and f[1] and not f[3] and not f[4]):
+                candidates.add("volume")
+        if right_hand_data:
+            thumb, index, middle, ring, pinky = right_hand_data[0][1]
+            if gestures["mouse_beta"].enabled:
+                candidates.add("mouse")
+            elif gestures["text_mode"].enabled and index and middle and not ring and not pinky and not thumb:
+                candidates.add("text")
+            elif gestures["circular"].enabled and index and not middle and not ring and not pinky:
+                candidates.add("drawing_circle")
+        return candidates
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+# --- ENGINE EVENT BUS ---
+# publish() may be called from any thread (vision loop, API handlers). Every
+# event gets a sequence number and lands in a bounded history ring; live
+# subscribers (one bounded asyncio.Queue each) are fed on the event loop via
+# call_soon_threadsafe. With no subscribers a publish is one ring append.
+#
+# Clients resume with the last seq they saw: missed events are replayed
+# from history. A slow client whose queue overflows is resynced from
+# history as well; if the history no longer reaches back far enough it gets
+# a "reset" event and must reload a snapshot.
+
+
+class _Subscription:
+    __slots__ = ("queue", "overflow")
+
+    def __init__(self, size):
+        self.queue = asyncio.Queue(maxsize=size)
+        self.overflow = False
+
+
+class EventBus:
+    def __init__(self, history=500, queue_size=256):
+        self.queue_size = queue_size
+        self._history = deque(maxlen=history)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._loop = None
+
+    @property
+    def seq(self):
+        return self._seq
+
+    def bind(self, loop):
+        """Event loop that subscribers live on (call once at startup)."""
+        self._loop = loop
+
+    def publish(self, type, **data):
+        with self._lock:
+            self._seq += 1
+            event = {"seq": self._seq, "type": type, "time": time.time(), **data}
+            self._history.append(event)
+            subscribers = tuple(self._subscribers)
+        if subscribers and self._loop is not None:
+            try: self._loop.call_soon_threadsafe(self._deliver, event, subscribers)
+            except RuntimeError: pass  # Loop closed (shutdown)
+        return event
+
+    @staticmethod
+    def _deliver(event, subscribers):
+        for sub in subscribers:
+            if sub.overflow: continue
+            try: sub.queue.put_nowait(event)
+            except asyncio.QueueFull: sub.overflow = True
+
+    def can_resume(self, since):
+        """True if every event after `since` is still in history."""
+        with self._lock:
+            if since > self._seq: return False  # Cursor from a previous server run
+            return not self._history or self._history[0]["seq"] <= since + 1
+
+    async def subscribe(self, since):
+        """Yields events with seq > since: history first, then live."""
+        last = since
+        while True:
+            sub = _Subscription(self.queue_size)
+            with self._lock:
+                # Registered under the lock: nothing published between backlog and live is lost
+                gap = bool(self._history) and self._history[0]["seq"] > last + 1
+                backlog = [e for e in self._history if e["seq"] > last]
+                self._subscribers.add(sub)
+            try:
+                if gap:
+                    yield {"seq": last, "type": "reset", "time": time.time()}
+                    return
+                for event in backlog:
+                    last = event["seq"]
+                    yield event
+                while not (sub.overflow and sub.queue.empty()):
+                    event = await sub.queue.get()
+                    if event["seq"] <= last: continue
+                    last = event["seq"]
+                    yield event
+            finally:
+                with self._lock: self._subscribers.discard(sub)
+            # Overflowed: loop around and catch up from history
@@ -0,0 +1,167 @@
+import math
+import time
+import numpy as np
+
+# --- SIGNAL FILTERS ---
+# Shared smoothing for cursor, palm tracking and pinch distances.
+# Each filter takes a scalar or an (x, y, ...) vector per call, plus an
+# optional capture timestamp, and returns the same shape back.
+# `lead` (seconds) extrapolates the output along the estimated velocity to
+# hide pipeline delay (capture -> inference -> OS call).
+
+DEFAULT_DT = 1 / 30.0
+
+
+class _TimedFilter:
+    def __init__(self, lead=0.0):
+        self.lead = lead
+        self.last_time = None
+
+    def _dt(self, t):
+        if t is None:
+            t = time.perf_counter()
+        dt = DEFAULT_DT if self.last_time is None else t - self.last_time
+        self.last_time = t
+        return dt if dt > 0 else DEFAULT_DT
+
+    def reset(self):
+        self.last_time = None
+
+    @staticmethod
+    def _out(value, is_scalar):
+        return float(value[0]) if is_scalar else value
+
+
+class OneEuroFilter(_TimedFilter):
+    """
+    Speed-adaptive low-pass filter (Casiez et al., CHI 2012).
+    Heavy smoothing when still (min_cutoff), less lag when moving fast (beta).
+    The cutoff adapts to the speed of the input relative to the filtered
+    value; `velocity` is the input's own derivative (low-passed at
+    d_cutoff), in units/s, for extrapolation and rate control.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0, lead=0.0):
+        super().__init__(lead)
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.value = None
+        self.velocity = None
+        self._raw = None
+        self._speed = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def reset(self):
+        super().reset()
+        self.value = None
+        self.velocity = None
+        self._raw = None
+        self._speed = None
+
+    def __call__(self, value, t=None):
+        is_scalar = np.ndim(value) == 0
+        x = np.atleast_1d(np.asarray(value, dtype=np.float64))
+        dt = self._dt(t)
+
+        if self.value is None:
+            self.value = self._raw = x
+            self.velocity = np.zeros_like(x)
+            self._speed = np.zeros_like(x)
+            return self._out(x, is_scalar)
+
+        a_d = self._alpha(self.d_cutoff, dt)
+        self.velocity = a_d * (x - self._raw) / dt + (1 - a_d) * self.velocity
+        self._speed = a_d * (x - self.value) / dt + (1 - a_d) * self._speed  # Includes the lag: adapts sooner
+        self._raw = x
+
+        cutoff = self.min_cutoff + self.beta * float(np.linalg.norm(self._speed))
+        a = self._alpha(cutoff, dt)
+        self.value = a * x + (1 - a) * self.value
+
+        return self._out(self.value + self.velocity * self.lead, is_scalar)
+
+
+class KalmanFilter(_TimedFilter):
+    """
+    Constant-velocity Kalman filter, one [position, velocity] state per axis.
+    process_noise is the white-acceleration spectral density, measurement_noise
+    the variance of the raw input. All axes share the same covariance, so it
+    is tracked as three scalars.
+    """
+
+    def __init__(self, process_noise=50.0, measurement_noise=1.0, lead=0.0):
+        super().__init__(lead)
+        self.q = process_noise
+        self.r = measurement_noise
+        self.value = None
+        self.velocity = None
+
+    def reset(self):
+        super().reset()
+        self.value = None
+        self.velocity = None
+
+    def __call__(self, value, t=None):
+        is_scalar = np.ndim(value) == 0
+        z = np.atleast_1d(np.asarray(value, dtype=np.float64))
+        dt = self._dt(t)
+
+        if self.value is None:
+            self.value = z
+            self.velocity = np.zeros_like(z)
+            self.p00, self.p01, self.p11 = self.r, 0.0, self.r / (DEFAULT_DT ** 2)
+            return self._out(z, is_scalar)
+
+        # Predict
+        self.value = self.value + self.velocity * dt
+        p00 = self.p00 + dt * (2 * self.p01 + dt * self.p11) + self.q * dt ** 4 / 4
+        p01 = self.p01 + dt * self.p11 + self.q * dt ** 3 / 2
+        p11 = self.p11 + self.q * dt ** 2
+
+        # Update
+        s = p00 + self.r
+        k0, k1 = p00 / s, p01 / s
+        innovation = z - self.value
+        self.value = self.value + k0 * innovation
+        self.velocity = self.velocity + k1 * innovation
+        self.p00, self.p01, self.p11 = (1 - k0) * p00, (1 - k0) * p01, p11 - k1 * p01
+
+        return self._out(self.value + self.velocity * self.lead, is_scalar)
+
+
+class EMAFilter(_TimedFilter):
+    """Fixed-weight exponential smoothing (the legacy behaviour), for comparison."""
+
+    def __init__(self, alpha=0.5, lead=0.0):
+        super().__init__(lead)
+        self.alpha = alpha
+        self.value = None
+
+    def reset(self):
+        super().reset()
+        self.value = None
+
+    def __call__(self, value, t=None):
+        is_scalar = np.ndim(value) == 0
+        x = np.atleast_1d(np.asarray(value, dtype=np.float64))
+        self._dt(t)
+        self.value = x if self.value is None else self.alpha * x + (1 - self.alpha) * self.value
+        return self._out(self.value, is_scalar)
+
+
+FILTERS = {
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+    "ema": EMAFilter,
+}
+
+
+def make_filter(kind, **params):
+    if kind not in FILTERS:
+        raise ValueError(f"Unknown filter: {kind}")
+    return FILTERS[kind](**params)
@@ -0,0 +1,126 @@
+import itertools
+import math
+
+from core.filters import OneEuroFilter
+from core.motion import MotionTrack
+
+# --- HAND IDENTITY TRACKING ---
+# MediaPipe reports hands in arbitrary order and its handedness label can
+# flip for a frame or two (a hand seen edge-on, hands crossing). Splitting
+# hands by the raw label every frame makes the stateful gestures misfire or
+# reset. Instead, each detection is matched to the hand it continues:
+#   - association: the assignment with the smallest total wrist + palm
+#     centre distance, gated by max_distance (normalized image units).
+#     Brute force over the orderings: there are only a handful of hands
+#   - handedness: each track keeps an EMA of its raw labels in [-1, 1]
+#     (Left..Right). The label only changes once the score crosses the
+#     hysteresis band on the other side, so it takes a sustained
+#     disagreement (4 frames at the defaults), not one jittery frame
+#   - a track survives max_missed frames without a detection, so its state
+#     is still there when a briefly lost hand comes back
+# Every track owns a HandState: per-hand gesture state that lives exactly
+# as long as the hand does.
+
+PALM_IDS = (0, 5, 9, 13, 17)
+
+
+class HandState:
+    """Per-hand gesture state (one per tracked hand)."""
+
+    def __init__(self):
+        self.track = MotionTrack()  # Filtered palm centre path (normalized, timestamped)
+        self.palm_filter = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+
+
+class TrackedHand:
+    __slots__ = ("id", "label", "score", "landmarks", "missed", "state", "_anchor")
+
+    def __init__(self, hand_id, label, landmarks, anchor, state):
+        self.id = hand_id
+        self.label = label
+        self.score = 1.0 if label == "Right" else -1.0
+        self.landmarks = landmarks
+        self.missed = 0
+        self.state = state
+        self._anchor = anchor
+
+
+def _anchor(landmarks):
+    """Wrist and palm centre, normalized."""
+    wrist = landmarks[0]
+    cx = sum(landmarks[i].x for i in PALM_IDS) / len(PALM_IDS)
+    cy = sum(landmarks[i].y for i in PALM_IDS) / len(PALM_IDS)
+    return wrist.x, wrist.y, cx, cy
+
+
+def _distance(a, b):
+    return (math.hypot(a[0] - b[0], a[1] - b[1]) + math.hypot(a[2] - b[2], a[3] - b[3])) / 2
+
+
+class HandTracker:
+    def __init__(self, max_distance=0.2, max_missed=5, alpha=0.25, hysteresis=0.3, state_factory=HandState):
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.alpha = alpha            # Weight of each frame's raw label in the handedness score
+        self.hysteresis = hysteresis  # Score beyond which the label may flip
+        self.state_factory = state_factory
+        self.tracks = []
+        self._next_id = 1
+        self.label_flips = 0          # Raw label disagreements absorbed by the hysteresis
+
+    def reset(self):
+        self.tracks = []
+
+    def update(self, hand_landmarks, labels):
+        """
+        hand_landmarks: this frame's detections; labels: their raw
+        "Left"/"Right" labels (already mirrored). Returns the hands seen
+        this frame, in track order (oldest first).
+        """
+        anchors = [_anchor(lm) for lm in hand_landmarks]
+        pairs = self._associate(anchors)
+
+        seen = []
+        matched = set()
+        for detection, track in pairs:
+            track.landmarks = hand_landmarks[detection]
+            track._anchor = anchors[detection]
+            track.missed = 0
+            self._vote(track, labels[detection])
+            matched.add(detection)
+            seen.append(track)
+        for track in self.tracks:
+            if track not in seen: track.missed += 1
+        self.tracks = [t for t in self.tracks if t.missed <= self.max_missed]
+
+        for detection in range(len(hand_landmarks)):
+            if detection in matched: continue
+            track = TrackedHand(self._next_id, labels[detection], hand_landmarks[detection], anchors[detection], self.state_factory())
+            self._next_id += 1
+            self.tracks.append(track)
+            seen.append(track)
+        seen.sort(key=lambda t: t.id)
+        return seen
+
+    def _associate(self, anchors):
+        """[(detection index, track)] minimizing total distance, within max_distance."""
+        if not anchors or not self.tracks: return []
+        if len(anchors) <= len(self.tracks):
+            orders = ((range(len(anchors)), tracks) for tracks in itertools.permutations(self.tracks, len(anchors)))
+        else:
+            orders = ((detections, self.tracks) for detections in itertools.permutations(range(len(anchors)), len(self.tracks)))
+        best, best_cost = [], None
+        for detections, tracks in orders:
+            pairs = [(d, t) for d, t in zip(detections, tracks) if _distance(anchors[d], t._anchor) <= self.max_distance]
+            cost = (-len(pairs), sum(_distance(anchors[d], t._anchor) for d, t in pairs))  # Most matches, then closest
+            if best_cost is None or cost < best_cost: best, best_cost = pairs, cost
+        return best
+
+    def _vote(self, track, label):
+        raw = 1.0 if label == "Right" else -1.0
+        track.score += self.alpha * (raw - track.score)
+        if label != track.label:
+            if (track.label == "Left" and track.score > self.hysteresis) or (track.label == "Right" and track.score < -self.hysteresis):
+                track.label = label
+            else:
+                self.label_flips += 1
@@ -0,0 +1,146 @@
+import os
+import platform
+
+# --- OS INPUT INJECTION ---
+# pyautogui works everywhere but pays for screen-size checks, failsafe and
+# PAUSE bookkeeping on every call. On Linux/X11 we talk XTest directly
+# through python-xlib when it is installed (also works against Xvfb).
+#
+# Keys: resolve(name) turns a pyautogui-style key name into a backend code
+# once (at macro compile time); send_keys([(code, is_down), ...]) injects a
+# whole batch, flushing the X connection a single time.
+# scroll(clicks): wheel notches, positive = up (away from the user).
+# wheel(units): the same in the platform's finest wheel units, of which
+# there are wheel_resolution per notch (120 on Windows, 1 elsewhere).
+
+system_os = platform.system()
+
+try:
+    import Xlib.threaded  # Real connection locks: cursor, scroll, zoom and macro threads share one display
+    from Xlib import X, XK, display as xdisplay
+    from Xlib.ext import xtest
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+
+class PyAutoGUIBackend:
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+        self.wheel_resolution = 120 if system_os == "Windows" else 1  # pyautogui passes raw WHEEL_DELTA units on Windows
+
+    def move(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=False)
+
+    def resolve(self, key):
+        if key not in self._pyautogui.KEYBOARD_KEYS:
+            raise ValueError(f"Unknown key: {key!r}")
+        return key
+
+    def send_keys(self, events):
+        for key, down in events:
+            if down: self._pyautogui.keyDown(key, _pause=False)
+            else: self._pyautogui.keyUp(key, _pause=False)
+
+    def scroll(self, clicks):
+        self.wheel(clicks * self.wheel_resolution)
+
+    def wheel(self, units):
+        self._pyautogui.scroll(units, _pause=False)
+
+    def close(self):
+        pass
+
+
+# pyautogui key names -> X keysym names (single characters map to themselves,
+# f1-f24 to F1-F24). Covers every name in core.macros.KEY_NAMES, so a macro
+# that validates without a backend also resolves here.
+XLIB_KEYSYMS = {
+    "ctrl": "Control_L", "ctrlleft": "Control_L", "ctrlright": "Control_R",
+    "shift": "Shift_L", "shiftleft": "Shift_L", "shiftright": "Shift_R",
+    "alt": "Alt_L", "altleft": "Alt_L", "altright": "Alt_R", "optionleft": "Alt_L", "optionright": "Alt_R",
+    "win": "Super_L", "winleft": "Super_L", "winright": "Super_R", "command": "Super_L", "apps": "Menu",
+    "enter": "Return", "return": "Return", "esc": "Escape", "escape": "Escape",
+    "tab": "Tab", "backspace": "BackSpace", "delete": "Delete", "del": "Delete", "space": "space",
+    "left": "Left", "right": "Right", "up": "Up", "down": "Down",
+    "home": "Home", "end": "End", "pageup": "Prior", "pgup": "Prior", "pagedown": "Next", "pgdn": "Next",
+    "insert": "Insert", "capslock": "Caps_Lock", "numlock": "Num_Lock", "scrolllock": "Scroll_Lock", "pause": "Pause",
+    "printscreen": "Print", "print": "Print", "prntscrn": "Print", "prtsc": "Print", "prtscr": "Print",
+    "clear": "Clear", "execute": "Execute", "help": "Help", "select": "Select", "yen": "yen",
+    # Keypad
+    "add": "KP_Add", "subtract": "KP_Subtract", "multiply": "KP_Multiply", "divide": "KP_Divide",
+    "decimal": "KP_Decimal", "separator": "KP_Separator", **{f"num{i}": f"KP_{i}" for i in range(10)},
+    # Input method (Japanese / Korean)
+    "convert": "Henkan", "nonconvert": "Muhenkan", "modechange": "Mode_switch", "kana": "Kana_Lock", "kanji": "Kanji",
+    "hangul": "Hangul", "hanguel": "Hangul", "hanja": "Hangul_Hanja", "junja": "Hangul_Jeonja",
+    # Media / browser / launch keys (Xlib names these XF86_*)
+    "volumeup": "XF86_AudioRaiseVolume", "volumedown": "XF86_AudioLowerVolume", "volumemute": "XF86_AudioMute",
+    "playpause": "XF86_AudioPlay", "nexttrack": "XF86_AudioNext", "prevtrack": "XF86_AudioPrev", "stop": "XF86_AudioStop",
+    "browserback": "XF86_Back", "browserforward": "XF86_Forward", "browserfavorites": "XF86_Favorites",
+    "browserhome": "XF86_HomePage", "browserrefresh": "XF86_Refresh", "browsersearch": "XF86_Search",
+    "browserstop": "XF86_Stop", "launchapp1": "XF86_MyComputer", "launchapp2": "XF86_Calculator",
+    "launchmail": "XF86_Mail", "launchmediaselect": "XF86_AudioMedia", "sleep": "XF86_Sleep",
+}
+
+
+def xlib_keysym_name(key):
+    """X keysym name for a named key, or None (single characters are their own keysym)."""
+    name = XLIB_KEYSYMS.get(key)
+    if name is None and len(key) > 1 and key[0] == "f" and key[1:].isdigit() and 1 <= int(key[1:]) <= 24:
+        name = key.upper()
+    return name
+
+
+class XlibBackend:
+    """XTest injection over one persistent X connection (thread-safe via Xlib.threaded)."""
+    name = "xlib"
+    wheel_resolution = 1  # XTest only has whole wheel button clicks
+
+    def __init__(self, display_name=None):
+        self.display = xdisplay.Display(display_name)
+        XK.load_keysym_group("xf86")
+        XK.load_keysym_group("korean")
+
+    def move(self, x, y):
+        xtest.fake_input(self.display, X.MotionNotify, x=int(x), y=int(y))
+        self.display.flush()
+
+    def resolve(self, key):
+        name = xlib_keysym_name(key)
+        keysym = XK.string_to_keysym(name) if name else (ord(key) if len(key) == 1 else 0)
+        keycode = self.display.keysym_to_keycode(keysym) if keysym else 0
+        if not keycode:
+            raise ValueError(f"Unknown key: {key!r}")
+        return keycode
+
+    def send_keys(self, events):
+        for keycode, down in events:
+            xtest.fake_input(self.display, X.KeyPress if down else X.KeyRelease, keycode)
+        self.display.flush()
+
+    def scroll(self, clicks):
+        button = 4 if clicks > 0 else 5  # X wheel: button 4 up, 5 down
+        for _ in range(abs(clicks)):
+            xtest.fake_input(self.display, X.ButtonPress, button)
+            xtest.fake_input(self.display, X.ButtonRelease, button)
+        self.display.flush()
+
+    wheel = scroll
+
+    def close(self):
+        try: self.display.close()
+        except Exception: pass
+
+
+def get_input_backend(preferred=None):
+    """
+    preferred: "xlib", "pyautogui" or None (auto: xlib on Linux with a display).
+    Falls back to pyautogui when the fast path is unavailable.
+    """
+    if preferred in (None, "xlib") and XLIB_AVAILABLE and system_os == "Linux" and os.environ.get("DISPLAY"):
+        try: return XlibBackend()
+        except Exception as e: print(f"⚠️ XTest backend unavailable: {e}")
+    return PyAutoGUIBackend()
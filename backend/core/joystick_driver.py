@@ -0,0 +1,109 @@
+import threading
+import time
+
+# --- TEXT JOYSTICK DRIVER ---
+# Emits shift+arrow repeats on its own timer thread, so the selection speed
+# depends only on deflection and hold time, never on camera fps or gesture
+# cooldowns. The vision thread just publishes (direction, deflection).
+#
+#   rate = (min_rate + (max_rate - min_rate) * deflection ** curve)
+#          * (1 + (max_accel - 1) * min(held / accel_time, 1))
+#
+# Like OS typematic repeat, the first key fires on engage and repeats start
+# after initial_delay. Repeats due within one tick go out as one batched macro.
+
+
+class JoystickDriver:
+    def __init__(self, macros, min_rate=4.0, max_rate=25.0, curve=2.0, accel_time=1.5, max_accel=2.0,
+                 initial_delay=0.3, tick_hz=120, hold_timeout=0.25, max_batch=8, modifier="shift"):
+        self.macros = macros
+        self.min_rate = min_rate          # Keys/s just outside the dead zone
+        self.max_rate = max_rate          # Keys/s at full deflection
+        self.curve = curve                # >1: finer control near the center
+        self.accel_time = accel_time      # Seconds of holding one direction to reach max_accel
+        self.max_accel = max_accel        # Rate multiplier after accel_time
+        self.initial_delay = initial_delay  # Seconds between the first key and the first repeat
+        self.tick_hz = tick_hz
+        self.hold_timeout = hold_timeout  # Stop if the vision thread goes quiet (hand lost)
+        self.max_batch = max_batch        # Keys per tick cap (after a stall, don't burst)
+        self.modifier = modifier
+
+        self.running = False
+        self.thread = None
+        self._input = None                # (direction, deflection, t) - replaced atomically
+        self._wake = threading.Event()
+        self._compiled = {}               # (direction, count) -> compiled macro
+        self.keys_sent = 0
+
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+        if self.thread: self.thread.join()
+        self.thread = None
+
+    def update(self, direction, deflection, t=None):
+        """direction: "UP"/"DOWN"/"LEFT"/"RIGHT" or None; deflection: 0..1 past the dead zone."""
+        if direction is None:
+            self._input = None
+            return
+        self._input = (direction.lower(), min(max(deflection, 0.0), 1.0), time.perf_counter() if t is None else t)
+        self._wake.set()
+
+    def release(self):
+        self._input = None
+
+    def rate(self, deflection, held):
+        base = self.min_rate + (self.max_rate - self.min_rate) * deflection ** self.curve
+        return base * (1 + (self.max_accel - 1) * min(held / self.accel_time, 1.0))
+
+    def _emit(self, direction, count):
+        key = (direction, count)
+        macro = self._compiled.get(key)
+        if macro is None:
+            macro = self._compiled[key] = self.macros.compile(
+                [{"hold": self.modifier, "steps": [{"press": direction, "repeat": count}]}]
+            )
+        self.macros.run(macro)
+        self.keys_sent += count
+
+    def _run_loop(self):
+        period = 1.0 / self.tick_hz
+        direction = None
+        since = due = 0.0
+        last = time.perf_counter()
+
+        while self.running:
+            current = self._input
+            now = time.perf_counter()
+
+            if current is None or now - current[2] > self.hold_timeout:
+                direction = None
+                self._wake.clear()
+                current = self._input  # Re-check: an update may have raced the clear
+                if current is None or time.perf_counter() - current[2] > self.hold_timeout:
+                    self._wake.wait()
+                last = time.perf_counter()
+                continue
+
+            new_direction, deflection, _ = current
+            if new_direction != direction:
+                # Engage: first key immediately, then repeat at the deflection rate
+                direction, since, due = new_direction, now, 1.0
+            elif now - since >= self.initial_delay:
+                due += self.rate(deflection, now - since - self.initial_delay) * (now - last)
+            last = now
+
+            count = min(int(due), self.max_batch)
+            if count:
+                due -= count
+                try: self._emit(direction, count)
+                except Exception as e: print(f"Joystick Error: {e}")
+            due = min(due, 1.0)
+
+            time.sleep(period)
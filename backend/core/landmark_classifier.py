@@ -0,0 +1,174 @@
+import numpy as np
+
+# --- CUSTOM GESTURE CLASSIFIER ---
+# Softmax regression on normalized 63-d landmark vectors. Feature
+# standardization is folded into the weights at export time, so inference
+# is a single matmul + bias.
+#
+# Softmax is closed-set: any pose lands in some class, often confidently.
+# Trained models therefore also carry each class's centroid and an
+# acceptance radius (standardized feature distance), and a hand outside the
+# radius of its best class is rejected as "no gesture". Models saved
+# without them only have the confidence gate.
+
+NUM_FEATURES = 21 * 3
+
+
+def landmark_features(frames):
+    """
+    frames: (N, 21, 3) array of raw MediaPipe landmarks (x, y, z).
+    Returns (N, 63) float32: wrist-relative, divided by palm size, so the
+    vector does not depend on where the hand is or how far from the camera.
+    """
+    frames = np.asarray(frames, dtype=np.float32).reshape(-1, 21, 3)
+    rel = frames - frames[:, :1]
+    palm = np.linalg.norm(rel[:, 9, :2], axis=1)
+    rel /= np.maximum(palm, 1e-3)[:, None, None]
+    return rel.reshape(-1, NUM_FEATURES)
+
+
+def class_regions(features, labels, num_classes, quantile=0.99, margin=1.25):
+    """
+    Open-set acceptance regions from training features.
+    Returns (centroids (C, 63), scale (63,), radii (C,)): a sample belongs to
+    class c only if ||(x - centroids[c]) / scale|| <= radii[c].
+    """
+    features = np.asarray(features, dtype=np.float32)
+    scale = features.std(axis=0) + 1e-6
+    centroids = np.stack([features[labels == c].mean(axis=0) for c in range(num_classes)])
+    radii = np.array([
+        np.quantile(np.linalg.norm((features[labels == c] - centroids[c]) / scale, axis=1), quantile) * margin
+        for c in range(num_classes)
+    ])
+    return centroids.astype(np.float32), scale.astype(np.float32), radii.astype(np.float32)
+
+
+class LandmarkClassifier:
+    def __init__(self, classes, weights, bias, min_confidence=0.8, metrics=None, max_hands=2, window=1, regions=None):
+        self.classes = list(classes)
+        self.weights = np.asarray(weights, dtype=np.float32)  # (63, C)
+        self.bias = np.asarray(bias, dtype=np.float32)        # (C,)
+        self.min_confidence = min_confidence
+        self.metrics = metrics or {}
+        self.regions = regions  # (centroids, scale, radii) from class_regions, or None
+        if regions is not None:
+            centroids, scale, radii = (np.asarray(a, dtype=np.float32) for a in regions)
+            self.regions = (centroids, scale, radii)
+            self._inv_scale = 1.0 / scale
+            self._radii_sq = radii ** 2
+            self._diff = np.empty(NUM_FEATURES, dtype=np.float32)
+
+        # Preallocated per-frame buffers for classify_hands (vision thread only)
+        num_classes = len(self.classes)
+        self.max_hands = max_hands
+        self._raw = np.empty((max_hands, 21, 3), dtype=np.float32)
+        self._features = self._raw.reshape(max_hands, NUM_FEATURES)
+        self._palm = np.empty(max_hands, dtype=np.float32)
+        self._logits = np.empty((max_hands, num_classes), dtype=np.float32)
+        self._row = np.empty((max_hands, 1), dtype=np.float32)
+
+        # Sliding window of recent per-frame probabilities, averaged for stability
+        self.window = max(1, window)
+        self._history = np.zeros((self.window, max_hands, num_classes), dtype=np.float32)
+        self._avg = np.empty((max_hands, num_classes), dtype=np.float32)
+        self._pos = 0
+        self._filled = 0
+        self._last_n = 0
+
+    def classify_hands(self, hand_landmarks):
+        """
+        Score every detected hand in one matmul, without per-frame array allocation.
+        hand_landmarks: result.hand_landmarks (list of 21-landmark lists).
+        Returns [(label or None, confidence)] per hand.
+        """
+        n = min(len(hand_landmarks), self.max_hands)
+        if n == 0:
+            self._filled = 0
+            return []
+        if n != self._last_n:
+            self._filled = 0  # Hand count changed: old window rows no longer line up
+            self._last_n = n
+
+        raw = self._raw[:n]
+        for i in range(n):
+            raw[i] = [(l.x, l.y, l.z) for l in hand_landmarks[i]]
+
+        # Wrist-relative, palm-normalized (same as landmark_features), in place
+        raw -= raw[:, :1]
+        palm = self._palm[:n]
+        np.hypot(raw[:, 9, 0], raw[:, 9, 1], out=palm)
+        np.maximum(palm, 1e-3, out=palm)
+        raw /= palm[:, None, None]
+
+        # Softmax(features @ W + b), in place
+        logits = self._logits[:n]
+        row = self._row[:n]
+        np.matmul(self._features[:n], self.weights, out=logits)
+        logits += self.bias
+        np.max(logits, axis=1, keepdims=True, out=row)
+        logits -= row
+        np.exp(logits, out=logits)
+        np.sum(logits, axis=1, keepdims=True, out=row)
+        logits /= row
+
+        proba = logits
+        if self.window > 1:
+            self._history[self._pos, :n] = logits
+            self._pos = (self._pos + 1) % self.window
+            self._filled = min(self._filled + 1, self.window)
+            proba = self._avg[:n]
+            if self._filled == self.window:
+                np.mean(self._history[:, :n], axis=0, out=proba)
+            else:
+                idx = [(self._pos - k - 1) % self.window for k in range(self._filled)]
+                np.mean(self._history[idx, :n], axis=0, out=proba)
+
+        results = []
+        for i in range(n):
+            best = int(proba[i].argmax())
+            conf = float(proba[i, best])
+            accepted = conf >= self.min_confidence and self._inside(self._features[i], best)
+            results.append((self.classes[best] if accepted else None, conf))
+        return results
+
+    def _inside(self, features, label_index):
+        """Whether a 63-d feature vector lies within the acceptance region of a class."""
+        if self.regions is None: return True
+        diff = self._diff
+        np.subtract(features, self.regions[0][label_index], out=diff)
+        diff *= self._inv_scale
+        return float(diff @ diff) <= self._radii_sq[label_index]
+
+    def predict_proba(self, features):
+        logits = np.atleast_2d(features) @ self.weights + self.bias
+        logits -= logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, frames):
+        """Returns [(label or None, confidence)] per hand in `frames`."""
+        features = landmark_features(frames)
+        proba = self.predict_proba(features)
+        best = proba.argmax(axis=1)
+        return [
+            (self.classes[i] if p[i] >= self.min_confidence and self._inside(x, i) else None, float(p[i]))
+            for i, p, x in zip(best, proba, features)
+        ]
+
+    def save(self, path):
+        regions = {}
+        if self.regions is not None:
+            regions = dict(zip(("centroids", "scale", "radii"), self.regions))
+        np.savez(
+            path, classes=np.array(self.classes), weights=self.weights, bias=self.bias,
+            min_confidence=self.min_confidence, accuracy=self.metrics.get("accuracy", 0.0),
+            samples=self.metrics.get("samples", 0), **regions
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            metrics = {"accuracy": float(data["accuracy"]), "samples": int(data["samples"])}
+            regions = (data["centroids"], data["scale"], data["radii"]) if "centroids" in data.files else None
+            return cls(data["classes"].tolist(), data["weights"], data["bias"], float(data["min_confidence"]), metrics,
+                       regions=regions)
@@ -0,0 +1,157 @@
+import numpy as np
+
+# --- KEYFRAME LANDMARK TRACKING ---
+# The hand landmarker runs only on keyframes. Between them the 21 landmarks
+# of each hand are carried forward with pyramidal Lucas-Kanade optical flow
+# (cv2.calcOpticalFlowPyrLK), so gesture modules still get landmarks on
+# every camera frame.
+#
+# Keyframes happen:
+#   - when no hand is being tracked (new hands can only come from detection)
+#   - every `interval` frames; the interval adapts to motion, from
+#     max_interval for a still hand down to 1 (detect every frame) at
+#     fast_motion pixels per frame
+#   - when tracking drifts: too few points pass the forward-backward check
+#     (track forward, track the result back, compare to the start), or a
+#     hand leaves the frame
+# z is not observable from 2D flow: it keeps its keyframe value.
+
+HAND_POINTS = 21
+
+
+class Landmark:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class TrackedResult:
+    """Same shape as a HandLandmarkerResult for what the engine reads."""
+    __slots__ = ("hand_landmarks", "handedness", "keyframe")
+
+    def __init__(self, hand_landmarks, handedness, keyframe):
+        self.hand_landmarks = hand_landmarks
+        self.handedness = handedness
+        self.keyframe = keyframe
+
+
+class LandmarkTracker:
+    def __init__(self, max_interval=1, fast_motion=20.0, fb_threshold=2.0, min_good=0.8,
+                 win_size=21, levels=3):
+        self.configure(max_interval, fast_motion, fb_threshold, min_good)
+        self.win_size = (win_size, win_size)
+        self.levels = levels
+        self._cv = None  # cv2, imported on first use
+        self.reset()
+        self.frames = 0
+        self.detections = 0
+        self.drift_resets = 0
+
+    def configure(self, max_interval=None, fast_motion=None, fb_threshold=None, min_good=None):
+        if max_interval is not None:
+            if not 1 <= max_interval <= 30: raise ValueError("max_interval must be 1-30 (1 = detect every frame)")
+            self.max_interval = max_interval
+        if fast_motion is not None:
+            if fast_motion <= 0: raise ValueError("fast_motion must be > 0")
+            self.fast_motion = fast_motion  # px/frame at which every frame is a keyframe
+        if fb_threshold is not None:
+            if fb_threshold <= 0: raise ValueError("fb_threshold must be > 0")
+            self.fb_threshold = fb_threshold  # px of forward-backward error a point may have
+        if min_good is not None:
+            if not 0 < min_good <= 1: raise ValueError("min_good must be in (0, 1]")
+            self.min_good = min_good  # Fraction of a hand's points that must track
+
+    def config(self):
+        return {"max_interval": self.max_interval, "fast_motion": self.fast_motion,
+                "fb_threshold": self.fb_threshold, "min_good": self.min_good}
+
+    @property
+    def enabled(self):
+        return self.max_interval > 1
+
+    def stats(self):
+        return {"frames": self.frames, "detections": self.detections, "drift_resets": self.drift_resets,
+                "detect_ratio": self.detections / self.frames if self.frames else 1.0}
+
+    def reset(self):
+        self._previous = None
+        self._points = None      # (hands * 21, 1, 2) float32 pixel coordinates
+        self._z = None
+        self._handedness = None
+        self._since_keyframe = 0
+        self.interval = 1
+
+    # ---------------- PER FRAME ----------------
+    def track(self, gray, detect):
+        """
+        gray: this frame in grayscale, or None to just detect. detect():
+        runs the landmarker on this frame (called on keyframes only).
+        Returns the detector result or a TrackedResult.
+        """
+        self.frames += 1
+        if gray is None or not self.enabled:
+            self._previous = None  # Re-enabling starts from a fresh keyframe
+            self.detections += 1
+            return detect()
+        if self._cv is None:
+            import cv2
+            self._cv = cv2
+
+        previous, self._previous = self._previous, gray
+        result = None
+        if self._points is not None and previous is not None and self._since_keyframe + 1 < self.interval:
+            result = self._propagate(previous, gray)
+        if result is None:
+            result = detect()
+            self._keyframe(result, gray.shape)
+        return result
+
+    def _keyframe(self, result, shape):
+        h, w = shape[:2]
+        self.detections += 1
+        self._since_keyframe = 0
+        if not result.hand_landmarks:
+            self._points = None
+            self.interval = 1
+            return
+        points = np.array([[(l.x * w, l.y * h)] for hand in result.hand_landmarks for l in hand], dtype=np.float32)
+        if self._points is not None and len(points) == len(self._points):
+            # Last frame's landmarks (detected or tracked) -> now: one frame of motion
+            self._adapt(float(np.median(np.linalg.norm((points - self._points).reshape(-1, 2), axis=1))))
+        self._points = points
+        self._z = [l.z for hand in result.hand_landmarks for l in hand]
+        self._handedness = result.handedness
+
+    def _propagate(self, previous, gray):
+        cv2 = self._cv
+        h, w = gray.shape[:2]
+        start = self._points
+        forward, status, _ = cv2.calcOpticalFlowPyrLK(previous, gray, start, None, winSize=self.win_size, maxLevel=self.levels)
+        back, back_status, _ = cv2.calcOpticalFlowPyrLK(gray, previous, forward, None, winSize=self.win_size, maxLevel=self.levels)
+        error = np.linalg.norm((back - start).reshape(-1, 2), axis=1)
+        good = ((status.ravel() == 1) & (back_status.ravel() == 1) & (error < self.fb_threshold)).reshape(-1, HAND_POINTS)
+
+        before = start.reshape(-1, HAND_POINTS, 2)
+        after = forward.reshape(-1, HAND_POINTS, 2)
+        motion = 0.0
+        for hand, ok in enumerate(good):
+            if ok.mean() < self.min_good:  # Drifted, occluded or leaving the frame
+                self.drift_resets += 1
+                return None
+            step = np.median(after[hand][ok] - before[hand][ok], axis=0)
+            after[hand][~ok] = before[hand][~ok] + step  # Lost points follow the hand's median motion
+            motion = max(motion, float(np.hypot(*step)))
+
+        self._points = after.reshape(-1, 1, 2)
+        self._since_keyframe += 1
+        self._adapt(motion)
+        hands = [
+            [Landmark(x / w, y / h, z) for (x, y), z in zip(hand, self._z[i * HAND_POINTS:(i + 1) * HAND_POINTS])]
+            for i, hand in enumerate(after.tolist())
+        ]
+        return TrackedResult(hands, self._handedness, False)
+
+    def _adapt(self, motion):
+        """Frames per detection from motion (px/frame): max_interval when still, 1 at fast_motion."""
+        self.interval = max(1, min(self.max_interval, int(self.max_interval * (1 - motion / self.fast_motion) + 0.5)))
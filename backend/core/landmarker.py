@@ -0,0 +1,110 @@
+import os
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Optional, Tuple
+
+import numpy as np
+
+# --- HAND LANDMARKER ---
+# LandmarkerOptions describe how the MediaPipe HandLandmarker is built; the
+# engine and benchmarks.landmarker_benchmark both go through
+# create_landmarker() so a benchmarked configuration is exactly what runs.
+#
+# Threads: MediaPipe's Python Tasks API has no knob for the XNNPACK
+# delegate's thread count, so `threads` sets cv2.setNumThreads and
+# `cpu_affinity` is what bounds the cores inference can use: the landmarker
+# is created (and warmed up) on a pinned thread, and MediaPipe's executor
+# and XNNPACK pool threads inherit that mask. The vision thread pins itself
+# to the same set (see GestureEngine._run_loop).
+
+DELEGATES = ("cpu", "gpu")
+FRAME_SHAPE = (480, 640, 3)  # Camera frames (see GestureEngine.start)
+
+
+@dataclass(frozen=True)
+class LandmarkerOptions:
+    model_path: str
+    num_hands: Optional[int] = None        # None: 2, or 1 while two-hand zoom is disabled
+    detection_confidence: float = 0.7
+    presence_confidence: float = 0.7
+    tracking_confidence: float = 0.7
+    delegate: str = "cpu"                  # "cpu" (XNNPACK) or "gpu"
+    threads: Optional[int] = None          # cv2.setNumThreads; None: OpenCV's default
+    cpu_affinity: Optional[Tuple[int, ...]] = None  # Linux only; None: every CPU
+    warm_up_frames: int = 2                # Synthetic frames run through a new landmarker
+
+    def __post_init__(self):
+        if self.cpu_affinity is not None:
+            object.__setattr__(self, "cpu_affinity", tuple(sorted(set(self.cpu_affinity))))
+        if self.num_hands is not None and not 1 <= self.num_hands <= 4: raise ValueError("num_hands must be 1-4")
+        for name in ("detection_confidence", "presence_confidence", "tracking_confidence"):
+            if not 0.0 <= getattr(self, name) <= 1.0: raise ValueError(f"{name} must be 0-1")
+        if self.delegate not in DELEGATES: raise ValueError(f"Unknown delegate: {self.delegate}")
+        if self.threads is not None and not 1 <= self.threads <= 64: raise ValueError("threads must be 1-64")
+        if not 0 <= self.warm_up_frames <= 30: raise ValueError("warm_up_frames must be 0-30")
+        if self.cpu_affinity is not None:
+            if not hasattr(os, "sched_setaffinity"): raise ValueError("CPU affinity is not supported on this platform")
+            cpus = os.cpu_count() or 1
+            if not self.cpu_affinity or self.cpu_affinity[0] < 0 or self.cpu_affinity[-1] >= cpus:
+                raise ValueError(f"cpu_affinity must be CPUs in 0-{cpus - 1}")
+
+    def to_dict(self):
+        data = asdict(self)
+        if self.cpu_affinity is not None: data["cpu_affinity"] = list(self.cpu_affinity)
+        return data
+
+
+FIELDS = frozenset(f.name for f in fields(LandmarkerOptions))
+NULLABLE = frozenset(("num_hands", "threads", "cpu_affinity"))  # None means automatic
+_PROCESS_CPUS = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+
+
+def pin_current_thread(cpus):
+    """Restrict the calling thread (and threads it starts later) to `cpus`; None restores the process mask."""
+    if _PROCESS_CPUS is None: return
+    os.sched_setaffinity(0, _PROCESS_CPUS if cpus is None else cpus)
+
+
+@contextmanager
+def _pinned(cpus):
+    if cpus is None or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try: yield
+    finally: os.sched_setaffinity(0, previous)  # The building thread may be a shared pool worker
+
+
+def create_landmarker(options, num_hands):
+    """Build a HandLandmarker (IMAGE mode) for `options` and run its warm-up frames."""
+    import cv2
+    from mediapipe.tasks import python as mp_python
+    from mediapipe.tasks.python import vision
+
+    cv2.setNumThreads(-1 if options.threads is None else options.threads)  # -1: back to OpenCV's default
+    delegate = mp_python.BaseOptions.Delegate.GPU if options.delegate == "gpu" else mp_python.BaseOptions.Delegate.CPU
+    landmarker_options = vision.HandLandmarkerOptions(
+        base_options=mp_python.BaseOptions(model_asset_path=options.model_path, delegate=delegate),
+        num_hands=num_hands,
+        min_hand_detection_confidence=options.detection_confidence,
+        min_hand_presence_confidence=options.presence_confidence,
+        min_tracking_confidence=options.tracking_confidence,
+    )
+    with _pinned(options.cpu_affinity):
+        detector = vision.HandLandmarker.create_from_options(landmarker_options)
+        warm_up(detector, options.warm_up_frames)  # XNNPACK threads start on the first inference
+    return detector
+
+
+def warm_up(detector, frames):
+    """
+    Run `frames` blank camera-sized frames so graph start-up, weight packing
+    and thread pool creation are paid here instead of on the first real
+    frames. A blank frame only exercises palm detection; the landmark model
+    is sized on the first frame with a hand in it.
+    """
+    if frames <= 0: return
+    import mediapipe as mp
+    image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.zeros(FRAME_SHAPE, dtype=np.uint8))
+    for _ in range(frames): detector.detect(image)
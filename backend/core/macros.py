@@ -0,0 +1,198 @@
+import queue
+import threading
+import time
+from functools import lru_cache
+
+# --- HOTKEY MACROS ---
+# A macro is a list of steps, compiled once into batches of raw
+# (backend_code, is_down) key events separated by delays:
+#
+#   ["ctrl", "c"]                                 plain chord (custom actions)
+#   [{"hotkey": ["ctrl", "shift", "t"]}]          chord
+#   [{"press": "down", "repeat": 5}]              tap, repeated
+#   [{"hold": ["shift"], "steps": [...]}]         keys held around inner steps
+#   [{"down": "alt"}, {"up": "alt"}]              raw edges
+#   [{"text": "Hello!"}]                          typed text (US layout)
+#   [{"delay": 0.2}]                              pause (seconds)
+#
+# Consecutive key steps merge into one batch, so Ctrl+C is a single
+# send_keys() call instead of four pyautogui calls with sleeps in between.
+# Macros run on a worker thread; the vision loop only enqueues them.
+
+MAX_REPEAT = 100
+MAX_DELAY = 5.0
+
+ALIASES = {"control": "ctrl", "cmd": "command", "super": "win", "option": "alt", "spacebar": "space"}
+
+# Shifted characters -> base key on a US layout
+SHIFTED = dict(zip('~!@#$%^&*()_+{}|:"<>?', "`1234567890-=[]\\;',./"))
+
+# Named keys every input backend can inject: pyautogui's KEYBOARD_KEYS less
+# the few X has no keysym for (accept, final, fn), each mapped in
+# core.input_backend.XLIB_KEYSYMS. Specs are checked the same way whether or
+# not a backend exists yet. Single printable ASCII characters are valid too.
+KEY_NAMES = frozenset([
+    "add", "alt", "altleft", "altright", "apps", "backspace",
+    "browserback", "browserfavorites", "browserforward", "browserhome", "browserrefresh", "browsersearch", "browserstop",
+    "capslock", "clear", "command", "convert", "ctrl", "ctrlleft", "ctrlright", "decimal", "del", "delete", "divide",
+    "down", "end", "enter", "esc", "escape", "execute", "hanguel", "hangul", "hanja", "help", "home",
+    "insert", "junja", "kana", "kanji", "launchapp1", "launchapp2", "launchmail", "launchmediaselect", "left",
+    "modechange", "multiply", "nexttrack", "nonconvert", "numlock", "optionleft", "optionright", "pagedown", "pageup",
+    "pause", "pgdn", "pgup", "playpause", "prevtrack", "print", "printscreen", "prntscrn", "prtsc", "prtscr", "return",
+    "right", "scrolllock", "select", "separator", "shift", "shiftleft", "shiftright", "sleep", "space", "stop",
+    "subtract", "tab", "up", "volumedown", "volumemute", "volumeup", "win", "winleft", "winright", "yen",
+    *(f"f{i}" for i in range(1, 25)), *(f"num{i}" for i in range(10)),
+])
+
+
+def _key_name(key):
+    if not isinstance(key, str) or not key:
+        raise ValueError(f"Invalid key: {key!r}")
+    if len(key) == 1:
+        if not " " <= key <= "~": raise ValueError(f"Unknown key: {key!r}")
+        return key
+    name = ALIASES.get(key.lower(), key.lower())
+    if name not in KEY_NAMES: raise ValueError(f"Unknown key: {key!r}")
+    return name
+
+
+class MacroEngine:
+    def __init__(self, backend):
+        self.backend = backend
+        self.running = False
+        self.thread = None
+        self._queue = queue.Queue()
+        self._held = set()     # Codes currently down (released when a macro ends or fails)
+        self.executed = 0      # Macros run (for benchmarks)
+        self.compile_hotkey = lru_cache(maxsize=128)(self._compile_hotkey)
+
+    # ---------------- COMPILE ----------------
+    def compile(self, spec):
+        """Returns a tuple of steps: ("keys", ((code, down), ...)) or ("delay", seconds)."""
+        if not isinstance(spec, (list, tuple)) or not spec:
+            raise ValueError("Macro must be a non-empty list of steps")
+        if all(isinstance(step, str) for step in spec):
+            spec = [{"hotkey": list(spec)}]
+
+        steps = []
+        self._compile_steps(spec, steps)
+
+        # Merge adjacent key batches
+        merged = []
+        for kind, value in steps:
+            if kind == "keys" and merged and merged[-1][0] == "keys":
+                merged[-1] = ("keys", merged[-1][1] + value)
+            elif kind == "delay" and merged and merged[-1][0] == "delay":
+                merged[-1] = ("delay", merged[-1][1] + value)
+            else:
+                merged.append((kind, value))
+        return tuple(merged)
+
+    def _compile_steps(self, spec, out):
+        for step in spec:
+            if isinstance(step, str):
+                step = {"press": step}
+            if not isinstance(step, dict):
+                raise ValueError(f"Invalid macro step: {step!r}")
+
+            repeat = int(step.get("repeat", 1))
+            if not 1 <= repeat <= MAX_REPEAT:
+                raise ValueError(f"repeat must be between 1 and {MAX_REPEAT}")
+
+            body = []
+            if "hotkey" in step:
+                codes = [self._resolve(k) for k in step["hotkey"]]
+                body.append(("keys", tuple((c, True) for c in codes) + tuple((c, False) for c in reversed(codes))))
+            elif "press" in step:
+                code = self._resolve(step["press"])
+                body.append(("keys", ((code, True), (code, False))))
+            elif "down" in step:
+                body.append(("keys", ((self._resolve(step["down"]), True),)))
+            elif "up" in step:
+                body.append(("keys", ((self._resolve(step["up"]), False),)))
+            elif "text" in step:
+                body.append(("keys", self._compile_text(str(step["text"]))))
+            elif "delay" in step:
+                delay = float(step["delay"])
+                if not 0 <= delay <= MAX_DELAY:
+                    raise ValueError(f"delay must be between 0 and {MAX_DELAY} s")
+                body.append(("delay", delay))
+            elif "hold" in step:
+                held = step["hold"] if isinstance(step["hold"], list) else [step["hold"]]
+                codes = [self._resolve(k) for k in held]
+                body.append(("keys", tuple((c, True) for c in codes)))
+                self._compile_steps(step.get("steps", []), body)
+                body.append(("keys", tuple((c, False) for c in reversed(codes))))
+            else:
+                raise ValueError(f"Invalid macro step: {step!r}")
+
+            for _ in range(repeat):
+                out.extend(body)
+
+    def _compile_text(self, text):
+        shift = self._resolve("shift")
+        events = []
+        for ch in text:
+            key = {"\n": "enter", "\t": "tab", " ": "space"}.get(ch, ch)
+            base = SHIFTED.get(key, key.lower() if key.isupper() else key)
+            code = self._resolve(base)
+            if base != key:
+                events += [(shift, True), (code, True), (code, False), (shift, False)]
+            else:
+                events += [(code, True), (code, False)]
+        return tuple(events)
+
+    def _resolve(self, key):
+        if self.backend is None: return _key_name(key)  # Compile-only (validation)
+        return self.backend.resolve(_key_name(key))
+
+    def _compile_hotkey(self, *keys):
+        return self.compile(list(keys))
+
+    # ---------------- RUN ----------------
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self._queue.put(None)
+        if self.thread: self.thread.join()
+        self.thread = None
+
+    def run(self, macro):
+        """Queue a compiled macro (or a spec, compiled here). Never blocks on injection."""
+        if macro and not (isinstance(macro[0], tuple) and macro[0][0] in ("keys", "delay")):
+            macro = self.compile(macro)
+        self._queue.put(macro)
+
+    def press_hotkey(self, *keys):
+        self.run(self.compile_hotkey(*keys))
+
+    def execute(self, macro):
+        """Run a compiled macro on the calling thread."""
+        try:
+            for kind, value in macro:
+                if kind == "keys":
+                    self.backend.send_keys(value)
+                    for code, down in value:
+                        if down: self._held.add(code)
+                        else: self._held.discard(code)
+                else:
+                    time.sleep(value)
+        finally:
+            if self._held:
+                # Never leave a modifier stuck down
+                try: self.backend.send_keys([(code, False) for code in self._held])
+                except Exception: pass
+                self._held.clear()
+        self.executed += 1
+
+    def _run_loop(self):
+        while self.running:
+            macro = self._queue.get()
+            if macro is None: continue
+            try: self.execute(macro)
+            except Exception as e: print(f"Macro Error: {e}")
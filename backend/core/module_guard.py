@@ -0,0 +1,135 @@
+import math
+import time
+
+# --- GESTURE MODULE GUARD ---
+# Every gesture module's process() goes through call(), which times it and
+# isolates its failures:
+#   - time budget: each module keeps an EMA of its call time. A module that
+#     costs more than budget_ms per call only runs every Nth frame, with
+#     N = ceil(cost / budget) (at most max_stride), so its average share of
+#     the frame stays near the budget. N drops back as the cost falls.
+#     One call counts as at most OUTLIER_FACTOR budgets in the EMA, so a
+#     single slow call cannot throttle a module for the next second
+#   - circuit breaker: failure_limit exceptions in a row open the breaker
+#     and the module is skipped for `cooldown` seconds. Then a single probe
+#     call runs (half open): success closes the breaker, another failure
+#     opens it again for twice as long (up to max_cooldown)
+# A skipped or failed call returns None; the caller treats it as "no
+# gesture this frame".
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+OUTLIER_FACTOR = 4
+
+
+class _Module:
+    __slots__ = ("state", "frames", "calls", "skipped", "errors", "failures", "trips", "cost_ms", "max_ms",
+                 "stride", "cooldown", "retry_at", "last_error")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.frames = 0           # call() invocations
+        self.calls = 0            # Of those, actually run
+        self.skipped = 0          # Throttled or breaker open
+        self.errors = 0
+        self.failures = 0         # Consecutive exceptions
+        self.trips = 0
+        self.cost_ms = 0.0        # EMA of the call time
+        self.max_ms = 0.0
+        self.stride = 1           # Runs every stride-th frame
+        self.cooldown = 0.0       # Current open period (s)
+        self.retry_at = 0.0
+        self.last_error = None
+
+
+class ModuleGuard:
+    def __init__(self, budget_ms=8.0, max_stride=4, failure_limit=5, cooldown=2.0, max_cooldown=60.0, alpha=0.2,
+                 on_state=None):
+        self.configure(budget_ms, max_stride, failure_limit, cooldown)
+        self.max_cooldown = max_cooldown
+        self.alpha = alpha            # Weight of each call in the cost EMA
+        self.on_state = on_state      # on_state(name, state) on breaker transitions
+        self._modules = {}
+
+    def configure(self, budget_ms=None, max_stride=None, failure_limit=None, cooldown=None):
+        if budget_ms is not None:
+            if not 0 <= budget_ms <= 1000: raise ValueError("budget_ms must be 0-1000 (0 = no throttling)")
+            self.budget_ms = budget_ms
+        if max_stride is not None:
+            if not 1 <= max_stride <= 30: raise ValueError("max_stride must be 1-30")
+            self.max_stride = max_stride
+        if failure_limit is not None:
+            if not 1 <= failure_limit <= 1000: raise ValueError("failure_limit must be 1-1000")
+            self.failure_limit = failure_limit
+        if cooldown is not None:
+            if not 0 < cooldown <= 600: raise ValueError("cooldown must be in (0, 600] seconds")
+            self.cooldown = cooldown
+
+    def config(self):
+        return {"budget_ms": self.budget_ms, "max_stride": self.max_stride, "failure_limit": self.failure_limit,
+                "cooldown": self.cooldown}
+
+    def stats(self):
+        return {name: {"state": m.state, "calls": m.calls, "skipped": m.skipped, "errors": m.errors, "trips": m.trips,
+                       "cost_ms": round(m.cost_ms, 3), "max_ms": round(m.max_ms, 3), "stride": m.stride,
+                       "last_error": m.last_error}
+                for name, m in list(self._modules.items())}
+
+    def reset(self, name=None):
+        """Close the breaker(s) and forget the costs. Raises KeyError for an unknown module."""
+        names = list(self._modules) if name is None else [name]
+        for n in names:
+            previous = self._modules[n].state
+            self._modules[n] = _Module()
+            if previous != CLOSED: self._notify(n, CLOSED)
+
+    # ---------------- PER FRAME ----------------
+    def call(self, name, fn, *args):
+        """fn(*args), or None when the module is throttled, its breaker is open, or it raised."""
+        m = self._modules.get(name)
+        if m is None: m = self._modules[name] = _Module()
+        m.frames += 1
+        if m.state == OPEN:
+            if time.monotonic() < m.retry_at:
+                m.skipped += 1
+                return None
+            m.state = HALF_OPEN  # Probe: this call decides
+            self._notify(name, HALF_OPEN)
+        elif m.frames % m.stride:
+            m.skipped += 1
+            return None
+
+        m.calls += 1
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception as e:
+            self._failed(name, m, e)
+            return None
+        elapsed = (time.perf_counter() - start) * 1000
+
+        sample = min(elapsed, OUTLIER_FACTOR * self.budget_ms) if self.budget_ms else elapsed
+        m.cost_ms = sample if m.calls == 1 else m.cost_ms + self.alpha * (sample - m.cost_ms)
+        m.max_ms = max(m.max_ms, elapsed)
+        m.stride = min(self.max_stride, max(1, math.ceil(m.cost_ms / self.budget_ms))) if self.budget_ms else 1
+        m.failures = 0
+        if m.state == HALF_OPEN:
+            m.state, m.cooldown = CLOSED, 0.0
+            self._notify(name, CLOSED)
+        return result
+
+    def _failed(self, name, m, error):
+        m.errors += 1
+        m.failures += 1
+        m.last_error = f"{type(error).__name__}: {error}"
+        if m.state == HALF_OPEN or m.failures >= self.failure_limit:
+            m.cooldown = min(m.cooldown * 2, self.max_cooldown) if m.state == HALF_OPEN else self.cooldown
+            m.state = OPEN
+            m.retry_at = time.monotonic() + m.cooldown
+            m.trips += 1
+            print(f"Gesture Module {name} Disabled for {m.cooldown:.1f}s: {m.last_error}")
+            self._notify(name, OPEN)
+
+    def _notify(self, name, state):
+        if self.on_state is None: return
+        try: self.on_state(name, state)
+        except Exception: pass
@@ -0,0 +1,78 @@
+import numpy as np
+
+# --- TIMESTAMPED MOTION ---
+# Positions are stored with their capture time, so velocities come out in
+# normalized image units per second whatever the camera rate: a swipe is
+# the same swipe at 15, 30 or 60 fps, or with frames skipped under load.
+# Velocity is the least-squares slope over the samples of the last
+# `window` seconds (less noisy than a two-point difference), acceleration
+# twice the quadratic coefficient of a parabola fit.
+# Below the rate at which a window holds enough samples (about 10 fps for
+# 100 ms) the fit falls back to the newest samples instead, as long as no
+# frame gap among them exceeds MAX_GAP; a longer gap is a lost hand, and
+# gives None.
+
+MAX_GAP = 0.25  # Seconds between frames still read as one motion (4 fps)
+
+
+class MotionTrack:
+    def __init__(self, capacity=32):
+        self._t = np.zeros(capacity)
+        self._xy = np.zeros((capacity, 2))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._count = 0
+
+    def push(self, t, x, y):
+        i = self._next
+        self._t[i] = t
+        self._xy[i] = (x, y)
+        self._next = (i + 1) % len(self._t)
+        self._count = min(self._count + 1, len(self._t))
+
+    def last(self):
+        """Newest (x, y)."""
+        x, y = self._xy[self._next - 1]
+        return float(x), float(y)
+
+    def _recent(self, window, minimum=2):
+        """
+        (t relative to the newest sample, xy) of the samples within `window`
+        seconds, oldest first; at least the newest `minimum` while no frame
+        gap among them exceeds MAX_GAP.
+        """
+        order = (np.arange(self._next - self._count, self._next)) % len(self._t)
+        t = self._t[order] - self._t[order[-1]]
+        start = int(np.searchsorted(t, -window))
+        while len(t) - start < minimum and start > 0 and t[start] - t[start - 1] <= MAX_GAP: start -= 1
+        return t[start:], self._xy[order][start:]
+
+    def span(self, window):
+        """Seconds covered by the samples within `window` (by the newest two at a low frame rate)."""
+        if not self._count: return 0.0
+        t, _ = self._recent(window)
+        return float(-t[0])
+
+    def velocity(self, window=0.1):
+        """(vx, vy) in units/s over the last `window` seconds, or None without 2 samples MAX_GAP apart at most."""
+        if self._count < 2: return None
+        t, xy = self._recent(window)
+        if len(t) < 2: return None
+        tc = t - t.mean()
+        denominator = tc @ tc
+        if denominator <= 0: return None
+        vx, vy = tc @ (xy - xy.mean(axis=0)) / denominator
+        return float(vx), float(vy)
+
+    def acceleration(self, window=0.2):
+        """(ax, ay) in units/s^2 over the last `window` seconds, or None without 3 samples MAX_GAP apart at most."""
+        if self._count < 3: return None
+        t, xy = self._recent(window, 3)
+        if len(t) < 3 or t[0] == t[-1]: return None
+        ax, ay = np.polyfit(t, xy, 2)[0] * 2
+        return float(ax), float(ay)
@@ -0,0 +1,102 @@
+import time
+
+import numpy as np
+
+# --- MOTION GATE ---
+# A nearly still hand (holding a volume level, resting on the text
+# joystick) gives the landmarker the same picture frame after frame. Before
+# each detect() the gate compares a downscaled grayscale copy of the frame
+# with the one from the last real detection, inside the hand's bounding
+# box (plus a margin). If almost no pixels changed, the last result is
+# reused.
+#
+# Limits on staleness: at most max_reuse reuses in a row, and none once the
+# last detection is older than max_age seconds. Comparing against the last
+# detected frame rather than the previous frame means slow drift builds up
+# and forces a refresh as well. With no hand in view the gate always
+# detects; that case is about detecting new hands, not saving work.
+
+class MotionGate:
+    def __init__(self, max_reuse=0, max_age=0.5, threshold=0.02, noise=12, scale=0.25, margin=0.25):
+        self.configure(max_reuse, max_age, threshold, noise)
+        self.scale = scale      # Downscale factor for the comparison image
+        self.margin = margin    # ROI padding, as a fraction of the hand's box size
+        self._cv = None         # cv2, imported on first use
+        self.result = None      # Last real detection
+        self._reference = None  # Downscaled gray frame of that detection
+        self._roi = None
+        self._reused = 0
+        self._detected_at = 0.0
+        self.checks = 0
+        self.hits = 0
+        self.forced = 0         # Refreshes due to max_reuse / max_age
+
+    def configure(self, max_reuse=None, max_age=None, threshold=None, noise=None):
+        if max_reuse is not None:
+            if not 0 <= max_reuse <= 60: raise ValueError("max_reuse must be 0-60 (0 = off)")
+            self.max_reuse = max_reuse
+        if max_age is not None:
+            if not 0 < max_age <= 5: raise ValueError("max_age must be in (0, 5] seconds")
+            self.max_age = max_age
+        if threshold is not None:
+            if not 0 < threshold < 1: raise ValueError("threshold must be in (0, 1)")
+            self.threshold = threshold  # Fraction of ROI pixels that may change
+        if noise is not None:
+            if not 0 <= noise <= 255: raise ValueError("noise must be 0-255")
+            self.noise = noise  # Gray levels of difference that count as sensor noise
+
+    def config(self):
+        return {"max_reuse": self.max_reuse, "max_age": self.max_age, "threshold": self.threshold, "noise": self.noise}
+
+    @property
+    def enabled(self):
+        return self.max_reuse > 0
+
+    def stats(self):
+        return {"checks": self.checks, "hits": self.hits, "forced": self.forced,
+                "hit_rate": self.hits / self.checks if self.checks else 0.0}
+
+    def reset(self):
+        self.result = self._reference = self._roi = None
+        self._reused = 0
+
+    # ---------------- PER DETECTION ----------------
+    def reuse(self, gray):
+        """True if the last result (self.result) still describes `gray`."""
+        if not self.enabled or self._roi is None: return False
+        self.checks += 1
+        if self._reused >= self.max_reuse or time.monotonic() - self._detected_at > self.max_age:
+            self.forced += 1
+            return False
+        small = self._downscale(gray)
+        if small.shape != self._reference.shape: return False
+        rows, cols = self._roi
+        diff = self._cv.absdiff(small[rows, cols], self._reference[rows, cols])
+        if np.count_nonzero(diff > self.noise) > self.threshold * diff.size: return False
+        self._reused += 1
+        self.hits += 1
+        return True
+
+    def update(self, gray, result):
+        """Record a real detection on `gray` (None when the gate is off)."""
+        self._reused = 0
+        if gray is None or not self.enabled or not result.hand_landmarks:
+            self._roi = None
+            return
+        self.result = result
+        self._detected_at = time.monotonic()
+        self._reference = self._downscale(gray)
+        h, w = self._reference.shape[:2]
+        xs = [l.x for hand in result.hand_landmarks for l in hand]
+        ys = [l.y for hand in result.hand_landmarks for l in hand]
+        pad_x = (max(xs) - min(xs)) * self.margin
+        pad_y = (max(ys) - min(ys)) * self.margin
+        x0, x1 = int(max(0.0, min(xs) - pad_x) * w), int(min(1.0, max(xs) + pad_x) * w) + 1
+        y0, y1 = int(max(0.0, min(ys) - pad_y) * h), int(min(1.0, max(ys) + pad_y) * h) + 1
+        self._roi = (slice(y0, y1), slice(x0, x1)) if x1 > x0 and y1 > y0 else None
+
+    def _downscale(self, gray):
+        if self._cv is None:
+            import cv2
+            self._cv = cv2
+        return self._cv.resize(gray, None, fx=self.scale, fy=self.scale, interpolation=self._cv.INTER_AREA)
@@ -0,0 +1,196 @@
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# --- SCREENSHOT SERVICE ---
+# capture() only reserves a slot and returns; the grab, encode and disk
+# write all happen off the vision thread:
+#   grab + encode  -> worker pool (mss and cv2.imencode release the GIL)
+#   write          -> one writer thread fed by a bounded queue (write-behind)
+# Thumbnails for the API are generated lazily on first request and cached.
+# cv2 / mss are imported on first use so constructing the service is free.
+
+FORMATS = {"png": ".png", "webp": ".webp", "raw": ".bmp"}  # raw: uncompressed BMP
+PREFIX = "GestureOS_"
+
+
+class ScreenshotService:
+    def __init__(self, save_dir, fmt="png", png_level=1, webp_quality=90, workers=2, max_pending=4,
+                 history=50, thumbnail_size=256):
+        self.save_dir = save_dir
+        self.configure(fmt, png_level, webp_quality)
+        self.workers = workers
+        self.max_pending = max_pending    # Captures in flight; capture() refuses beyond this
+        self.thumbnail_size = thumbnail_size
+
+        self.running = False
+        self._pool = None
+        self._writer = None
+        self._writes = queue.Queue(maxsize=max_pending)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._local = threading.local()   # One mss grabber per worker thread
+        self._dir_ready = False
+        self._last_stamp, self._burst = None, 0  # Unique names within one millisecond
+
+        self._recent = deque(maxlen=history)
+        self._scanned = False
+        self._thumbnails = OrderedDict()  # capture id -> JPEG bytes (LRU)
+        self._lock = threading.Lock()
+
+    def configure(self, fmt=None, png_level=None, webp_quality=None):
+        if fmt is not None:
+            if fmt not in FORMATS: raise ValueError(f"Unknown format: {fmt}")
+            self.fmt = fmt
+        if png_level is not None:
+            if not 0 <= png_level <= 9: raise ValueError("png_level must be 0-9")
+            self.png_level = png_level
+        if webp_quality is not None:
+            if not 1 <= webp_quality <= 101: raise ValueError("webp_quality must be 1-101 (101 = lossless)")
+            self.webp_quality = webp_quality
+
+    def config(self):
+        return {"format": self.fmt, "png_level": self.png_level, "webp_quality": self.webp_quality}
+
+    # ---------------- LIFECYCLE ----------------
+    def start(self):
+        if self.running: return
+        self.running = True
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="screenshot")
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def stop(self):
+        """Finish in-flight captures and flush pending writes to disk."""
+        if not self.running: return
+        self._pool.shutdown(wait=True)
+        self.running = False
+        self._writes.put(None)
+        self._writer.join()
+        self._pool = self._writer = None
+
+    # ---------------- CAPTURE ----------------
+    def capture(self):
+        """Non-blocking. Returns False if the service is stopped or too many captures are pending."""
+        if not self.running or not self._slots.acquire(blocking=False):
+            return False
+        taken = time.time()
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(taken)) + f"_{int(taken * 1000) % 1000:03d}"
+        self._burst = self._burst + 1 if stamp == self._last_stamp else 0
+        self._last_stamp = stamp
+        name = f"{PREFIX}{stamp}" + (f"-{self._burst}" if self._burst else "")
+        try: self._pool.submit(self._capture_job, name, taken, self.fmt)
+        except RuntimeError:
+            self._slots.release()
+            return False
+        return True
+
+    def _grab(self):
+        grabber = getattr(self._local, "mss", None)
+        if grabber is None:
+            try:
+                import mss
+                grabber = self._local.mss = mss.mss()
+            except ImportError:
+                import cv2
+                import pyautogui
+                return cv2.cvtColor(np.asarray(pyautogui.screenshot()), cv2.COLOR_RGB2BGR)
+        shot = grabber.grab(grabber.monitors[0])
+        return np.asarray(shot)[:, :, :3]  # BGRA -> BGR view
+
+    def _encode(self, image, fmt):
+        import cv2
+        if fmt == "png": params = [cv2.IMWRITE_PNG_COMPRESSION, self.png_level]
+        elif fmt == "webp": params = [cv2.IMWRITE_WEBP_QUALITY, self.webp_quality]
+        else: params = []
+        ok, buffer = cv2.imencode(FORMATS[fmt], np.ascontiguousarray(image), params)
+        if not ok: raise RuntimeError(f"{fmt} encoding failed")
+        return buffer.tobytes()
+
+    def _capture_job(self, capture_id, taken, fmt):
+        try:
+            image = self._grab()
+            data = self._encode(image, fmt)
+            name = capture_id + FORMATS[fmt]
+            entry = {
+                "id": capture_id, "filename": name, "path": os.path.join(self.save_dir, name),
+                "time": taken, "width": image.shape[1], "height": image.shape[0], "size": len(data), "format": fmt,
+            }
+            self._writes.put((entry, data))  # Slot is released once written
+        except Exception as e:
+            print(f"Screenshot Error: {e}")
+            self._slots.release()
+
+    def _write_loop(self):
+        while True:
+            item = self._writes.get()
+            if item is None: break
+            entry, data = item
+            try:
+                if not self._dir_ready:
+                    os.makedirs(self.save_dir, exist_ok=True)
+                    self._dir_ready = True
+                with open(entry["path"], "wb") as f: f.write(data)
+                with self._lock: self._recent.appendleft(entry)
+            except OSError as e: print(f"Screenshot Write Error: {e}")
+            finally: self._slots.release()
+
+    # ---------------- HISTORY ----------------
+    def recent(self, limit=20):
+        """Most recent captures first (seeded once from files already on disk)."""
+        with self._lock:
+            if not self._scanned:
+                self._scanned = True
+                self._scan()
+            return list(self._recent)[:limit]
+
+    def _scan(self):
+        try: names = os.listdir(self.save_dir)
+        except OSError: return
+        known = {e["filename"] for e in self._recent}
+        found = []
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if not name.startswith(PREFIX) or ext not in FORMATS.values() or name in known: continue
+            path = os.path.join(self.save_dir, name)
+            try: stat = os.stat(path)
+            except OSError: continue
+            found.append({"id": stem, "filename": name, "path": path, "time": stat.st_mtime,
+                          "width": None, "height": None, "size": stat.st_size,
+                          "format": next(k for k, v in FORMATS.items() if v == ext)})
+        found.sort(key=lambda e: e["time"], reverse=True)
+        for entry in found[:self._recent.maxlen - len(self._recent)]:
+            self._recent.append(entry)
+
+    def get(self, capture_id):
+        return next((e for e in self.recent(self._recent.maxlen) if e["id"] == capture_id), None)
+
+    def thumbnail(self, capture_id):
+        """JPEG thumbnail bytes (generated on first request, then cached), or None."""
+        with self._lock:
+            cached = self._thumbnails.get(capture_id)
+            if cached is not None:
+                self._thumbnails.move_to_end(capture_id)
+                return cached
+        entry = self.get(capture_id)
+        if entry is None: return None
+
+        import cv2
+        image = cv2.imread(entry["path"], cv2.IMREAD_REDUCED_COLOR_4)
+        if image is None: return None
+        scale = self.thumbnail_size / max(image.shape[:2])
+        if scale < 1:
+            image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        if not ok: return None
+
+        data = buffer.tobytes()
+        with self._lock:
+            self._thumbnails[capture_id] = data
+            while len(self._thumbnails) > self._recent.maxlen:
+                self._thumbnails.popitem(last=False)
+        return data
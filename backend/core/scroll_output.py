@@ -0,0 +1,101 @@
+import math
+import threading
+import time
+
+
+class ScrollOutput:
+    """
+    Smooth wheel scrolling at a fixed cadence, independent of camera fps.
+    The vision thread publishes a scroll velocity (notches/s) with update();
+    a worker thread integrates it every tick into wheel units (the backend's
+    wheel_resolution per notch: 120 on Windows, whole notches elsewhere) and
+    injects only once a useful batch (1/8 notch, at least one unit) has
+    built up. After release() the last velocity keeps scrolling and decays
+    exponentially (fling), so a flick coasts like a touchpad.
+    """
+
+    def __init__(self, backend, rate_hz=120, catch_up=0.35, fling_tau=0.35, fling_min=2.0, stop_velocity=0.5,
+                 hold_timeout=0.15):
+        self.backend = backend
+        self.rate_hz = rate_hz
+        self.catch_up = catch_up          # Fraction of the velocity change applied per tick while tracking
+        self.fling_tau = fling_tau        # Seconds for the fling velocity to fall to 1/e
+        self.fling_min = fling_min        # Notches/s needed at release to fling at all
+        self.stop_velocity = stop_velocity  # Notches/s below which output stops
+        self.hold_timeout = hold_timeout  # No update for this long counts as a release (hand lost)
+
+        self.running = False
+        self.thread = None
+        self._sample = None               # (velocity, t) - replaced atomically; None = released
+        self._wake = threading.Event()
+        self.calls = 0                    # Backend wheel calls made
+        self.units = 0                    # Wheel units sent
+
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+        if self.thread: self.thread.join()
+        self.thread = None
+
+    def update(self, velocity, t=None):
+        """velocity: notches/s, positive scrolls up."""
+        self._sample = (velocity, time.perf_counter() if t is None else t)
+        self._wake.set()
+
+    def release(self):
+        """Gesture ended: fling from the current velocity."""
+        self._sample = None
+
+    def _run_loop(self):
+        period = 1.0 / self.rate_hz
+        resolution = getattr(self.backend, "wheel_resolution", 1)
+        quantum = max(1, resolution // 8)
+        velocity = 0.0
+        pending = 0.0     # Wheel units integrated but not sent yet
+        flinging = False
+        last = next_tick = time.perf_counter()
+
+        while self.running:
+            sample = self._sample
+            now = time.perf_counter()
+            dt, last = now - last, now
+
+            active = sample is not None and now - sample[1] <= self.hold_timeout
+            if active:
+                velocity += (sample[0] - velocity) * self.catch_up
+                flinging = abs(velocity) >= self.fling_min  # Whether a release now coasts
+            elif flinging:
+                velocity *= math.exp(-dt / self.fling_tau)
+            else:
+                velocity = 0.0
+
+            if not active and abs(velocity) < self.stop_velocity:
+                # Idle: sleep until the next update
+                velocity, pending, flinging = 0.0, 0.0, False
+                self._wake.clear()
+                sample = self._sample  # Re-check: an update may have raced the clear
+                if sample is None or time.perf_counter() - sample[1] > self.hold_timeout:
+                    self._wake.wait()
+                last = next_tick = time.perf_counter()
+                continue
+
+            pending += velocity * resolution * dt
+            if abs(pending) >= quantum:
+                units = int(pending)
+                pending -= units
+                try:
+                    self.backend.wheel(units)
+                    self.calls += 1
+                    self.units += units
+                except Exception: pass
+
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay > 0: time.sleep(delay)
+            else: next_tick = time.perf_counter()
@@ -0,0 +1,164 @@
+import numpy as np
+
+# --- STREAMING MOTION TEMPLATE MATCHER ---
+# One shared ring buffer of per-frame feature vectors (palm position in palm
+# units). Every template is resampled to the same length, so each frame does:
+#   1. one z-normalization of the latest window
+#   2. one vectorized LB_Keogh over ALL templates (a single numpy expression)
+#   3. early-abandoning banded DTW only for templates whose lower bound is
+#      still under their threshold, best bound first
+# Adding templates grows step 2 by one row, not the per-frame Python work.
+
+WINDOW = 24         # Frames per template / query window
+BAND = 3            # Sakoe-Chiba radius (frames)
+MIN_EXTENT = 1.0    # Ignore windows whose path spans less than this (palm units)
+
+
+def resample(points, length=WINDOW):
+    """Resample a (N, D) path to `length` points, evenly spaced along arc length."""
+    points = np.asarray(points, dtype=np.float32)
+    seg = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    dist = np.concatenate([[0.0], np.cumsum(seg)])
+    if dist[-1] == 0:
+        return np.repeat(points[:1], length, axis=0)
+    targets = np.linspace(0, dist[-1], length)
+    return np.stack([np.interp(targets, dist, points[:, d]) for d in range(points.shape[1])], axis=1).astype(np.float32)
+
+
+def znorm(seq):
+    """Translation- and scale-invariant copy: zero mean, unit RMS (one scale for all axes)."""
+    centered = seq - seq.mean(axis=0)
+    scale = np.sqrt((centered ** 2).sum(axis=1).mean())
+    return centered / scale if scale > 1e-6 else centered
+
+
+def circle_template(clockwise=True, turns=1.0, length=WINDOW):
+    """Procedural circle path (image coordinates: y grows downward)."""
+    angles = np.linspace(0, 2 * np.pi * turns, length)
+    sign = 1 if clockwise else -1
+    return np.stack([np.cos(angles), sign * np.sin(angles)], axis=1)
+
+
+def dtw_early_abandon(query, template, band, limit):
+    """
+    Banded DTW (squared Euclidean cost). Returns the distance, or inf as soon
+    as every cell of a row exceeds `limit`.
+    """
+    n = len(query)
+    cost = ((query[:, None, :] - template[None, :, :]) ** 2).sum(axis=2).tolist()
+    inf = float("inf")
+    prev = [inf] * n
+    for i in range(n):
+        row = [inf] * n
+        row_min = inf
+        lo, hi = max(0, i - band), min(n, i + band + 1)
+        for j in range(lo, hi):
+            if i == 0 and j == 0:
+                best = 0.0
+            else:
+                best = min(prev[j], row[j - 1] if j > 0 else inf, prev[j - 1] if j > 0 else inf)
+            val = cost[i][j] + best
+            row[j] = val
+            if val < row_min: row_min = val
+        if row_min > limit:
+            return inf
+        prev = row
+    return prev[n - 1]
+
+
+class SequenceMatcher:
+    def __init__(self, window=WINDOW, band=BAND, dims=2, min_extent=MIN_EXTENT):
+        self.window = window
+        self.band = band
+        self.min_extent = min_extent
+
+        # Shared ring buffer of feature vectors
+        self._ring = np.zeros((window, dims), dtype=np.float32)
+        self._pos = 0
+        self._count = 0
+
+        # Stacked templates + LB_Keogh envelopes, each (T, window, dims).
+        # Replaced as one tuple so the vision thread never sees a half-added template.
+        empty = np.zeros((0, window, dims), dtype=np.float32)
+        self._bank = ([], np.zeros(0, dtype=np.float32), empty, empty, empty)
+
+    @property
+    def names(self):
+        return list(self._bank[0])
+
+    def add_template(self, name, points, threshold=4.0):
+        """
+        points: (N, dims) path of any scale/length. threshold: max DTW distance (z-normalized units).
+        Raises ValueError for a malformed path or a non-positive threshold.
+        """
+        dims = self._ring.shape[1]
+        try: points = np.asarray(points, dtype=np.float32)
+        except (TypeError, ValueError): raise ValueError(f"points must be a list of [{', '.join('xyz'[:dims])}] pairs")
+        if points.ndim != 2 or points.shape[1] != dims or len(points) < 2:
+            raise ValueError(f"points must be at least two [{', '.join('xyz'[:dims])}] pairs")
+        if not np.isfinite(points).all(): raise ValueError("points must be finite")
+        if not np.any(points != points[0]): raise ValueError("points must not all be the same")
+        if not threshold > 0: raise ValueError("threshold must be > 0")
+        tpl = znorm(resample(points, self.window))
+        windows = np.lib.stride_tricks.sliding_window_view(
+            np.pad(tpl, ((self.band, self.band), (0, 0)), mode="edge"), 2 * self.band + 1, axis=0
+        )
+        upper, lower = windows.max(axis=2), windows.min(axis=2)
+
+        names, thresholds, templates, uppers, lowers = self._without(name)
+        self._bank = (
+            names + [name],
+            np.append(thresholds, np.float32(threshold)),
+            np.concatenate([templates, tpl[None]]),
+            np.concatenate([uppers, upper[None]]),
+            np.concatenate([lowers, lower[None]]),
+        )
+
+    def remove_template(self, name):
+        self._bank = self._without(name)
+
+    def _without(self, name):
+        names, thresholds, templates, uppers, lowers = self._bank
+        if name not in names:
+            return self._bank
+        keep = np.array([n != name for n in names])
+        return ([n for n in names if n != name], thresholds[keep], templates[keep], uppers[keep], lowers[keep])
+
+    def reset(self):
+        self._count = 0
+
+    def push(self, feature):
+        self._ring[self._pos] = feature
+        self._pos = (self._pos + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+
+    def match(self):
+        """Returns the best matching template name for the latest window, or None."""
+        names, thresholds, templates, uppers, lowers = self._bank
+        if not names or self._count < self.window:
+            return None
+
+        query = np.roll(self._ring, -self._pos, axis=0)
+        if np.ptp(query, axis=0).max() < self.min_extent:
+            return None
+        query = znorm(query)
+
+        # LB_Keogh against every template at once
+        above = np.maximum(query[None] - uppers, 0)
+        below = np.maximum(lowers - query[None], 0)
+        bounds = (above ** 2 + below ** 2).sum(axis=(1, 2))
+
+        # Only templates whose lower bound is under their threshold need DTW
+        candidates = np.flatnonzero(bounds <= thresholds)
+        best_name, best_dist = None, float("inf")
+        for i in candidates[np.argsort(bounds[candidates])]:
+            if bounds[i] >= best_dist:
+                break  # Sorted: no remaining candidate can beat the current best
+            limit = min(float(thresholds[i]), best_dist)
+            dist = dtw_early_abandon(query, templates[i], self.band, limit)
+            if dist <= limit:
+                best_name, best_dist = names[i], dist
+
+        if best_name is not None:
+            self.reset()  # Don't re-fire on the same motion
+        return best_name
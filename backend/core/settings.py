@@ -0,0 +1,84 @@
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+# --- VERSIONED SETTINGS SNAPSHOTS ---
+# Gesture settings are immutable. Every change builds a new SettingsSnapshot
+# and publishes it by swapping one reference, so the vision thread reads a
+# consistent view with a single attribute load and no lock. Each snapshot
+# also carries its pre-serialized API body and an ETag, so polling
+# GET /api/gestures costs nothing until the version changes.
+
+EPOCH = int(time.time())  # ETags from a previous server run never match
+
+
+@dataclass(frozen=True, slots=True)
+class GestureConfig:
+    name: str
+    trigger: str
+    enabled: bool = True
+    sensitivity: Optional[float] = 0.7
+    cooldown: Optional[float] = 1.0
+
+    def to_dict(self):
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+FIELDS = frozenset(f.name for f in fields(GestureConfig))
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    version: int
+    gestures: Mapping[str, GestureConfig]
+    body: bytes  # JSON list for GET /api/gestures
+
+    @property
+    def etag(self):
+        return f'"{EPOCH}-{self.version}"'
+
+
+def _snapshot(version, gestures):
+    payload = [{**config.to_dict(), "id": gesture_id} for gesture_id, config in gestures.items()]
+    return SettingsSnapshot(version, MappingProxyType(gestures), json.dumps(payload).encode())
+
+
+class SettingsStore:
+    def __init__(self, gestures):
+        """gestures: {gesture_id: {"name", "trigger", "enabled", ["sensitivity", "cooldown"]}}"""
+        configs = {}
+        for gesture_id, config in gestures.items():
+            defaults = {"sensitivity": None, "cooldown": None}  # Absent keys stay absent
+            configs[gesture_id] = GestureConfig(**{**defaults, **config})
+        self.current = _snapshot(1, configs)
+        self._lock = threading.Lock()  # Serializes writers only
+
+    @property
+    def gestures(self):
+        return self.current.gestures
+
+    def update(self, gesture_id, changes):
+        """
+        Apply known, non-null fields of `changes`. Fields a gesture does not
+        have (None in its config) stay absent. Returns False if the gesture
+        does not exist.
+        """
+        with self._lock:
+            snapshot = self.current
+            config = snapshot.gestures.get(gesture_id)
+            if config is None: return False
+            changes = {k: v for k, v in changes.items() if k in FIELDS and v is not None and getattr(config, k) is not None}
+            updated = replace(config, **changes)
+            if updated != config:
+                self.current = _snapshot(snapshot.version + 1, {**snapshot.gestures, gesture_id: updated})
+            return True
+
+    def add(self, gesture_id, **config):
+        """Register a gesture if it is not known yet."""
+        with self._lock:
+            snapshot = self.current
+            if gesture_id in snapshot.gestures: return
+            self.current = _snapshot(snapshot.version + 1, {**snapshot.gestures, gesture_id: GestureConfig(**config)})
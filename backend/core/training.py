@@ -0,0 +1,188 @@
+import multiprocessing
+import os
+import queue
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import numpy as np
+
+from core.landmark_classifier import LandmarkClassifier, class_regions, landmark_features
+
+# UI stages (match RetrainModel.jsx)
+STAGE_PREPARING, STAGE_TRAINING, STAGE_VALIDATING, STAGE_COMPLETE = 1, 2, 3, 4
+
+
+# ---------------- WORKER (runs in a separate process) ----------------
+def train_classifier(features, labels, num_classes, epochs=60, lr=0.1, l2=1e-3, batch_size=64, progress=None, seed=0):
+    """
+    Mini-batch softmax regression with momentum. CPU-only, numpy-only.
+    Reports {"epoch", "loss", "accuracy"} per epoch to `progress` (a queue).
+    Returns (weights, bias, accuracy, regions) with standardization folded
+    in; regions are the open-set acceptance regions (see class_regions).
+    """
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(labels))
+    features, labels = features[order], labels[order]
+
+    # Hold out 20% for validation (at least one sample when possible)
+    n_val = max(1, len(labels) // 5) if len(labels) >= 5 else 0
+    x_val, y_val = features[:n_val], labels[:n_val]
+    x_train, y_train = features[n_val:], labels[n_val:]
+
+    mean = x_train.mean(axis=0)
+    std = x_train.std(axis=0) + 1e-6
+    x_train = (x_train - mean) / std
+    x_val = (x_val - mean) / std
+
+    w = np.zeros((features.shape[1], num_classes), dtype=np.float32)
+    b = np.zeros(num_classes, dtype=np.float32)
+    vw, vb = np.zeros_like(w), np.zeros_like(b)
+    onehot = np.eye(num_classes, dtype=np.float32)
+
+    accuracy = 0.0
+    for epoch in range(1, epochs + 1):
+        perm = rng.permutation(len(y_train))
+        total_loss = 0.0
+        for start in range(0, len(perm), batch_size):
+            idx = perm[start:start + batch_size]
+            xb, yb = x_train[idx], y_train[idx]
+            logits = xb @ w + b
+            logits -= logits.max(axis=1, keepdims=True)
+            p = np.exp(logits)
+            p /= p.sum(axis=1, keepdims=True)
+            total_loss += float(-np.log(p[np.arange(len(yb)), yb] + 1e-9).sum())
+
+            grad = (p - onehot[yb]) / len(yb)
+            vw = 0.9 * vw + xb.T @ grad + l2 * w
+            vb = 0.9 * vb + grad.sum(axis=0)
+            w -= lr * vw
+            b -= lr * vb
+
+        x_eval, y_eval = (x_val, y_val) if n_val else (x_train, y_train)
+        accuracy = float(((x_eval @ w + b).argmax(axis=1) == y_eval).mean())
+        if progress is not None:
+            progress.put({"epoch": epoch, "loss": total_loss / len(y_train), "accuracy": accuracy})
+
+    # Fold standardization into the weights: ((x - mean) / std) @ w + b
+    weights = w / std[:, None]
+    bias = b - (mean / std) @ w
+    regions = class_regions(features, labels, num_classes)
+    return weights.astype(np.float32), bias.astype(np.float32), accuracy, regions
+
+
+# ---------------- JOBS ----------------
+class TrainingJob:
+    def __init__(self, user_id, gestures, epochs):
+        self.id = str(uuid.uuid4())
+        self.user_id = user_id
+        self.gestures = gestures
+        self.epochs = epochs
+        self.created = datetime.now().isoformat()
+        self.status = "queued"  # queued, running, completed, failed
+        self.events = []        # Append-only; websocket clients stream from an index
+        self.state = {"stage": 0, "progress": 0, "loss": None, "accuracy": None, "samples": 0, "error": None}
+
+    def publish(self, **event):
+        event["seq"] = len(self.events)
+        event["job_id"] = self.id
+        event.setdefault("status", self.status)
+        self.state.update(event)
+        self.events.append(event)
+
+    def snapshot(self):
+        return {
+            "id": self.id, "user_id": self.user_id, "gestures": self.gestures, "epochs": self.epochs,
+            "created": self.created, **self.state, "status": self.status,
+        }
+
+
+class TrainingManager:
+    """
+    Runs training jobs in a single-worker process pool so the vision loop
+    never competes with the GIL. On success the model is saved to model_path
+    and handed to on_model (e.g. GestureEngine.set_classifier) for a hot swap.
+    """
+
+    def __init__(self, store, model_path, on_model=None):
+        self.store = store
+        self.model_path = model_path
+        self.on_model = on_model
+        self.jobs = {}
+        self._executor = None
+        self._mp_manager = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork a process that owns camera / mediapipe threads
+                ctx = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=1, mp_context=ctx)
+                self._mp_manager = ctx.Manager()
+            return self._executor, self._mp_manager
+
+    def create_job(self, user_id="default", gestures=None, epochs=60):
+        job = TrainingJob(user_id, gestures, epochs)
+        self.jobs[job.id] = job
+        job.publish(stage=0, progress=0)
+        threading.Thread(target=self._run_job, args=(job,), daemon=True).start()
+        return job
+
+    def _load_samples(self, job):
+        names = job.gestures or self.store.list_profiles(job.user_id)
+        features, labels, classes = [], [], []
+        for name in names:
+            profile = self.store.load(job.user_id, name)
+            if profile is None or len(profile.frames) == 0: continue
+            features.append(landmark_features(profile.frames))
+            labels.append(np.full(len(profile.frames), len(classes), dtype=np.int64))
+            classes.append(name)
+        if len(classes) < 2:
+            raise ValueError("Need calibration samples for at least two gestures")
+        return np.concatenate(features), np.concatenate(labels), classes
+
+    def _run_job(self, job):
+        job.status = "running"
+        try:
+            job.publish(stage=STAGE_PREPARING, progress=0)
+            features, labels, classes = self._load_samples(job)
+            samples = len(labels)
+            job.publish(stage=STAGE_PREPARING, progress=10, samples=samples)
+
+            executor, mp_manager = self._pool()
+            progress = mp_manager.Queue()
+            future = executor.submit(train_classifier, features, labels, len(classes), job.epochs, progress=progress)
+
+            while True:
+                try: update = progress.get(timeout=0.1)
+                except queue.Empty:
+                    if future.done(): break
+                    continue
+                pct = 10 + int(80 * update["epoch"] / job.epochs)
+                job.publish(stage=STAGE_TRAINING, progress=pct, samples=samples, **update)
+
+            weights, bias, accuracy, regions = future.result()
+            job.publish(stage=STAGE_VALIDATING, progress=95, samples=samples, accuracy=accuracy)
+
+            classifier = LandmarkClassifier(classes, weights, bias, metrics={"accuracy": accuracy, "samples": samples},
+                                            regions=regions)
+            os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+            classifier.save(self.model_path)
+            if self.on_model: self.on_model(classifier)
+
+            job.status = "completed"
+            job.publish(stage=STAGE_COMPLETE, progress=100, samples=samples, accuracy=accuracy, classes=classes)
+        except BrokenProcessPool as e:
+            with self._lock: self._executor = None  # Recreated on the next job
+            job.status = "failed"
+            job.publish(stage=0, progress=0, error=str(e) or "Training worker crashed")
+        except Exception as e:
+            job.status = "failed"
+            job.publish(stage=0, progress=0, error=str(e) or type(e).__name__)
+
+    def shutdown(self):
+        if self._executor: self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._mp_manager: self._mp_manager.shutdown()
@@ -0,0 +1,278 @@
+import platform
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+# --- SYSTEM VOLUME BACKENDS ---
+# Backends expose read() -> int percent (or None) and write(percent).
+# VolumeService wraps one of them in a single worker thread that caches the
+# level and coalesces set requests, so the vision loop never blocks or forks.
+
+system_os = platform.system()
+
+# Conditional imports for Windows
+if system_os == "Windows":
+    try:
+        import comtypes
+        from ctypes import cast, POINTER
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        # Fallback COM Definitions
+        CLSID_MMDeviceEnumerator = comtypes.GUID("{BCDE0395-E52F-467C-8E3D-C4579291692E}")
+        IMMDeviceEnumerator_ID = comtypes.GUID("{A95664D2-9614-4F35-A746-DE8DB63617E6}")
+        IMMDevice_ID = comtypes.GUID("{D666063F-1587-4E43-81F1-B948E807363F}")
+
+        class IMMDeviceEnumerator(comtypes.IUnknown):
+            _iid_ = IMMDeviceEnumerator_ID
+            _methods_ = [
+                comtypes.COMMETHOD([], comtypes.HRESULT, "EnumAudioEndpoints", (["in"], comtypes.c_int, "dataFlow"), (["in"], comtypes.c_int, "dwStateMask"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppDevices")),
+                comtypes.COMMETHOD([], comtypes.HRESULT, "GetDefaultAudioEndpoint", (["in"], comtypes.c_int, "dataFlow"), (["in"], comtypes.c_int, "role"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppEndpoint"))
+            ]
+        class IMMDevice(comtypes.IUnknown):
+            _iid_ = IMMDevice_ID
+            _methods_ = [
+                comtypes.COMMETHOD([], comtypes.HRESULT, "Activate", (["in"], POINTER(comtypes.GUID), "iid"), (["in"], comtypes.c_int, "dwClsCtx"), (["in"], POINTER(comtypes.IUnknown), "pActivationParams"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppInterface")),
+                comtypes.COMMETHOD([], comtypes.HRESULT, "OpenPropertyStore", (["in"], comtypes.c_int, "stgmAccess"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppProperties")),
+                comtypes.COMMETHOD([], comtypes.HRESULT, "GetId", (["out"], POINTER(comtypes.c_wchar_p), "ppstrId")),
+                comtypes.COMMETHOD([], comtypes.HRESULT, "GetState", (["out"], POINTER(comtypes.c_int), "pdwState"))
+            ]
+    except ImportError:
+        print("⚠️ Warning: Windows audio libraries not found.")
+
+try:
+    import pulsectl
+    PULSECTL_AVAILABLE = True
+except ImportError:
+    PULSECTL_AVAILABLE = False
+
+
+class WindowsVolumeBackend:
+    name = "windows"
+
+    def __init__(self):
+        # COM objects are apartment-bound: created lazily on the worker thread
+        self.volume_interface = None
+
+    def _connect(self):
+        try: comtypes.CoInitialize()
+        except: pass
+
+        try:
+            # Method A: Standard
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            self.volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
+            return
+        except Exception: pass
+
+        # Method B: Fallback
+        enumerator = comtypes.CoCreateInstance(CLSID_MMDeviceEnumerator, IMMDeviceEnumerator, comtypes.CLSCTX_INPROC_SERVER)
+        device_unknown = enumerator.GetDefaultAudioEndpoint(0, 1)
+        device = device_unknown.QueryInterface(IMMDevice)
+        interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        self.volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
+
+    def read(self):
+        if self.volume_interface is None: self._connect()
+        return int(round(self.volume_interface.GetMasterVolumeLevelScalar() * 100))
+
+    def write(self, percent):
+        if self.volume_interface is None: self._connect()
+        self.volume_interface.SetMasterVolumeLevelScalar(percent / 100.0, None)
+
+    def close(self):
+        self.volume_interface = None
+
+
+class MacVolumeBackend:
+    """osascript per call; VolumeService keeps it off the vision thread and rate-capped."""
+    name = "mac"
+
+    def read(self):
+        result = subprocess.check_output(["osascript", "-e", "output volume of (get volume settings)"], timeout=2)
+        return int(result.strip())
+
+    def write(self, percent):
+        subprocess.run(["osascript", "-e", f"set volume output volume {int(percent)}"], timeout=2, check=False)
+
+    def close(self):
+        pass
+
+
+class PulseVolumeBackend:
+    """
+    PulseAudio / PipeWire (pipewire-pulse). Uses one libpulse connection via
+    pulsectl when installed, otherwise the pactl CLI.
+    """
+    name = "pulse"
+    PACTL_VOLUME = re.compile(r"(\d+)%")
+
+    def __init__(self):
+        self.pulse = None
+        self.sink = None
+
+    def _sink(self, refresh=False):
+        if self.pulse is None: self.pulse = pulsectl.Pulse("cross-link-volume")
+        if self.sink is None or refresh:
+            self.sink = self.pulse.get_sink_by_name(self.pulse.server_info().default_sink_name)
+        return self.sink
+
+    def read(self):
+        if PULSECTL_AVAILABLE:
+            sink = self._sink(refresh=True)  # Periodic reads also follow default-sink changes
+            return int(round(self.pulse.volume_get_all_chans(sink) * 100))
+        out = subprocess.check_output(["pactl", "get-sink-volume", "@DEFAULT_SINK@"], timeout=2).decode()
+        match = self.PACTL_VOLUME.search(out)
+        return int(match.group(1)) if match else None
+
+    def write(self, percent):
+        if PULSECTL_AVAILABLE:
+            sink = self._sink()
+            self.pulse.volume_set_all_chans(sink, percent / 100.0)
+            return
+        subprocess.run(["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{int(percent)}%"], timeout=2, check=False)
+
+    def close(self):
+        if self.pulse is not None:
+            try: self.pulse.close()
+            except Exception: pass
+            self.pulse = None
+            self.sink = None
+
+
+class FakeVolumeBackend:
+    """In-memory backend for tests and headless runs; records every write."""
+    name = "fake"
+
+    def __init__(self, level=50):
+        self.level = level
+        self.writes = []
+
+    def read(self):
+        return self.level
+
+    def write(self, percent):
+        self.level = int(percent)
+        self.writes.append(self.level)
+
+    def close(self):
+        pass
+
+
+def get_volume_backend(preferred=None):
+    if preferred == "fake":
+        return FakeVolumeBackend()
+    if system_os == "Windows":
+        return WindowsVolumeBackend()
+    if system_os == "Darwin":
+        return MacVolumeBackend()
+    if system_os == "Linux" and (PULSECTL_AVAILABLE or shutil.which("pactl")):
+        return PulseVolumeBackend()
+    return FakeVolumeBackend()
+
+
+class VolumeService:
+    """
+    One worker thread per backend:
+    - get() returns the cached level instantly (refreshed every refresh_interval s
+      while in use: touch() was called within the last idle_after s)
+    - set() only records the latest target; the worker applies it at most
+      max_rate_hz times per second, dropping intermediate values
+    """
+
+    def __init__(self, backend, max_rate_hz=15, refresh_interval=2.0, idle_after=5.0, default_level=50):
+        self.backend = backend
+        self.min_interval = 1.0 / max_rate_hz
+        self.refresh_interval = refresh_interval
+        self.idle_after = idle_after
+        self.level = default_level
+        self._last_use = float("-inf")
+
+        self._pending = None
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running: return
+        self._running = True
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread: self._thread.join()
+        self._thread = None
+        self.backend.close()
+
+    def get(self):
+        return self.level
+
+    def touch(self):
+        """Mark the level as in use: keeps it refreshed; after idle, refreshes right away."""
+        now = time.monotonic()
+        idle = not self._in_use(now)
+        self._last_use = now
+        if idle:
+            with self._cond: self._cond.notify()
+
+    def _in_use(self, now):
+        return now - self._last_use <= self.idle_after
+
+    def set(self, percent):
+        percent = int(max(0, min(100, percent)))
+        with self._cond:
+            self.level = percent
+            self._pending = percent
+            self._cond.notify()
+
+    def _run_loop(self):
+        self._refresh()
+        last_write = 0.0
+        last_refresh = time.monotonic()
+
+        while True:
+            with self._cond:
+                if self._running and self._pending is None:
+                    if self._in_use(time.monotonic()):
+                        self._cond.wait(timeout=max(0.0, self.refresh_interval - (time.monotonic() - last_refresh)))
+                    else:
+                        self._cond.wait()  # Idle: no polling until touch(), set() or stop()
+                if not self._running:
+                    pending = self._pending
+                    self._pending = None
+                    if pending is not None: self._write(pending)
+                    return
+                pending = self._pending
+
+            now = time.monotonic()
+            if pending is not None:
+                # Rate cap: wait out the interval, then take whatever is newest
+                wait = self.min_interval - (now - last_write)
+                if wait > 0:
+                    time.sleep(wait)
+                    continue
+                with self._cond:
+                    pending, self._pending = self._pending, None
+                if pending is not None:
+                    self._write(pending)
+                    last_write = last_refresh = time.monotonic()
+            elif self._in_use(now) and now - last_refresh >= self.refresh_interval:
+                self._refresh()
+                last_refresh = time.monotonic()
+
+    def _refresh(self):
+        try:
+            level = self.backend.read()
+            with self._cond:
+                if level is not None and self._pending is None: self.level = level
+        except Exception: pass
+
+    def _write(self, percent):
+        try: self.backend.write(percent)
+        except Exception: pass
@@ -0,0 +1,120 @@
+import math
+import threading
+import time
+
+# --- ZOOM OUTPUT DRIVER ---
+# TwoHandZoom produces a smooth zoom level (percent); applications only
+# accept discrete zoom steps. The vision thread just publishes the target
+# level. This thread converts it to steps (log scale, step_ratio per step,
+# matching how browsers space their zoom levels) and emits the difference
+# between target and sent steps at a rate proportional to that error:
+#
+#   rate = min(gain * |error|, max_rate)   steps/s
+#
+# A big pinch-out therefore catches up within a fraction of a second, and
+# the last steps slow down as the error shrinks. It never overshoots:
+# nothing goes out once the target is within half a step.
+#
+# Output: "keys" (modifier + "+"/"-", through the macro worker) or "wheel"
+# (modifier held while the backend scrolls one click per step).
+
+
+class ZoomDriver:
+    def __init__(self, macros, backend, output="keys", step_ratio=1.1, gain=10.0, max_rate=30.0,
+                 tick_hz=120, max_batch=4, modifier="ctrl"):
+        self.macros = macros
+        self.backend = backend
+        self.configure(output)
+        self.step_ratio = step_ratio  # Zoom factor of one application step
+        self.gain = gain              # Steps/s per step of error
+        self.max_rate = max_rate
+        self.tick_hz = tick_hz
+        self.max_batch = max_batch    # Steps per tick cap
+        self.modifier = modifier      # "ctrl" / "command", set by the engine from the OS setting
+
+        self.running = False
+        self.thread = None
+        self._target = None           # Target level in steps (float) - replaced atomically
+        self._sent = None             # Steps emitted so far, same scale
+        self._wake = threading.Event()
+        self._compiled = {}           # (modifier, key, count) -> compiled macro
+        self._wheel_keys = {}         # modifier -> resolved key code
+        self.steps_sent = 0
+
+    def configure(self, output):
+        if output not in ("keys", "wheel"): raise ValueError(f"Unknown zoom output: {output}")
+        self.output = output
+
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+        if self.thread: self.thread.join()
+        self.thread = None
+
+    def update(self, level):
+        """level: target zoom in percent (100 = the level when tracking started)."""
+        self._target = math.log(max(level, 1.0) / 100.0) / math.log(self.step_ratio)
+        self._wake.set()
+
+    def reset(self):
+        """Forget the target: the next update() starts from the current application zoom."""
+        self._target = self._sent = None
+
+    def error(self):
+        target, sent = self._target, self._sent
+        return 0.0 if target is None or sent is None else target - sent
+
+    def _emit(self, count):
+        """count > 0 zooms in, < 0 out."""
+        if self.output == "wheel":
+            code = self._wheel_keys.get(self.modifier)
+            if code is None: code = self._wheel_keys[self.modifier] = self.backend.resolve(self.modifier)
+            self.backend.send_keys([(code, True)])
+            try: self.backend.scroll(count)
+            finally: self.backend.send_keys([(code, False)])
+        else:
+            key = (self.modifier, "+" if count > 0 else "-", abs(count))
+            macro = self._compiled.get(key)
+            if macro is None:
+                macro = self._compiled[key] = self.macros.compile(
+                    [{"hold": key[0], "steps": [{"press": key[1], "repeat": key[2]}]}]
+                )
+            self.macros.run(macro)
+        self.steps_sent += abs(count)
+
+    def _run_loop(self):
+        period = 1.0 / self.tick_hz
+        due = 1.0
+        last = time.perf_counter()
+
+        while self.running:
+            target = self._target
+            if target is not None and self._sent is None:
+                self._sent = float(round(target))  # First update: that level is what is on screen
+            error = self.error()
+            now = time.perf_counter()
+
+            if abs(error) < 0.5:
+                due = 1.0  # Next engage: first step immediately
+                self._wake.clear()
+                if abs(self.error()) < 0.5:  # Re-check: an update may have raced the clear
+                    self._wake.wait()
+                last = time.perf_counter()
+                continue
+
+            due = min(due + min(self.gain * abs(error), self.max_rate) * (now - last), self.max_batch)
+            last = now
+            count = min(int(due), self.max_batch, int(abs(error) + 0.5))
+            if count:
+                due -= count
+                step = count if error > 0 else -count
+                self._sent += step
+                try: self._emit(step)
+                except Exception as e: print(f"Zoom Output Error: {e}")
+            time.sleep(period)
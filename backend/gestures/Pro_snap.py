@@ -3,6 +3,9 @@ import time
 import numpy as np
 from collections import deque
 
+from gestures.hand_scale import palm_scale
+from core.filters import OneEuroFilter
+
 
 class ProSnap:
     def __init__(self):
@@ -10,7 +13,8 @@ class ProSnap:
         # Distance tracking
         self.dist_history = deque(maxlen=4)
         self.smooth_dist = None
-        self.alpha = 0.4  # Distance smoothing
+        # Distance smoothing: steady while loaded, lag-free on the snap itself
+        self.dist_filter = OneEuroFilter(min_cutoff=1.5, beta=5.0)
 
         # Snap state
         self.is_prepped = False
@@ -21,16 +25,17 @@ class ProSnap:
         self.display_time = 0
         self.banner_duration = 0.8  # seconds
 
-        # Thresholds
+        # Thresholds (normalized units at the reference palm size)
         self.touch_dist = 0.05        # Touch detection threshold
         self.snap_velocity = 0.08     # Required separation velocity
         self.reset_distance = 0.25    # Reset if fingers too far apart
 
-    # ---------------- EMA FILTER ----------------
-    def _ema(self, current, previous):
-        if previous is None:
-            return current
-        return self.alpha * current + (1 - self.alpha) * previous
+    def reset(self):
+        """Forget the loaded snap (e.g. a different hand took over)."""
+        self.is_prepped = False
+        self.dist_history.clear()
+        self.smooth_dist = None
+        self.dist_filter.reset()
 
     # ---------------- MAIN PROCESS ----------------
     def process(self, frame, hands_data):
@@ -39,8 +44,7 @@ class ProSnap:
 
         # Require exactly one hand
         if len(hands_data) != 1:
-            self.is_prepped = False
-            self.dist_history.clear()
+            self.reset()
             return frame, None
 
         landmarks, _ = hands_data[0]
@@ -55,14 +59,17 @@ class ProSnap:
             thumb.z - middle.z
         ])
 
+        # Thresholds follow the on-screen hand size
+        scale = palm_scale(landmarks.landmark)
+
         # Smooth distance
-        self.smooth_dist = self._ema(raw_dist, self.smooth_dist)
+        self.smooth_dist = self.dist_filter(raw_dist)
         dist = self.smooth_dist
 
         self.dist_history.append(dist)
 
         # ---------------- PREP STATE ----------------
-        if dist < self.touch_dist:
+        if dist < self.touch_dist * scale:
             self.is_prepped = True
 
             # Yellow ring indicates snap loaded
@@ -79,7 +86,7 @@ class ProSnap:
 
             velocity = self.dist_history[-1] - self.dist_history[0]
 
-            if velocity > self.snap_velocity:
+            if velocity > self.snap_velocity * scale:
 
                 if current_time - self.last_trigger_time > self.cooldown:
                     self.last_trigger_time = current_time
@@ -90,7 +97,7 @@ class ProSnap:
                     return frame, "RUN_CODE"
 
         # Reset prep if fingers slowly separate too much
-        if dist > self.reset_distance:
+        if dist > self.reset_distance * scale:
             self.is_prepped = False
 
         # ---------------- DISPLAY BANNER ----------------
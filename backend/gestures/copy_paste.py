@@ -2,6 +2,8 @@ import cv2
 import time
 import numpy as np
 
+from gestures.hand_scale import palm_scale
+
 
 class CopyPaste:
     def __init__(self):
@@ -10,7 +12,7 @@ class CopyPaste:
         self.last_trigger_time = 0
         self.cooldown = 1.0
 
-        self.trigger_threshold = 0.04
+        self.trigger_threshold = 0.04  # At the reference palm size
         self.alpha = 0.4
         self.smooth_dist = None
 
@@ -76,9 +78,10 @@ class CopyPaste:
             return frame, None
 
         diff = dist - self.anchor_dist
+        threshold = self.trigger_threshold * palm_scale(landmarks.landmark)
 
         # COPY (pinch inward)
-        if diff < -self.trigger_threshold:
+        if diff < -threshold:
             self.last_trigger_time = current_time
             self.anchor_dist = None
             self.display_text = "COPY"
@@ -86,7 +89,7 @@ class CopyPaste:
             return frame, "COPY"
 
         # PASTE (spread outward)
-        if diff > self.trigger_threshold:
+        if diff > threshold:
             self.last_trigger_time = current_time
             self.anchor_dist = None
             self.display_text = "PASTE"
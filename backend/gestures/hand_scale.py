@@ -0,0 +1,16 @@
+import math
+
+# Palm size (wrist -> middle MCP, normalized units) the stock thresholds were tuned on
+REFERENCE_PALM_SIZE = 0.2
+
+def palm_size(landmarks):
+    """2D wrist-to-middle-MCP distance in normalized image units."""
+    wrist, mcp = landmarks[0], landmarks[9]
+    return math.hypot(wrist.x - mcp.x, wrist.y - mcp.y)
+
+def palm_scale(landmarks):
+    """
+    Multiplier for length/velocity thresholds tuned at REFERENCE_PALM_SIZE.
+    A hand twice as far from the camera looks half as big, so its thresholds halve too.
+    """
+    return max(palm_size(landmarks), 1e-3) / REFERENCE_PALM_SIZE
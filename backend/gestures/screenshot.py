@@ -1,16 +1,19 @@
 import cv2
 import time
 
+from gestures.hand_scale import palm_scale
+
 
 class Screenshot:
     def __init__(self):
         self.cooldown = 1.5
         self.last_trigger_time = 0
-        self.velocity_threshold = 35
+        self.speed_threshold = 2.2  # Frame heights/s at the reference palm size
         self.display_time = 0
         self.display_duration = 1.0
 
     def process(self, frame, hands_data, velocity_y):
+        """velocity_y: palm speed in frame heights per second (positive = down)."""
         current_time = time.time()
 
         # ---------------- DISPLAY FEEDBACK ----------------
@@ -29,7 +32,7 @@ class Screenshot:
         if len(hands_data) != 1:
             return frame, None
 
-        _, fingers = hands_data[0]
+        landmarks, fingers = hands_data[0]
 
         # fingers = [Thumb, Index, Middle, Ring, Pinky]
         thumb, index, middle, ring, pinky = fingers
@@ -38,7 +41,7 @@ class Screenshot:
         is_four_fingers = (not thumb) and index and middle and ring and pinky
 
         # Downward swipe (positive velocity_y because Y increases downward)
-        if is_four_fingers and velocity_y > self.velocity_threshold:
+        if is_four_fingers and velocity_y > self.speed_threshold * palm_scale(landmarks.landmark):
 
             if current_time - self.last_trigger_time > self.cooldown:
                 self.last_trigger_time = current_time
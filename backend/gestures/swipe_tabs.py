@@ -1,14 +1,17 @@
 import cv2
 import time
 
+from gestures.hand_scale import palm_scale
+
 class SwipeTabs:
     def __init__(self):
         # Configuration
         self.cooldown_time = 0.35  # Keep it snappy (Main Repo)
         self.last_trigger_time = 0
-        self.velocity_threshold = 20  # Balanced threshold
+        self.speed_threshold = 0.23  # Frame widths/s at the reference palm size
         
     def process(self, frame, hands_data, velocity_x):
+        """velocity_x: palm speed in frame widths per second (positive = right)."""
         # Only single hand allowed for swipe
         if len(hands_data) != 1:
             return frame, None
@@ -30,10 +33,11 @@ class SwipeTabs:
             return frame, None
 
         action = None
+        threshold = self.speed_threshold * palm_scale(hand_wrapper.landmark)
 
         # --- LOGIC ---
         # Right Swipe
-        if velocity_x > self.velocity_threshold:
+        if velocity_x > threshold:
             if finger_count == 5:
                 action = "NEXT_APP" # Switch Desktop/Space
             else:
@@ -41,7 +45,7 @@ class SwipeTabs:
             self.last_trigger_time = current_time
 
         # Left Swipe
-        elif velocity_x < -self.velocity_threshold:
+        elif velocity_x < -threshold:
             if finger_count == 5:
                 action = "PREV_APP"
             else:
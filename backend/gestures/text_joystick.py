@@ -26,3 +26,12 @@ def compute_text_joystick(hx, hy, center):
             return "UP", speed
         else:
             return "DOWN", speed
+
+
+def text_joystick_deflection(hx, hy, center):
+    """Returns (direction or None, deflection 0..1 between the dead zone and MAX_RADIUS)."""
+    direction, _ = compute_text_joystick(hx, hy, center)
+    if direction == "NONE":
+        return None, 0.0
+    dist = min(math.hypot(hx - center[0], hy - center[1]), MAX_RADIUS)
+    return direction, (dist - DEAD_ZONE) / (MAX_RADIUS - DEAD_ZONE)
@@ -2,6 +2,8 @@ import numpy as np
 import cv2
 from collections import deque
 
+from core.filters import OneEuroFilter
+
 class TwoHandZoom:
     def __init__(self):
         # State Management
@@ -21,8 +23,8 @@ class TwoHandZoom:
         self.presence_history = deque(maxlen=5)
         self.smooth_dist = None
         
-        # Alpha filters (0.0 to 1.0)
-        self.dist_alpha = 0.35 
+        # Palm distance filter (pixels) + output alpha (0.0 to 1.0)
+        self.dist_filter = OneEuroFilter(min_cutoff=1.5, beta=0.01)
         self.zoom_alpha = 0.20 # Lower = smoother/slower, Higher = snappier
 
     def _ema_filter(self, current, previous, alpha):
@@ -44,7 +46,7 @@ class TwoHandZoom:
         
         # 2. Early Exit if hands are lost (requires consensus over history)
         if sum(self.presence_history) < 3:
-            self._reset_state()
+            self.reset()
             # Still interpolate current_zoom back to target or stay static
             self.current_zoom = self._ema_filter(self.target_zoom, self.current_zoom, self.zoom_alpha)
             return frame, int(self.current_zoom)
@@ -62,7 +64,7 @@ class TwoHandZoom:
         p2 = self._get_palm_center(lm2, w, h)
         
         raw_dist = np.hypot(p1[0] - p2[0], p1[1] - p2[1])
-        self.smooth_dist = self._ema_filter(raw_dist, self.smooth_dist, self.dist_alpha)
+        self.smooth_dist = self.dist_filter(raw_dist)
 
         # 5. Zoom Logic
         if not self.is_active:
@@ -89,9 +91,11 @@ class TwoHandZoom:
 
         return frame, int(self.current_zoom)
 
-    def _reset_state(self):
+    def reset(self):
+        """Drop the anchors: the next frame with two open hands re-anchors at the current zoom."""
         self.is_active = False
         self.smooth_dist = None
+        self.dist_filter.reset()
 
     def _draw_ui(self, frame, p1, p2):
         color = (0, 255, 0) if self.is_active else (0, 165, 255)
@@ -1,36 +1,58 @@
 import cv2
 import mediapipe as mp
 import pyautogui
-import numpy as np
 import time
 import math
 
+from gestures.hand_scale import palm_scale
+from core.filters import OneEuroFilter
+
 # --- PERFORMANCE CONFIG ---
 pyautogui.PAUSE = 0
 pyautogui.FAILSAFE = False
 
 class VirtualMouse:
     def __init__(self):
-        # --- TUNING ---
+        # --- TUNING --- (pixels at the reference palm size)
         self.PINCH_THRESHOLD = 30 
         self.RIGHT_PINCH_THRESHOLD = 50 # Generous range for middle finger
         self.drag_threshold_time = 0.4
+        self.right_click_cooldown = 0.3  # Seconds between right clicks while the pinch is held
         self.SCROLL_SENSITIVITY = 4
+        self.SCROLL_GAIN = 100         # Wheel notches/s per frame-height/s of finger speed (ScrollOutput)
+        self.SCROLL_DEADZONE = 0.1     # Frame-heights/s of finger speed treated as jitter
         
-        # Smoothing (Higher = Smoother but slower)
-        self.smooth = 5  
+        # Smoothing: One Euro on screen pixels. With engine.cursor_lead on, `lead`
+        # is set to the measured pipeline delay so the cursor predicts ahead of the hand.
+        self.cursor_filter = OneEuroFilter(min_cutoff=1.0, beta=0.007)
         self.frame_r = 140 # Safe zone padding
+        self._map_size = None  # (w, h) the cached camera -> screen mapping was built for
 
         # --- STATE ---
         self.pinch_start_time = None
+        self.last_right_click = 0
         self.prev_scroll_y = None
+        self.scroll_filter = OneEuroFilter(min_cutoff=1.0, beta=0.0)  # Finger height; its velocity drives scrolling
+        self.scrolling = False
         self.plocX, self.plocY = 0, 0
         self.mouse_pressed = False
         self.w_scr, self.h_scr = pyautogui.size()
 
+        # Optional high-rate CursorOutput / ScrollOutput (set by the engine).
+        # When running, cursor moves and scrolling go through them instead of
+        # one OS call per camera frame.
+        self.cursor_output = None
+        self.scroll_output = None
+
     def distance(self, p1, p2):
         return math.hypot(p1.x - p2.x, p1.y - p2.y)
 
+    def _build_mapping(self, w, h):
+        """Precompute the safe-zone -> screen affine map (replaces per-frame np.interp)."""
+        self._map_size = (w, h)
+        self.sx = self.w_scr / (w - 2 * self.frame_r)
+        self.sy = self.h_scr / (h - 2 * self.frame_r)
+
     def is_finger_up(self, tip, pip):
         # Finger is UP if tip is higher (lower Y value) than the knuckle (pip)
         return tip.y < pip.y
@@ -53,6 +75,7 @@ class VirtualMouse:
 
         gesture = "NONE"
         current_time = time.time()
+        scale = palm_scale(lm)
         
         # Draw the "Safe Zone" Box
         cv2.rectangle(frame, (self.frame_r, self.frame_r), (w - self.frame_r, h - self.frame_r), (255, 0, 255), 2)
@@ -60,7 +83,14 @@ class VirtualMouse:
         # 1. SCROLL (Peace Sign + Ring Down)
         if index_up and middle_up and not ring_up:
             current_y = int(middle_tip.y * h)
-            if self.prev_scroll_y is not None:
+            if self.scroll_output is not None and self.scroll_output.running:
+                # Finger velocity -> smooth wheel output at the output thread's own cadence
+                self.scroll_filter(middle_tip.y)
+                speed = -float(self.scroll_filter.velocity[0])  # Frame-heights/s, up = positive
+                self.scroll_output.update(speed * self.SCROLL_GAIN if abs(speed) > self.SCROLL_DEADZONE else 0.0)
+                self.scrolling = True
+                gesture = "SCROLL"
+            elif self.prev_scroll_y is not None:
                 dy = self.prev_scroll_y - current_y
                 if abs(dy) > 10:
                     clicks = int(dy / self.SCROLL_SENSITIVITY)
@@ -74,6 +104,10 @@ class VirtualMouse:
             
         else:
             self.prev_scroll_y = None
+            if self.scrolling:
+                self.scrolling = False
+                self.scroll_filter.reset()
+                self.scroll_output.release()  # Coast (fling) from the last finger speed
 
         # 2. RIGHT CLICK (Middle Finger + Thumb)
         # We check this BEFORE movement to prioritize clicks
@@ -81,11 +115,12 @@ class VirtualMouse:
             # Convert normalized distance to approximate pixels
             dist_right = self.distance(middle_tip, thumb_tip) * w 
             
-            if dist_right < self.RIGHT_PINCH_THRESHOLD:
-                 pyautogui.rightClick(_pause=False)
+            if dist_right < self.RIGHT_PINCH_THRESHOLD * scale:
+                 # Cooldown (not a sleep) prevents double-click spam without stalling the frame
+                 if current_time - self.last_right_click > self.right_click_cooldown:
+                     pyautogui.rightClick(_pause=False)
+                     self.last_right_click = current_time
                  gesture = "RIGHT_CLICK"
-                 # Small sleep to prevent double-click spam
-                 time.sleep(0.3) 
                  
                  cv2.circle(frame, (int(middle_tip.x * w), int(middle_tip.y * h)), 10, (0, 0, 255), -1)
                  return frame, gesture
@@ -95,7 +130,7 @@ class VirtualMouse:
         if index_up:
             dist_left = self.distance(index_tip, thumb_tip) * w
             
-            if dist_left < self.PINCH_THRESHOLD:
+            if dist_left < self.PINCH_THRESHOLD * scale:
                 if self.pinch_start_time is None:
                     self.pinch_start_time = current_time
                 
@@ -130,19 +165,23 @@ class VirtualMouse:
             x1 = int(index_tip.x * w)
             y1 = int(index_tip.y * h)
             
-            # Linear Interpolation
-            x3 = np.interp(x1, (self.frame_r, w - self.frame_r), (0, self.w_scr))
-            y3 = np.interp(y1, (self.frame_r, h - self.frame_r), (0, self.h_scr))
+            # Linear mapping, clamped to the screen like np.interp
+            if self._map_size != (w, h): self._build_mapping(w, h)
+            x3 = min(max((x1 - self.frame_r) * self.sx, 0), self.w_scr)
+            y3 = min(max((y1 - self.frame_r) * self.sy, 0), self.h_scr)
             
-            # Smoothing
-            curr_x = self.plocX + (x3 - self.plocX) / self.smooth
-            curr_y = self.plocY + (y3 - self.plocY) / self.smooth
+            # Smoothing + latency compensation
+            curr_x, curr_y = self.cursor_filter((x3, y3))
             
-            # Move Mouse
-            try:
-                pyautogui.moveTo(self.w_scr - curr_x, curr_y, _pause=False)
-            except:
-                pass # Ignore edge cases
+            # Move Mouse (x mirrored, so is its velocity)
+            if self.cursor_output is not None and self.cursor_output.running:
+                vx, vy = self.cursor_filter.velocity
+                self.cursor_output.update(self.w_scr - curr_x, curr_y, -vx, vy)
+            else:
+                try:
+                    pyautogui.moveTo(self.w_scr - curr_x, curr_y, _pause=False)
+                except:
+                    pass # Ignore edge cases
                 
             self.plocX, self.plocY = curr_x, curr_y
             
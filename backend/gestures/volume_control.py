@@ -1,39 +1,8 @@
 import numpy as np
 import cv2
-import platform
-import subprocess
 import math
 
-# Conditional imports for Windows
-system_os = platform.system()
-if system_os == "Windows":
-    try:
-        import comtypes
-        from ctypes import cast, POINTER
-        from comtypes import CLSCTX_ALL
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-        
-        # Fallback COM Definitions
-        CLSID_MMDeviceEnumerator = comtypes.GUID("{BCDE0395-E52F-467C-8E3D-C4579291692E}")
-        IMMDeviceEnumerator_ID = comtypes.GUID("{A95664D2-9614-4F35-A746-DE8DB63617E6}")
-        IMMDevice_ID = comtypes.GUID("{D666063F-1587-4E43-81F1-B948E807363F}")
-        
-        class IMMDeviceEnumerator(comtypes.IUnknown):
-            _iid_ = IMMDeviceEnumerator_ID
-            _methods_ = [
-                comtypes.COMMETHOD([], comtypes.HRESULT, "EnumAudioEndpoints", (["in"], comtypes.c_int, "dataFlow"), (["in"], comtypes.c_int, "dwStateMask"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppDevices")),
-                comtypes.COMMETHOD([], comtypes.HRESULT, "GetDefaultAudioEndpoint", (["in"], comtypes.c_int, "dataFlow"), (["in"], comtypes.c_int, "role"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppEndpoint"))
-            ]
-        class IMMDevice(comtypes.IUnknown):
-            _iid_ = IMMDevice_ID
-            _methods_ = [
-                comtypes.COMMETHOD([], comtypes.HRESULT, "Activate", (["in"], POINTER(comtypes.GUID), "iid"), (["in"], comtypes.c_int, "dwClsCtx"), (["in"], POINTER(comtypes.IUnknown), "pActivationParams"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppInterface")),
-                comtypes.COMMETHOD([], comtypes.HRESULT, "OpenPropertyStore", (["in"], comtypes.c_int, "stgmAccess"), (["out"], POINTER(POINTER(comtypes.IUnknown)), "ppProperties")),
-                comtypes.COMMETHOD([], comtypes.HRESULT, "GetId", (["out"], POINTER(comtypes.c_wchar_p), "ppstrId")),
-                comtypes.COMMETHOD([], comtypes.HRESULT, "GetState", (["out"], POINTER(comtypes.c_int), "pdwState"))
-            ]
-    except ImportError:
-        print("⚠️ Warning: Windows audio libraries not found.")
+from core.volume_backend import VolumeService, get_volume_backend
 
 class VolumeControl:
     def __init__(self):
@@ -42,59 +11,24 @@ class VolumeControl:
         self.start_volume = 0
         self.current_volume = 0
         self.last_set_volume = -1  # LAG FIX: Tracks last updated volume
-        self.volume_interface = None 
-        self._init_audio()
+        self.volume = VolumeService(get_volume_backend())  # Worker runs while the engine does
 
-    def _init_audio(self):
-        """Robust Initialization for both OS types"""
-        if system_os == "Windows":
-            try:
-                try: comtypes.CoInitialize()
-                except: pass
-                
-                try:
-                    # Method A: Standard
-                    devices = AudioUtilities.GetSpeakers()
-                    interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                    self.volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
-                    return
-                except Exception: pass
-                
-                # Method B: Fallback
-                enumerator = comtypes.CoCreateInstance(CLSID_MMDeviceEnumerator, IMMDeviceEnumerator, comtypes.CLSCTX_INPROC_SERVER)
-                device_unknown = enumerator.GetDefaultAudioEndpoint(0, 1)
-                device = device_unknown.QueryInterface(IMMDevice)
-                interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                self.volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
-            except Exception as e:
-                print(f"❌ Windows Audio Init Failed: {e}")
-        
-        elif system_os == "Darwin":
-            self.volume_interface = "mac_ready"
+    def start(self):
+        self.volume.start()
 
     def get_system_volume(self):
-        if system_os == "Windows" and self.volume_interface:
-            try: return int(round(self.volume_interface.GetMasterVolumeLevelScalar() * 100))
-            except: return 50
-        elif system_os == "Darwin":
-            try:
-                result = subprocess.check_output(["osascript", "-e", "output volume of (get volume settings)"])
-                return int(result.strip())
-            except: return 50
-        return 50
+        # Cached by the backend worker: never blocks the frame
+        return self.volume.get()
 
     def set_system_volume(self, vol_percent):
-        val = max(0, min(100, vol_percent))
-        if system_os == "Windows" and self.volume_interface:
-            try: self.volume_interface.SetMasterVolumeLevelScalar(val / 100.0, None)
-            except: pass
-        elif system_os == "Darwin":
-            try:
-                # LAG FIX: Popen runs in the background instantly without blocking the camera frame
-                subprocess.Popen(["osascript", "-e", f"set volume output volume {int(val)}"])
-            except: pass
+        # Coalesced and rate-limited by the backend worker
+        self.volume.set(vol_percent)
+
+    def close(self):
+        self.volume.stop()
 
     def process(self, frame, hand_wrapper, fingers, w, h):
+        self.volume.touch()  # Hand in view: keep the cached level fresh for the pinch start
         lm_list = hand_wrapper.landmark
         thumb_tip, index_tip = lm_list[4], lm_list[8]
         thumb_x, thumb_y = int(thumb_tip.x * w), int(thumb_tip.y * h)
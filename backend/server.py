@@ -1,15 +1,16 @@
-from fastapi import FastAPI, APIRouter, WebSocket, HTTPException
+from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query, Request, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, conlist
+from typing import List, Optional, Union
 import uuid
 from datetime import datetime, timezone
 import asyncio
+from contextlib import aclosing
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -34,6 +35,17 @@ except ImportError:
     logger.warning("GestureEngine could not be imported.")
     gesture_engine = None
 
+from core.activity_store import BUCKETS as ACTIVITY_BUCKETS, activity_entry
+from core.config_store import ConfigStore
+from core.training import TrainingManager
+
+# Config writes: applied to the engine at once, persisted write-behind
+config_store = ConfigStore(db, str(ROOT_DIR / 'config_journal.jsonl'))
+
+training_manager = None
+if gesture_engine is not None:
+    training_manager = TrainingManager(gesture_engine.calibration_store, gesture_engine.model_path, on_model=gesture_engine.set_classifier)
+
 
 # --- MODELS ---
 class StatusCheck(BaseModel):
@@ -51,12 +63,62 @@ class GestureConfigUpdate(BaseModel):
 class CustomAction(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
-    keys: List[str]
+    keys: List[str] = []
+    macro: Optional[List[Union[str, dict]]] = None  # Steps, see core.macros (overrides keys)
 
 # NEW: OS System Settings Model
 class SystemSettings(BaseModel):
     os_type: str  # "windows" or "mac"
 
+class MotionTemplate(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    points: List[conlist(float, min_length=2, max_length=2)] = Field(min_length=2)  # (x, y) path, any scale / length
+    threshold: float = Field(default=4.0, gt=0)
+
+class ScreenshotConfig(BaseModel):
+    format: Optional[str] = None  # "png", "webp" or "raw"
+    png_level: Optional[int] = None
+    webp_quality: Optional[int] = None
+
+class LandmarkerConfig(BaseModel):  # See core.landmarker.LandmarkerOptions; null resets num_hands / threads / cpu_affinity
+    model_path: Optional[str] = None  # Absolute, or relative to backend/
+    num_hands: Optional[int] = None   # null: 2, or 1 while two-hand zoom is disabled
+    detection_confidence: Optional[float] = None
+    presence_confidence: Optional[float] = None
+    tracking_confidence: Optional[float] = None
+    delegate: Optional[str] = None    # "cpu" or "gpu"
+    threads: Optional[int] = None
+    cpu_affinity: Optional[List[int]] = None
+    warm_up_frames: Optional[int] = None
+
+class TrackingConfig(BaseModel):  # See core.landmark_tracker
+    max_interval: Optional[int] = None    # Frames per landmarker run for a still hand; 1 = every frame
+    fast_motion: Optional[float] = None   # px/frame at which every frame is detected again
+    fb_threshold: Optional[float] = None  # Forward-backward error (px) a tracked point may have
+    min_good: Optional[float] = None      # Fraction of a hand's points that must track
+
+class MotionGateConfig(BaseModel):  # See core.motion_gate
+    max_reuse: Optional[int] = None      # Consecutive reuses of one detection; 0 = off
+    max_age: Optional[float] = None      # Seconds a detection may be reused for
+    threshold: Optional[float] = None    # Fraction of hand-ROI pixels that may change
+    noise: Optional[int] = None          # Gray-level difference ignored as sensor noise
+
+class ModuleGuardConfig(BaseModel):  # See core.module_guard
+    budget_ms: Optional[float] = None     # Per-call cost above which a module is throttled; 0 = never
+    max_stride: Optional[int] = None      # Throttled modules run at least every max_stride-th frame
+    failure_limit: Optional[int] = None   # Consecutive exceptions that disable a module
+    cooldown: Optional[float] = None      # Seconds before the first recovery probe
+
+class CalibrationRequest(BaseModel):
+    gesture: str = Field(min_length=1, max_length=64)  # Becomes the class label when training
+    user_id: str = "default"
+
+class TrainingJobRequest(BaseModel):
+    user_id: str = "default"
+    gestures: Optional[List[str]] = None  # Default: every calibrated gesture of the user
+    epochs: int = Field(default=60, ge=1, le=1000)
+
 
 # --- ROUTER ---
 api_router = APIRouter(prefix="/api")
@@ -66,14 +128,17 @@ async def root(): return {"message": "GestureOS Backend Running"}
 
 @api_router.get("/engine/status")
 async def get_engine_status():
-    if not gesture_engine: return {"running": False, "count": 0}
+    if not gesture_engine: return {"running": False, "count": 0, "mode": "idle", "ready": False}
     total_count = getattr(gesture_engine, 'total_gesture_count', 0)
-    return {"running": gesture_engine.running, "count": total_count}
+    return {"running": gesture_engine.running, "count": total_count, "mode": gesture_engine.arbiter.mode, "ready": gesture_engine.ready}
 
 @api_router.post("/engine/start")
 async def start_engine():
     if not gesture_engine: raise HTTPException(500, "No Engine")
-    if not gesture_engine.running: gesture_engine.start()
+    if not gesture_engine.running:
+        # First start may still have to load the model: keep the event loop free
+        try: await asyncio.to_thread(gesture_engine.start)
+        except Exception as e: raise HTTPException(500, f"Engine failed to start: {e}")
     return {"status": "started"}
 
 @api_router.post("/engine/stop")
@@ -82,30 +147,112 @@ async def stop_engine():
     if gesture_engine.running: gesture_engine.stop()
     return {"status": "stopped"}
 
+@api_router.get("/engine/landmarker")
+async def get_landmarker_config():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    return gesture_engine.landmarker_config()
+
+@api_router.patch("/engine/landmarker")
+async def update_landmarker_config(config: LandmarkerConfig):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    changes = config.model_dump(exclude_unset=True)  # Explicit nulls reset to automatic
+    try: gesture_engine.configure_landmarker(**changes)
+    except ValueError as e: raise HTTPException(422, str(e))
+    config_store.stage("global_settings", "setting_id", "landmarker", changes)
+    return gesture_engine.landmarker_config()
+
+@api_router.get("/engine/tracking")
+async def get_tracking_config():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    tracker = gesture_engine.landmark_tracker
+    return {**tracker.config(), "stats": tracker.stats()}
+
+@api_router.patch("/engine/tracking")
+async def update_tracking_config(config: TrackingConfig):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    tracker = gesture_engine.landmark_tracker
+    try: tracker.configure(**config.model_dump())
+    except ValueError as e: raise HTTPException(422, str(e))
+    config_store.stage("global_settings", "setting_id", "tracking", tracker.config())
+    return {**tracker.config(), "stats": tracker.stats()}
+
+@api_router.get("/engine/motion-gate")
+async def get_motion_gate_config():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    gate = gesture_engine.motion_gate
+    return {**gate.config(), "stats": gate.stats()}
+
+@api_router.patch("/engine/motion-gate")
+async def update_motion_gate_config(config: MotionGateConfig):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    gate = gesture_engine.motion_gate
+    try: gate.configure(**config.model_dump())
+    except ValueError as e: raise HTTPException(422, str(e))
+    config_store.stage("global_settings", "setting_id", "motion_gate", gate.config())
+    return {**gate.config(), "stats": gate.stats()}
+
+@api_router.get("/engine/modules")
+async def get_module_guard():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    guard = gesture_engine.module_guard
+    return {**guard.config(), "modules": guard.stats()}
+
+@api_router.patch("/engine/modules")
+async def update_module_guard(config: ModuleGuardConfig):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    guard = gesture_engine.module_guard
+    try: guard.configure(**config.model_dump())
+    except ValueError as e: raise HTTPException(422, str(e))
+    config_store.stage("global_settings", "setting_id", "module_guard", guard.config())
+    return {**guard.config(), "modules": guard.stats()}
+
+@api_router.post("/engine/modules/{name}/reset")
+async def reset_module(name: str):
+    """Re-enable a module whose breaker is open, without waiting for the probe."""
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    guard = gesture_engine.module_guard
+    try: guard.reset(name)
+    except KeyError: raise HTTPException(404, f"Unknown module: {name}")
+    return {**guard.config(), "modules": guard.stats()}
+
 @api_router.get("/activity")
 async def get_activity_log():
     if not gesture_engine: return []
-    return list(getattr(gesture_engine, 'activity_log', []))
+    return [activity_entry(r) for r in list(gesture_engine.activity_log)]
+
+@api_router.get("/activity/history")
+async def get_activity_history(
+    gesture: Optional[str] = None, from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = None, bucket: str = "hour",
+):
+    """Per-gesture trigger counts per bucket (minute / hour / day), answered from the rollups."""
+    if not gesture_engine: return []
+    if bucket not in ACTIVITY_BUCKETS: raise HTTPException(422, f"bucket must be one of {list(ACTIVITY_BUCKETS)}")
+    rows = await asyncio.to_thread(
+        gesture_engine.activity_store.history, gesture,
+        from_.timestamp() if from_ else None, to.timestamp() if to else None, bucket,
+    )
+    return [{"start": datetime.fromtimestamp(start).astimezone().isoformat(), "gesture": g, "count": count} for start, g, count in rows]
 
 @api_router.get("/gestures")
-async def get_gestures():
+async def get_gestures(request: Request):
     if not gesture_engine: return []
-    res = []
-    settings = gesture_engine.gesture_settings.copy()
-    for k, v in settings.items():
-        data = v.copy(); data["id"] = k
-        res.append(data)
-    return res
+    # Snapshot body is serialized once per version; unchanged polls get a 304
+    snapshot = gesture_engine.settings.current
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 @api_router.patch("/gestures/{gesture_id}")
 async def update_gesture(gesture_id: str, config: GestureConfigUpdate):
     if not gesture_engine: raise HTTPException(500, "No Engine")
     data = config.model_dump(exclude_unset=True)
+    nulls = [k for k, v in data.items() if v is None]
+    if nulls: raise HTTPException(422, f"Fields cannot be null: {', '.join(nulls)}")
     if gesture_engine.update_gesture_config(gesture_id, data):
-        if db is not None:
-            try: await db.gesture_configs.update_one({"gesture_id": gesture_id}, {"$set": data}, upsert=True)
-            except: pass
-        return {"status": "updated"}
+        config_store.stage("gesture_configs", "gesture_id", gesture_id, data)
+        return {"status": "updated", "version": gesture_engine.settings.current.version}
     raise HTTPException(404, "Not found")
 
 # --- CUSTOM ACTIONS ENDPOINTS ---
@@ -113,8 +260,9 @@ async def update_gesture(gesture_id: str, config: GestureConfigUpdate):
 async def create_custom_action(action: CustomAction):
     if not gesture_engine: raise HTTPException(500, "No Engine")
     
-    # 1. Register in the live python engine
-    gesture_engine.register_custom_action(action.id, action.keys)
+    # 1. Register (compile) in the live python engine
+    try: gesture_engine.register_custom_action(action.id, action.keys, action.macro)
+    except ValueError as e: raise HTTPException(422, str(e))
     
     # 2. Save permanently to DB
     if db is not None:
@@ -134,6 +282,50 @@ async def get_custom_actions():
     return []
 
 
+# --- MOTION TEMPLATES ---
+@api_router.post("/motion-templates")
+async def create_motion_template(template: MotionTemplate):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    try: gesture_engine.register_motion_template(template.name, template.points, template.threshold)
+    except ValueError as e: raise HTTPException(422, str(e))
+    if db is not None:
+        try: await db.motion_templates.replace_one({"name": template.name}, template.model_dump(), upsert=True)
+        except: pass
+    return {"status": "created", "id": template.id, "gesture_id": f"motion_{template.name}"}
+
+@api_router.get("/motion-templates")
+async def get_motion_templates():
+    if not gesture_engine: return []
+    return list(gesture_engine.sequence_matcher.names)
+
+
+# --- SCREENSHOTS ---
+@api_router.get("/screenshots")
+async def get_screenshots(limit: int = 20):
+    if not gesture_engine: return []
+    captures = await asyncio.to_thread(gesture_engine.screenshots.recent, limit)
+    return [{**c, "thumbnail": f"/api/screenshots/{c['id']}/thumbnail"} for c in captures]
+
+@api_router.get("/screenshots/{capture_id}/thumbnail")
+async def get_screenshot_thumbnail(capture_id: str):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    data = await asyncio.to_thread(gesture_engine.screenshots.thumbnail, capture_id)
+    if data is None: raise HTTPException(404, "Not found")
+    return Response(content=data, media_type="image/jpeg", headers={"Cache-Control": "max-age=86400"})
+
+@api_router.get("/screenshots/config")
+async def get_screenshot_config():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    return gesture_engine.screenshots.config()
+
+@api_router.patch("/screenshots/config")
+async def update_screenshot_config(config: ScreenshotConfig):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    try: gesture_engine.screenshots.configure(config.format, config.png_level, config.webp_quality)
+    except ValueError as e: raise HTTPException(422, str(e))
+    return gesture_engine.screenshots.config()
+
+
 # --- NEW: SYSTEM SETTINGS ENDPOINTS ---
 @api_router.get("/settings/os")
 async def get_os_setting():
@@ -147,19 +339,77 @@ async def update_os_setting(settings: SystemSettings):
     # Update the live python engine
     gesture_engine.os_type = settings.os_type
     
-    # Save to database so it remembers on restart
-    if db is not None:
-        try: 
-            await db.global_settings.update_one(
-                {"setting_id": "os_layout"}, 
-                {"$set": {"os_type": settings.os_type}}, 
-                upsert=True
-            )
-        except: pass
-        
+    gesture_engine.events.publish("os", os_type=settings.os_type)
+    
+    # Save so it remembers on restart (batched write-behind)
+    config_store.stage("global_settings", "setting_id", "os_layout", {"os_type": settings.os_type})
+
     return {"status": "updated", "os_type": settings.os_type}
 
 
+# --- CALIBRATION ---
+# One session at a time: start it, follow the task prompts while the engine
+# runs (GET polls progress), advance with /next, then /save writes the profile
+# that training reads its samples from.
+@api_router.post("/calibration/session")
+async def start_calibration(request: CalibrationRequest):
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    return gesture_engine.start_calibration(request.gesture, request.user_id)
+
+@api_router.get("/calibration/session")
+async def get_calibration():
+    state = gesture_engine.calibration_state() if gesture_engine else None
+    if state is None: raise HTTPException(404, "No calibration session")
+    return state
+
+@api_router.post("/calibration/session/next")
+async def next_calibration_task():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    try: return gesture_engine.next_calibration_task()
+    except LookupError as e: raise HTTPException(404, str(e))
+    except ValueError as e: raise HTTPException(422, str(e))
+
+@api_router.post("/calibration/session/save")
+async def save_calibration():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    try: profile = await asyncio.to_thread(gesture_engine.save_calibration)
+    except LookupError as e: raise HTTPException(404, str(e))
+    except ValueError as e: raise HTTPException(422, str(e))
+    header = profile.header
+    return {"status": "saved", "user_id": header["user_id"], "gesture": header["gesture"],
+            "frames": header["shape"][0], "thresholds": profile.thresholds}
+
+@api_router.delete("/calibration/session")
+async def cancel_calibration():
+    if not gesture_engine: raise HTTPException(500, "No Engine")
+    gesture_engine.cancel_calibration()
+    return {"status": "cancelled"}
+
+@api_router.get("/calibration/profiles")
+async def list_calibration_profiles(user_id: str = "default"):
+    if not gesture_engine: return []
+    return await asyncio.to_thread(gesture_engine.calibration_store.list_profiles, user_id)
+
+
+# --- TRAINING ---
+@api_router.post("/training/jobs")
+async def create_training_job(request: TrainingJobRequest):
+    if not training_manager: raise HTTPException(500, "No Engine")
+    job = training_manager.create_job(request.user_id, request.gestures, request.epochs)
+    return job.snapshot()
+
+@api_router.get("/training/jobs")
+async def list_training_jobs():
+    if not training_manager: return []
+    return [job.snapshot() for job in training_manager.jobs.values()]
+
+@api_router.get("/training/jobs/{job_id}")
+async def get_training_job(job_id: str):
+    job = training_manager.jobs.get(job_id) if training_manager else None
+    if not job: raise HTTPException(404, "Not found")
+    return job.snapshot()
+
+
 # --- STATUS ---
 @api_router.post("/status")
 async def create_status(input: StatusCheck):
@@ -176,10 +426,16 @@ app.include_router(api_router)
 
 @app.on_event("startup")
 async def startup_event():
+    if gesture_engine is not None: gesture_engine.events.bind(asyncio.get_running_loop())
     if gesture_engine is not None and db is not None:
         try:
             await client.admin.command('ping') 
             
+            # 0. Load motion templates (before configs, which may remap their triggers)
+            async for template in db.motion_templates.find({}):
+                try: gesture_engine.register_motion_template(template['name'], template['points'], template.get('threshold', 4.0))
+                except ValueError as e: logger.warning(f"Skipping motion template {template['name']}: {e}")
+
             # 1. Load standard gesture configs
             cursor = db.gesture_configs.find({})
             async for config in cursor:
@@ -189,19 +445,77 @@ async def startup_event():
             # 2. Load custom shortcuts into engine on startup
             cursor_actions = db.custom_actions.find({})
             async for action in cursor_actions:
-                gesture_engine.register_custom_action(action['id'], action['keys'])
+                try: gesture_engine.register_custom_action(action['id'], action.get('keys', []), action.get('macro'))
+                except ValueError as e: logger.warning(f"Skipping custom action {action['id']}: {e}")
                 
             # 3. Load Global Settings (OS Type)
             os_setting = await db.global_settings.find_one({"setting_id": "os_layout"})
             if os_setting:
                 gesture_engine.os_type = os_setting.get("os_type", "windows")
+
+            # 3b. Hand landmarker options (applied when the detector is built)
+            landmarker = await db.global_settings.find_one({"setting_id": "landmarker"})
+            if landmarker:
+                try: gesture_engine.configure_landmarker(**landmarker)
+                except ValueError as e: logger.warning(f"Ignoring stored landmarker options: {e}")
+
+            # 3c. Keyframe tracking
+            tracking = await db.global_settings.find_one({"setting_id": "tracking"})
+            if tracking:
+                try: gesture_engine.landmark_tracker.configure(**{k: tracking.get(k) for k in gesture_engine.landmark_tracker.config()})
+                except ValueError as e: logger.warning(f"Ignoring stored tracking options: {e}")
+
+            # 3d. Motion gate
+            gate = await db.global_settings.find_one({"setting_id": "motion_gate"})
+            if gate:
+                try: gesture_engine.motion_gate.configure(**{k: gate.get(k) for k in gesture_engine.motion_gate.config()})
+                except ValueError as e: logger.warning(f"Ignoring stored motion gate options: {e}")
+
+            # 3e. Gesture module budget / circuit breaker
+            guard = await db.global_settings.find_one({"setting_id": "module_guard"})
+            if guard:
+                try: gesture_engine.module_guard.configure(**{k: guard.get(k) for k in gesture_engine.module_guard.config()})
+                except ValueError as e: logger.warning(f"Ignoring stored module guard options: {e}")
                 
         except Exception as e:
             logger.warning(f"MongoDB unavailable: {e}. Using defaults.")
 
+    # 4. Config writes journaled while MongoDB was unreachable (newer than MongoDB)
+    if gesture_engine is not None:
+        journaled = await asyncio.to_thread(config_store.journaled)
+        for (collection, _, key), fields in journaled.items():
+            if collection == "gesture_configs": gesture_engine.update_gesture_config(key, fields)
+            elif collection == "global_settings" and key == "os_layout":
+                gesture_engine.os_type = fields.get("os_type", gesture_engine.os_type)
+            elif collection == "global_settings" and key == "landmarker":
+                try: gesture_engine.configure_landmarker(**fields)
+                except ValueError as e: logger.warning(f"Ignoring journaled landmarker options: {e}")
+            elif collection == "global_settings" and key == "tracking":
+                try: gesture_engine.landmark_tracker.configure(**{k: fields.get(k) for k in gesture_engine.landmark_tracker.config()})
+                except ValueError as e: logger.warning(f"Ignoring journaled tracking options: {e}")
+            elif collection == "global_settings" and key == "motion_gate":
+                try: gesture_engine.motion_gate.configure(**{k: fields.get(k) for k in gesture_engine.motion_gate.config()})
+                except ValueError as e: logger.warning(f"Ignoring journaled motion gate options: {e}")
+            elif collection == "global_settings" and key == "module_guard":
+                try: gesture_engine.module_guard.configure(**{k: fields.get(k) for k in gesture_engine.module_guard.config()})
+                except ValueError as e: logger.warning(f"Ignoring journaled module guard options: {e}")
+    config_store.start()
+
+    # 5. Load the model / OS backends in the background so the first start is instant
+    if gesture_engine is not None and os.environ.get('ENGINE_WARMUP', '1') != '0':
+        asyncio.create_task(_warm_up_engine())
+
+async def _warm_up_engine():
+    try: await asyncio.to_thread(gesture_engine.warm_up)
+    except Exception as e: logger.warning(f"Engine warm-up failed: {e}")
+
 @app.on_event("shutdown")
 async def shutdown_event():
-    if gesture_engine: gesture_engine.stop()
+    await config_store.close()
+    if gesture_engine:
+        gesture_engine.stop()
+        gesture_engine.activity_store.close()
+    if training_manager: training_manager.shutdown()
     if client: client.close()
 
 @app.websocket("/ws/video")
@@ -217,4 +531,45 @@ async def video_feed(websocket: WebSocket):
             else: await asyncio.sleep(0.5)
     except: pass
 
-app.add_middleware(CORSMiddleware, allow_credentials=True, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
\ No newline at end of file
+@app.websocket("/ws/training/{job_id}")
+async def training_feed(websocket: WebSocket, job_id: str):
+    await websocket.accept()
+    job = training_manager.jobs.get(job_id) if training_manager else None
+    if not job: await websocket.close(); return
+    sent = 0
+    try:
+        while True:
+            events = job.events[sent:]
+            for event in events: await websocket.send_json(event)
+            sent += len(events)
+            if job.status in ("completed", "failed") and sent == len(job.events): break
+            await asyncio.sleep(0.1)
+        await websocket.close()
+    except: pass
+
+def _events_snapshot():
+    """Full dashboard state; event deltas apply on top of its seq."""
+    seq = gesture_engine.events.seq  # Read first: anything newer is replayed after the snapshot
+    return {
+        "seq": seq, "type": "snapshot", "running": gesture_engine.running, "count": gesture_engine.total_gesture_count,
+        "mode": gesture_engine.arbiter.mode, "os_type": gesture_engine.os_type,
+        "settings_version": gesture_engine.settings.current.version, "activity": [activity_entry(r) for r in list(gesture_engine.activity_log)],
+    }
+
+@app.websocket("/ws/events")
+async def events_feed(websocket: WebSocket, since: Optional[int] = None):
+    await websocket.accept()
+    if not gesture_engine: await websocket.close(); return
+    bus = gesture_engine.events
+    try:
+        # Resume from the client's cursor when history still covers it, else start from a snapshot
+        if since is None or not bus.can_resume(since):
+            snapshot = _events_snapshot()
+            await websocket.send_json(snapshot)
+            since = snapshot["seq"]
+        async with aclosing(bus.subscribe(since)) as events:
+            async for event in events: await websocket.send_json(event)
+        await websocket.close()  # "reset": client reconnects without a cursor
+    except (WebSocketDisconnect, RuntimeError): pass
+
+app.add_middleware(CORSMiddleware, allow_credentials=True, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"], expose_headers=["ETag"])
\ No newline at end of file
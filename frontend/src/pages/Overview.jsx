@@ -4,7 +4,7 @@ import { StatusCard } from '@/components/dashboard/StatusCard';
 import CameraFeed from '@/components/dashboard/CameraFeed';
 import { ActivityLog } from '@/components/dashboard/ActivityLog';
 import { Switch } from '@/components/ui/switch';
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { toast } from 'sonner';
 
 export default function Overview() {
@@ -16,31 +16,58 @@ export default function Overview() {
   // --- NEW: OS SYSTEM STATE ---
   const [osType, setOsType] = useState('windows');
 
-  const fetchData = async () => {
-    try {
-      const statusRes = await fetch('http://127.0.0.1:8000/api/engine/status');
-      const statusData = await statusRes.json();
-      setIsSystemActive(statusData.running);
-      setTotalCount(statusData.count || 0);
-
-      const activityRes = await fetch('http://127.0.0.1:8000/api/activity');
-      const activityData = await activityRes.json();
-      if (Array.isArray(activityData)) setActivities(activityData);
+  // --- LIVE EVENTS: snapshot on connect, then incremental pushes (no polling) ---
+  const lastSeq = useRef(null);
 
-      // --- NEW: Fetch Layout Status ---
-      const osRes = await fetch('http://127.0.0.1:8000/api/settings/os');
-      const osData = await osRes.json();
-      setOsType(osData.os_type || 'windows');
-
-    } catch (e) {
-      console.error("Sync failed");
+  const applyEvent = (event) => {
+    lastSeq.current = event.seq;
+    switch (event.type) {
+      case 'snapshot':
+        setIsSystemActive(event.running);
+        setTotalCount(event.count || 0);
+        setOsType(event.os_type || 'windows');
+        setActivities(event.activity || []);
+        break;
+      case 'engine':
+        setIsSystemActive(event.running);
+        break;
+      case 'activity': {
+        const entry = { id: event.ts.toFixed(6), gesture: event.gesture, action: event.action, time: event.ts * 1000 };
+        setTotalCount(event.count);
+        setActivities(prev => [entry, ...prev.filter(a => a.id !== entry.id)].slice(0, 20));
+        break;
+      }
+      case 'os':
+        setOsType(event.os_type);
+        break;
+      case 'reset':
+        lastSeq.current = null; // Too far behind: next connection starts from a snapshot
+        break;
+      default:
+        break;
     }
   };
 
   useEffect(() => {
-    fetchData();
-    const interval = setInterval(fetchData, 1000);
-    return () => clearInterval(interval);
+    let ws = null;
+    let retry = null;
+    let closed = false;
+
+    const connect = () => {
+      const cursor = lastSeq.current != null ? `?since=${lastSeq.current}` : '';
+      ws = new WebSocket(`ws://127.0.0.1:8000/ws/events${cursor}`);
+      ws.onmessage = (msg) => applyEvent(JSON.parse(msg.data));
+      ws.onclose = () => {
+        if (!closed) retry = setTimeout(connect, 1000); // Resume from lastSeq
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retry);
+      if (ws) ws.close();
+    };
   }, []);
 
   const toggleSystem = async (checked) => {
@@ -1,7 +1,8 @@
 import { motion } from 'framer-motion';
-import { useState } from 'react';
-import { Activity, CheckCircle, AlertCircle, TrendingUp, Database } from 'lucide-react';
+import { useEffect, useState } from 'react';
+import { Activity, CheckCircle, AlertCircle, TrendingUp, Database, Hand } from 'lucide-react';
 import { Button } from '@/components/ui/button';
+import { Input } from '@/components/ui/input';
 import { Progress } from '@/components/ui/progress';
 import { cn } from '@/lib/utils';
 
@@ -23,51 +24,128 @@ export default function RetrainModel() {
     samples: 0
   });
 
-  const handleStartTraining = () => {
+  const [error, setError] = useState(null);
+
+  // Calibration: each session records one custom gesture's training samples
+  const [calibrationName, setCalibrationName] = useState('');
+  const [calibration, setCalibration] = useState(null);
+  const [profiles, setProfiles] = useState([]);
+  const [calibrationError, setCalibrationError] = useState(null);
+
+  const fetchProfiles = async () => {
+    try {
+      const res = await fetch('http://127.0.0.1:8000/api/calibration/profiles?user_id=default');
+      if (res.ok) setProfiles(await res.json());
+    } catch (err) {
+      console.warn('Calibration profiles unavailable:', err.message);
+    }
+  };
+
+  useEffect(() => { fetchProfiles(); }, []);
+
+  // Poll the session while it runs (frames arrive from the running engine)
+  useEffect(() => {
+    if (!calibration) return undefined;
+    const interval = setInterval(async () => {
+      try {
+        const res = await fetch('http://127.0.0.1:8000/api/calibration/session');
+        if (res.ok) setCalibration(await res.json());
+      } catch (err) {
+        console.warn('Calibration poll failed:', err.message);
+      }
+    }, 300);
+    return () => clearInterval(interval);
+  }, [calibration !== null]);
+
+  const calibrationRequest = async (path, options = {}) => {
+    setCalibrationError(null);
+    try {
+      const res = await fetch(`http://127.0.0.1:8000/api/calibration/${path}`, options);
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.detail || 'Calibration request failed');
+      return data;
+    } catch (err) {
+      setCalibrationError(err.message);
+      return null;
+    }
+  };
+
+  const handleStartCalibration = async () => {
+    const state = await calibrationRequest('session', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ gesture: calibrationName.trim(), user_id: 'default' })
+    });
+    if (state) setCalibration(state);
+  };
+
+  const handleCalibrationStep = async () => {
+    if (!calibration.complete) {
+      const state = await calibrationRequest('session/next', { method: 'POST' });
+      if (state) setCalibration(state);
+      return;
+    }
+    if (await calibrationRequest('session/save', { method: 'POST' })) {
+      setCalibration(null);
+      setCalibrationName('');
+      fetchProfiles();
+    }
+  };
+
+  const handleCancelCalibration = async () => {
+    await calibrationRequest('session', { method: 'DELETE' });
+    setCalibration(null);
+  };
+
+  const handleStartTraining = async () => {
     setIsTraining(true);
     setProgress(0);
     setCurrentStage(1);
     setTrainingComplete(false);
+    setError(null);
 
-    // Simulate training progress
-    let stage = 1;
-    let prog = 0;
-    const interval = setInterval(() => {
-      prog += 2;
-      setProgress(prog);
+    try {
+      // 1. Queue a real training job on the backend
+      const res = await fetch('http://127.0.0.1:8000/api/training/jobs', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ user_id: 'default' })
+      });
+      if (!res.ok) throw new Error('Could not start training');
+      const job = await res.json();
 
-      // Update metrics during training
-      if (stage === 2) {
-        setMetrics({
-          accuracy: Math.min(95, 70 + prog * 0.25),
-          loss: Math.max(0.05, 2 - prog * 0.019),
-          samples: Math.floor(1000 + prog * 5)
-        });
-      }
-
-      // Progress through stages
-      if (prog >= 25 && stage === 1) {
-        stage = 2;
-        setCurrentStage(2);
-      } else if (prog >= 75 && stage === 2) {
-        stage = 3;
-        setCurrentStage(3);
-      } else if (prog >= 95 && stage === 3) {
-        stage = 4;
-        setCurrentStage(4);
-      }
+      // 2. Stream progress, loss and accuracy until the job finishes
+      const ws = new WebSocket(`ws://127.0.0.1:8000/ws/training/${job.id}`);
+      ws.onmessage = (msg) => {
+        const event = JSON.parse(msg.data);
+        if (event.stage) setCurrentStage(event.stage);
+        setProgress(event.progress ?? 0);
+        setMetrics(prev => ({
+          accuracy: event.accuracy != null ? event.accuracy * 100 : prev.accuracy,
+          loss: event.loss != null ? event.loss : prev.loss,
+          samples: event.samples || prev.samples
+        }));
 
-      if (prog >= 100) {
-        clearInterval(interval);
+        if (event.status === 'completed') {
+          setIsTraining(false);
+          setTrainingComplete(true);
+          ws.close();
+        } else if (event.status === 'failed') {
+          setIsTraining(false);
+          setCurrentStage(0);
+          setError(event.error || 'Training failed');
+          ws.close();
+        }
+      };
+      ws.onerror = () => {
         setIsTraining(false);
-        setTrainingComplete(true);
-        setMetrics({
-          accuracy: 94.7,
-          loss: 0.08,
-          samples: 1500
-        });
-      }
-    }, 80);
+        setError('Lost connection to training job');
+      };
+    } catch (err) {
+      setIsTraining(false);
+      setCurrentStage(0);
+      setError(err.message);
+    }
   };
 
   return (
@@ -120,6 +198,76 @@ export default function RetrainModel() {
           </div>
         </motion.div>
 
+        {/* Calibration */}
+        <motion.div
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ delay: 0.1 }}
+          className="rounded-2xl border border-white/10 bg-[#18181B] p-8"
+        >
+          <div className="flex items-center gap-3 mb-4">
+            <div className="p-2 rounded-lg bg-violet-500/10 border border-violet-500/20">
+              <Hand className="w-4 h-4 text-violet-400" />
+            </div>
+            <h3 className="text-lg font-semibold text-white">Calibrate a Custom Gesture</h3>
+          </div>
+
+          {calibration ? (
+            <div className="space-y-4">
+              <div className="flex items-center justify-between text-sm">
+                <span className="text-white font-medium">
+                  {calibration.gesture}: {calibration.desc} ({calibration.task_idx + 1} of {calibration.task_count})
+                </span>
+                <span className={cn(
+                  'font-medium',
+                  calibration.status === 'error' ? 'text-red-400' : calibration.status === 'success' ? 'text-green-400' : 'text-violet-400'
+                )}>
+                  {calibration.status === 'error' ? 'Adjust your hand' : `${calibration.progress}%`}
+                </span>
+              </div>
+              <Progress value={calibration.progress} className="h-2" />
+              <div className="flex gap-3">
+                <Button
+                  variant="outline"
+                  onClick={handleCancelCalibration}
+                  className="flex-1 bg-white/5 border-white/10 text-white hover:bg-white/10"
+                >
+                  Cancel
+                </Button>
+                <Button
+                  onClick={handleCalibrationStep}
+                  disabled={calibration.status !== 'success'}
+                  className="flex-1 bg-violet-500 hover:bg-violet-600 text-white font-semibold disabled:opacity-50"
+                >
+                  {calibration.complete ? 'Save Gesture' : 'Next Position'}
+                </Button>
+              </div>
+            </div>
+          ) : (
+            <div className="flex gap-3">
+              <Input
+                placeholder="Gesture name, e.g. Thumbs Up"
+                value={calibrationName}
+                onChange={(e) => setCalibrationName(e.target.value)}
+                className="bg-white/5 border-white/10 focus:border-violet-500/50 text-white"
+              />
+              <Button
+                onClick={handleStartCalibration}
+                disabled={!calibrationName.trim()}
+                className="bg-violet-500 hover:bg-violet-600 text-white font-semibold disabled:opacity-50"
+              >
+                Start Calibration
+              </Button>
+            </div>
+          )}
+
+          <p className="mt-4 text-xs text-muted-foreground">
+            The engine must be running. Hold the pose in each position until the bar fills.
+            {profiles.length > 0 && ` Calibrated: ${profiles.join(', ')}.`}
+          </p>
+          {calibrationError && <p className="mt-2 text-sm text-red-400">{calibrationError}</p>}
+        </motion.div>
+
         {/* Training Interface */}
         <motion.div
           initial={{ opacity: 0, y: 20 }}
@@ -229,6 +377,14 @@ export default function RetrainModel() {
             </motion.div>
           )}
 
+          {/* Error Message */}
+          {error && (
+            <div className="mb-6 p-4 rounded-xl bg-red-500/10 border border-red-500/30 flex items-center gap-3">
+              <AlertCircle className="w-5 h-5 text-red-400" />
+              <p className="text-sm text-red-400">{error}</p>
+            </div>
+          )}
+
           {/* Action Button */}
           <Button
             onClick={handleStartTraining}
@@ -259,7 +415,7 @@ export default function RetrainModel() {
           <div>
             <p className="text-sm font-semibold text-yellow-400 mb-1">Note</p>
             <p className="text-sm text-muted-foreground">
-              Retraining will temporarily disable gesture recognition for 2-3 minutes. Ensure you have enough training samples for optimal results.
+              Training runs in the background and the new model is swapped in without stopping gesture recognition. Calibrate at least two custom gestures above first.
             </p>
           </div>
         </motion.div>
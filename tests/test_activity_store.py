@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from core.activity_store import ActivityStore, activity_entry, bucket_start
+
+DAY = bucket_start(time.time() - 86400, 86400)  # Yesterday 00:00 local, inside every retention window
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ActivityStore(str(tmp_path / "activity.db"))
+    yield store
+    if store._writer.is_alive(): store.close()
+
+
+def test_close_flushes_every_record(store):
+    for i in range(2500): store.record(DAY + i, "swipe", "next")
+    store.close()
+    assert store.written == 2500 and store.error is None
+
+
+def test_rollups_count_per_bucket(store):
+    store.record(DAY + 10, "swipe", "next")
+    store.record(DAY + 50, "swipe", "prev")
+    store.record(DAY + 70, "swipe", "next")
+    store.record(DAY + 3700, "snap", "screenshot")
+    store.close()
+
+    assert store.history(start=DAY, end=DAY + 86400, bucket="minute") == [
+        (DAY, "swipe", 2), (DAY + 60, "swipe", 1), (DAY + 3660, "snap", 1)]
+    assert store.history(start=DAY, end=DAY + 86400) == [(DAY, "swipe", 3), (DAY + 3600, "snap", 1)]
+    assert store.history(gesture="snap", start=DAY, end=DAY + 86400, bucket="day") == [(DAY, "snap", 1)]
+
+
+@pytest.fixture
+def india_time(monkeypatch):
+    monkeypatch.setenv("TZ", "Asia/Kolkata")  # UTC+05:30, no DST
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_buckets_follow_local_time(india_time, tmp_path):
+    store = ActivityStore(str(tmp_path / "activity.db"))
+    midnight = int(time.mktime((2026, 10, 18, 0, 0, 0, 0, 0, -1)))
+    assert midnight % 3600 == 1800  # Local midnight sits on a UTC half hour
+    store.record(midnight + 10, "swipe", "next")
+    store.record(midnight + 3599, "swipe", "next")
+    store.record(midnight - 10, "snap", "screenshot")  # Late the previous evening
+    store.close()
+
+    assert store.history(start=midnight, end=midnight + 86400, bucket="day") == [(midnight, "swipe", 2)]
+    assert store.history(start=midnight, end=midnight + 86400) == [(midnight, "swipe", 2)]
+    assert store.history(start=midnight - 60, end=midnight, bucket="minute") == [(midnight - 60, "snap", 1)]
+    assert time.localtime(store.history(gesture="snap", bucket="day", start=midnight - 86400, end=midnight)[0][0])[:6] == (
+        2026, 10, 17, 0, 0, 0)
+
+
+def test_day_buckets_span_dst_changes(monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        fall_back = int(time.mktime((2026, 11, 1, 0, 0, 0, 0, 0, -1)))  # 25-hour day
+        assert bucket_start(fall_back + 24.5 * 3600, 86400) == fall_back
+        assert bucket_start(fall_back + 25 * 3600, 86400) == fall_back + 25 * 3600
+        assert bucket_start(fall_back + 3 * 3600 + 5, 3600) == fall_back + 3 * 3600
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_recent_is_newest_first(store):
+    for i, gesture in enumerate(["swipe", "snap", "copy"]): store.record(DAY + i, gesture, None)
+    store.close()
+    assert [gesture for _, gesture, _ in store.recent(2)] == ["copy", "snap"]
+
+
+def test_unwritable_path_keeps_record_cheap(tmp_path):
+    store = ActivityStore(str(tmp_path / "missing" / "activity.db"))
+    store.record(DAY, "swipe", "next")
+    store.close()
+    assert store.error and store.written == 0
+
+
+def test_activity_entry():
+    entry = activity_entry((DAY + 0.5, "swipe", "next"))
+    assert entry["id"] == f"{DAY + 0.5:.6f}"
+    assert entry["gesture"] == "swipe" and entry["action"] == "next" and entry["time"]
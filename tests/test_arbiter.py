@@ -0,0 +1,57 @@
+from core.arbiter import IDLE, GestureArbiter
+
+
+def test_idle_allows_every_gesture_but_mode_owned_ones():
+    arbiter = GestureArbiter()
+    assert arbiter.propose(set()) == IDLE
+    assert arbiter.allows("swipe") and arbiter.allows("snap") and arbiter.allows("volume")
+    assert not arbiter.allows("zoom") and not arbiter.allows("text_mode") and not arbiter.allows("circular")
+
+
+def test_mode_locks_out_incompatible_gestures():
+    arbiter = GestureArbiter()
+    assert arbiter.propose({"text"}) == "text"
+    assert arbiter.allows("text_mode") and arbiter.allows("volume")
+    assert not arbiter.allows("swipe") and not arbiter.allows("copy")
+
+
+def test_higher_priority_pose_preempts_immediately():
+    arbiter = GestureArbiter()
+    arbiter.propose({"text"})
+    assert arbiter.propose({"zoom", "text"}) == "zoom"
+
+
+def test_mode_survives_release_frames_without_its_pose():
+    arbiter = GestureArbiter(release_frames=3)
+    arbiter.propose({"drawing_circle"})
+    assert arbiter.propose(set()) == "drawing_circle"
+    assert arbiter.propose(set()) == "drawing_circle"
+    assert arbiter.propose(set()) == IDLE
+
+
+def test_claim_locks_out_other_one_shots_for_the_frame_only():
+    arbiter = GestureArbiter()
+    arbiter.propose(set())
+    arbiter.claim("custom_fist")
+    assert arbiter.allows("custom_fist")
+    assert not arbiter.allows("swipe") and not arbiter.allows("screenshot")
+    assert arbiter.allows("volume") and arbiter.allows("mouse_beta")  # Continuous controls keep running
+    arbiter.propose(set())
+    assert arbiter.allows("swipe")
+
+
+def test_no_claim_leaves_one_shots_available():
+    # A gesture that was recognized but did not fire (disabled, cooling down)
+    # must not claim: the next one-shot in the frame still gets its chance.
+    arbiter = GestureArbiter()
+    arbiter.propose(set())
+    assert arbiter.allows("custom_fist")
+    assert arbiter.allows("swipe") and arbiter.allows("snap") and arbiter.allows("copy")
+
+
+def test_reset_returns_to_idle():
+    arbiter = GestureArbiter()
+    arbiter.propose({"zoom"})
+    arbiter.claim("zoom")
+    arbiter.reset()
+    assert arbiter.mode == IDLE and arbiter.claimed is None
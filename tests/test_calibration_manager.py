@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.calibration_manager import DEFAULT_THRESHOLDS, CalibrationManager
+
+# Wrist-relative (x, y) of an open hand with a 0.15 palm (wrist -> middle MCP)
+# and the reference finger proportions
+HAND = np.zeros((21, 2))
+HAND[[1, 2, 3, 4]] = [(-0.04, -0.03), (-0.07, -0.06), (-0.09, -0.09), (-0.10, -0.12)]
+for base, x in zip((5, 9, 13, 17), (-0.04, 0.0, 0.035, 0.065)):
+    length = 0.1275 if base == 9 else 0.11
+    HAND[base:base + 4] = [(x, -0.15 + 0.01 * (base != 9)), (x, -0.15 - length / 3),
+                           (x, -0.15 - 2 * length / 3), (x, -0.15 - length)]
+
+
+def still_session(wrist, noise, frames=60, seed=0):
+    rng = np.random.default_rng(seed)
+    manager = CalibrationManager()
+    manager.start_session("swipe")
+    for _ in range(frames):
+        points = HAND + wrist + rng.normal(0, noise, HAND.shape)
+        manager.collected_data[0].append([[x, y, 0.0] for x, y in points])
+    return manager
+
+
+@pytest.mark.parametrize("wrist", [(0.35, 0.65), (0.5, 0.5), (0.65, 0.4)])
+def test_still_hand_keeps_thresholds_near_the_defaults(wrist):
+    thresholds = still_session(np.array(wrist), noise=0.001).derive_thresholds()
+    for name, default in DEFAULT_THRESHOLDS.items():
+        assert thresholds[name] == pytest.approx(default, rel=0.2), name
+    assert thresholds["swipe_tabs.speed_threshold"] < 0.35  # Engine swipe gate
+
+
+def test_jitter_raises_the_floor_wherever_the_hand_is():
+    near = still_session(np.array((0.35, 0.65)), noise=0.004).derive_thresholds()
+    far = still_session(np.array((0.65, 0.4)), noise=0.004).derive_thresholds()
+    assert near["swipe_tabs.speed_threshold"] > DEFAULT_THRESHOLDS["swipe_tabs.speed_threshold"]
+    assert near["swipe_tabs.speed_threshold"] == pytest.approx(far["swipe_tabs.speed_threshold"], rel=0.2)
+
+
+def test_no_frames_no_thresholds():
+    assert CalibrationManager().derive_thresholds() == {}
+
+
+def test_center_task_rejects_an_off_center_hand():
+    manager = CalibrationManager()
+    manager.start_session("swipe")
+    landmarks = [SimpleNamespace(x=x + 0.9, y=y + 0.5, z=0.0) for x, y in HAND]
+    manager.process_landmarks(landmarks)
+    assert manager.status == "error" and manager.progress == 0
+
+
+def run_session(manager, gesture, offset=0.0):
+    manager.start_session(gesture)
+    while True:
+        while manager.status != "success":
+            manager.process_landmarks([SimpleNamespace(x=x + 0.5, y=y + 0.6 + offset, z=0.0) for x, y in HAND])
+        if not manager.next_task(): break
+    return manager
+
+
+def test_finished_session_is_saved_as_training_samples(tmp_path):
+    from core.calibration_store import CalibrationStore
+    from core.training import TrainingJob, TrainingManager
+
+    store = CalibrationStore(str(tmp_path))
+    for gesture, offset in (("fist", 0.0), ("peace", 0.05)):
+        manager = run_session(CalibrationManager(store), gesture, offset)
+        assert manager.complete and manager.get_ui_state()["complete"]
+        profile = manager.save_profile("default")
+        assert len(profile.frames) == 50 * len(manager.tasks)
+        assert set(profile.thresholds) == set(DEFAULT_THRESHOLDS)
+
+    features, labels, classes = TrainingManager(store, str(tmp_path / "model.npz"))._load_samples(TrainingJob("default", None, 1))
+    assert classes == ["fist", "peace"] and len(features) == len(labels) == 500
+
+
+def test_session_is_not_complete_before_the_last_task():
+    manager = CalibrationManager()
+    manager.start_session("fist")
+    for _ in range(50): manager.process_landmarks([SimpleNamespace(x=x + 0.5, y=y + 0.6, z=0.0) for x, y in HAND])
+    assert manager.status == "success" and not manager.complete
@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pytest
+
+from core.calibration_store import CalibrationProfile, CalibrationStore
+
+
+def session(frames_per_task=(3, 2), value=0.5):
+    return {task: [[[value + task, value, 0.1]] * 21] * count for task, count in enumerate(frames_per_task)}
+
+
+def test_round_trip(tmp_path):
+    store = CalibrationStore(str(tmp_path))
+    profile = store.save("alice", "fist", session(), {"pro_snap.touch_dist": 0.06})
+    assert profile.frames.shape == (5, 21, 3) and profile.frames.dtype == np.float16
+    assert profile.task_frames(1)[0, 0, 0] == pytest.approx(1.5)
+    assert profile.thresholds == {"pro_snap.touch_dist": 0.06}
+
+    reopened = CalibrationProfile(profile.path)
+    assert reopened.header["task_counts"] == [3, 2]
+    assert isinstance(reopened.frames, np.memmap)
+    assert reopened.header["data_offset"] % 16 == 0
+
+
+def test_empty_session(tmp_path):
+    profile = CalibrationStore(str(tmp_path)).save("alice", "fist", {0: []})
+    assert profile.frames.shape == (0, 21, 3)
+
+
+def test_listing_and_unsafe_names(tmp_path):
+    store = CalibrationStore(str(tmp_path))
+    store.save("alice", "thumbs up", session())
+    store.save("alice", "../peace", session())
+    assert store.list_profiles("alice") == ["___peace", "thumbs_up"]
+    assert store.list_profiles("bob") == []
+    assert store.load("alice", "missing") is None
+    assert sorted(os.listdir(tmp_path)) == ["alice"]
+
+
+def test_not_a_profile(tmp_path):
+    path = tmp_path / "bogus.xlcp"
+    path.write_bytes(b"JUNK" + bytes(12))
+    with pytest.raises(ValueError):
+        CalibrationProfile(str(path)).header
+
+
+def test_thresholds_merge_newest_session_first(tmp_path, monkeypatch):
+    from core import calibration_store
+    clock = iter([100.0, 200.0, 300.0])
+    monkeypatch.setattr(calibration_store.time, "time", lambda: next(clock))
+
+    store = CalibrationStore(str(tmp_path))
+    store.save("alice", "zzz", session(), {"a": 1, "b": 1})
+    store.save("alice", "aaa", session(), {"a": 2})
+    assert store.user_thresholds("alice") == {"a": 2, "b": 1}
+
+    store.save("alice", "zzz", session(), {"a": 3})  # Re-calibrated: now the newest
+    assert store.user_thresholds("alice") == {"a": 3}
+
+
+def test_profiles_without_a_save_time_use_the_file_time(tmp_path):
+    store = CalibrationStore(str(tmp_path))
+    profile = store.save("alice", "fist", session())
+    del profile.header["saved_at"]
+    os.utime(profile.path, (1234.0, 1234.0))
+    assert profile.saved_at == 1234.0
@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import pytest
+
+from core import config_store
+from core.config_store import ConfigStore
+
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db, self.name = db, name
+
+    async def bulk_write(self, ops, ordered=True):
+        if self.db.down: raise ConnectionError("mongo down")
+        self.db.writes.append((self.name, len(ops)))
+
+
+class FakeDB:
+    def __init__(self):
+        self.down = False
+        self.writes = []
+
+    def __getitem__(self, name):
+        return FakeCollection(self, name)
+
+
+def test_stage_coalesces_per_document():
+    store = ConfigStore(None, "unused")
+    for value in range(50): store.stage("global_settings", "setting_id", "mouse", {"smoothing": value})
+    store.stage("global_settings", "setting_id", "mouse", {"speed": 2})
+    store.stage("gestures", "gesture_id", "swipe", {"enabled": False})
+    assert store.pending() == 2
+    assert store._pending[("global_settings", "setting_id", "mouse")] == {"smoothing": 49, "speed": 2}
+
+
+def test_without_mongo_writes_go_to_the_journal(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    store = ConfigStore(None, path)
+    store.stage("gestures", "gesture_id", "swipe", {"enabled": False})
+    asyncio.run(store.flush())
+    store.stage("gestures", "gesture_id", "swipe", {"cooldown": 2.0})
+    asyncio.run(store.flush())
+    assert store.pending() == 0
+    assert ConfigStore(None, path).journaled() == {("gestures", "gesture_id", "swipe"): {"enabled": False, "cooldown": 2.0}}
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    entry = {"collection": "gestures", "key_field": "gesture_id", "key": "snap", "fields": {"enabled": True}, "ts": 0}
+    path.write_text(json.dumps(entry) + "\n" + '{"collection": "gest')
+    assert ConfigStore(None, str(path)).journaled() == {("gestures", "gesture_id", "snap"): {"enabled": True}}
+
+
+def test_journal_is_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_store, "COMPACT_LINES", 5)
+    path = tmp_path / "journal.jsonl"
+    store = ConfigStore(None, str(path))
+    for value in range(10):
+        store.stage("global_settings", "setting_id", "mouse", {"smoothing": value})
+        asyncio.run(store.flush())
+    assert len(path.read_text().splitlines()) <= 5
+    assert store.journaled() == {("global_settings", "setting_id", "mouse"): {"smoothing": 9}}
+
+
+def test_close_flushes_pending(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    store = ConfigStore(None, path)
+    store.stage("gestures", "gesture_id", "swipe", {"enabled": False})
+    asyncio.run(store.close())
+    assert ConfigStore(None, path).journaled()
+
+
+def test_mongo_outage_journals_then_replays(tmp_path):
+    pytest.importorskip("pymongo")
+    path = str(tmp_path / "journal.jsonl")
+    db = FakeDB()
+    store = ConfigStore(db, path, retry_interval=0)
+    db.down = True
+    store.stage("gestures", "gesture_id", "swipe", {"enabled": False})
+    asyncio.run(store.flush())
+    assert store.journaled() and not db.writes
+
+    db.down = False
+    store.stage("global_settings", "setting_id", "mouse", {"speed": 2})
+    asyncio.run(store.flush())
+    assert sorted(db.writes) == [("gestures", 1), ("global_settings", 1)]
+    assert store.journaled() == {}
@@ -0,0 +1,34 @@
+import threading
+import time
+from unittest import mock
+
+from core import engine as engine_module
+from core.engine import GestureEngine
+
+
+def test_concurrent_starts_open_one_capture(monkeypatch):
+    engine = GestureEngine.__new__(GestureEngine)  # Lifecycle only: runtime parts are mocks
+    engine.running = False
+    engine.detector = None
+    engine.processing_thread = None
+    engine._runtime_lock = threading.Lock()
+    engine._lifecycle_lock = threading.Lock()
+    for name in ("landmark_tracker", "motion_gate", "hand_tracker", "cursor_output", "scroll_output", "macros",
+                 "joystick", "zoom_driver", "screenshots", "volume_control", "events"):
+        setattr(engine, name, mock.Mock())
+    engine.apply_calibration = mock.Mock()
+    engine._refresh_detector = mock.Mock()
+    engine._run_loop = lambda: None
+    builds = []
+    engine._build_runtime = lambda: (builds.append(1), time.sleep(0.05))  # The slow first-start model load
+    cv2 = mock.Mock()
+    monkeypatch.setattr(engine_module, "cv2", cv2)
+
+    threads = [threading.Thread(target=engine.start) for _ in range(4)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    assert engine.running
+    assert len(builds) == 1
+    assert cv2.VideoCapture.call_count == 1
+    assert engine.volume_control.start.call_count == 1
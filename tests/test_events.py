@@ -0,0 +1,66 @@
+import asyncio
+
+from core.events import EventBus
+
+
+async def take(agen, n):
+    return [await asyncio.wait_for(agen.__anext__(), 1) for _ in range(n)]
+
+
+def test_publish_numbers_events_and_keeps_history():
+    bus = EventBus(history=3)
+    events = [bus.publish("gesture", name=f"g{i}") for i in range(5)]
+    assert [e["seq"] for e in events] == [1, 2, 3, 4, 5]
+    assert events[-1]["name"] == "g4" and bus.seq == 5
+    assert [e["seq"] for e in bus._history] == [3, 4, 5]
+
+
+def test_can_resume():
+    bus = EventBus(history=3)
+    assert bus.can_resume(0)
+    for _ in range(5): bus.publish("tick")
+    assert bus.can_resume(2) and bus.can_resume(5)
+    assert not bus.can_resume(1)   # Event 2 is gone
+    assert not bus.can_resume(9)   # Cursor from a previous run
+
+
+def test_subscribe_replays_history_then_goes_live():
+    async def run():
+        bus = EventBus()
+        bus.bind(asyncio.get_running_loop())
+        for _ in range(3): bus.publish("tick")
+        stream = bus.subscribe(1)
+        backlog = await take(stream, 2)
+        bus.publish("live")
+        live = await take(stream, 1)
+        await stream.aclose()
+        return backlog, live, bus
+    backlog, live, bus = asyncio.run(run())
+    assert [e["seq"] for e in backlog] == [2, 3]
+    assert live[0]["type"] == "live" and live[0]["seq"] == 4
+    assert not bus._subscribers
+
+
+def test_subscribe_past_history_gets_a_reset():
+    async def run():
+        bus = EventBus(history=2)
+        for _ in range(5): bus.publish("tick")
+        return [event async for event in bus.subscribe(0)]
+    events = asyncio.run(run())
+    assert len(events) == 1 and events[0]["type"] == "reset" and events[0]["seq"] == 0
+
+
+def test_overflowing_subscriber_catches_up_from_history():
+    async def run():
+        bus = EventBus(history=100, queue_size=2)
+        bus.bind(asyncio.get_running_loop())
+        stream = bus.subscribe(0)
+        bus.publish("first")
+        first = await take(stream, 1)
+        for _ in range(10): bus.publish("burst")
+        await asyncio.sleep(0)  # Deliveries run: the queue overflows
+        rest = await take(stream, 10)
+        await stream.aclose()
+        return first + rest
+    events = asyncio.run(run())
+    assert [e["seq"] for e in events] == list(range(1, 12))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from core.filters import EMAFilter, KalmanFilter, OneEuroFilter, make_filter
+
+DT = 1 / 30.0
+
+
+def run(filt, values, dt=DT):
+    return [filt(v, i * dt) for i, v in enumerate(values)]
+
+
+@pytest.mark.parametrize("kind", ["one_euro", "kalman", "ema"])
+def test_first_sample_passes_through(kind):
+    filt = make_filter(kind)
+    assert filt((3.0, 4.0), 0.0) == pytest.approx([3.0, 4.0])
+    assert make_filter(kind)(5.0, 0.0) == 5.0  # Scalars come back as scalars
+
+
+def test_make_filter_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        make_filter("median")
+
+
+@pytest.mark.parametrize("filt", [OneEuroFilter(), KalmanFilter(), EMAFilter(alpha=0.3)])
+def test_converges_on_a_constant_input(filt):
+    out = run(filt, [0.0] + [10.0] * 200)
+    assert out[-1] == pytest.approx(10.0, abs=0.05)
+
+
+def test_one_euro_reduces_jitter_on_a_still_hand():
+    rng = np.random.default_rng(0)
+    raw = 100 + rng.normal(0, 2.5, 300)
+    out = np.array(run(OneEuroFilter(min_cutoff=1.0, beta=0.007), raw))
+    assert out[30:].std() < raw[30:].std() / 2
+
+
+def test_one_euro_velocity_tracks_a_ramp():
+    filt = OneEuroFilter(min_cutoff=1.0, beta=0.0)
+    run(filt, [60.0 * i * DT for i in range(120)])  # 60 units/s
+    assert filt.velocity[0] == pytest.approx(60.0, rel=0.05)
+
+
+@pytest.mark.parametrize("filt", [OneEuroFilter(), KalmanFilter(process_noise=2e5, measurement_noise=6.0)])
+def test_lead_extrapolates_along_the_velocity(filt):
+    ramp = [60.0 * i * DT for i in range(120)]
+    plain = run(filt, ramp)[-1]
+    filt.reset()
+    filt.lead = 0.05
+    led = run(filt, ramp)[-1]
+    assert led - plain == pytest.approx(60.0 * 0.05, rel=0.2)
+
+
+def test_reset_forgets_the_state():
+    filt = OneEuroFilter()
+    run(filt, [0.0, 50.0, 100.0])
+    filt.reset()
+    assert filt(7.0, 10.0) == 7.0
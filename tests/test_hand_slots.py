@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from core.engine import GestureEngine
+from core.hand_tracker import HandTracker
+from gestures.Pro_snap import ProSnap
+from gestures.two_hand_zoom import TwoHandZoom
+
+FRAME = np.zeros((480, 640, 3), np.uint8)
+OPEN = [1, 1, 1, 1, 1]
+
+
+def hand(x, y=0.6, pinch=False):
+    """Open hand with a 0.2 palm; thumb and middle tips touch when pinched."""
+    points = [SimpleNamespace(x=x, y=y, z=0.0) for _ in range(21)]
+    points[9] = SimpleNamespace(x=x, y=y - 0.2, z=0.0)
+    points[12] = SimpleNamespace(x=x, y=y - 0.35, z=0.0)
+    points[4] = SimpleNamespace(x=x, y=y - 0.345, z=0.0) if pinch else SimpleNamespace(x=x - 0.15, y=y - 0.2, z=0.0)
+    return points
+
+
+def wrap(tracked):
+    return SimpleNamespace(landmark=tracked.landmarks), OPEN
+
+
+@pytest.fixture
+def engine():
+    engine = GestureEngine.__new__(GestureEngine)  # Only the hand-slot bookkeeping: no runtime, camera or stores
+    engine.left_hand_id = engine.zoom_hand_ids = None
+    engine.volume_control = SimpleNamespace(volume_mode=False)
+    engine.pro_snap, engine.two_hand_zoom = ProSnap(), TwoHandZoom()
+    return engine
+
+
+def test_snap_loaded_by_one_hand_does_not_fire_for_the_next(engine):
+    tracker = HandTracker()
+    for _ in range(4):
+        hands = tracker.update([hand(0.3, pinch=True)], ["Left"])
+        engine._assign_hands(hands)
+        engine.pro_snap.process(FRAME, [wrap(hands[0])])
+    assert engine.pro_snap.is_prepped
+    engine.volume_control.volume_mode = True
+
+    # Mid-gesture, a different left hand takes the slot, fingers apart
+    actions = []
+    for _ in range(4):
+        hands = tracker.update([hand(0.8)], ["Left"])
+        engine._assign_hands(hands)
+        actions.append(engine.pro_snap.process(FRAME, [wrap(hands[0])])[1])
+    assert actions == [None] * 4
+    assert not engine.volume_control.volume_mode
+
+
+def test_same_hand_keeps_its_snap(engine):
+    tracker = HandTracker()
+    hands = tracker.update([hand(0.3, pinch=True)], ["Left"])
+    engine._assign_hands(hands)
+    engine.pro_snap.process(FRAME, [wrap(hands[0])])
+    engine._assign_hands(tracker.update([hand(0.31, pinch=True)], ["Left"]))
+    assert engine.pro_snap.is_prepped
+
+
+def test_zoom_reanchors_when_a_different_hand_joins(engine):
+    tracker = HandTracker()
+    zoom = engine.two_hand_zoom
+    for _ in range(6):
+        hands = tracker.update([hand(0.3), hand(0.6)], ["Left", "Right"])
+        engine._assign_hands(hands)
+        zoom.process(FRAME, [wrap(h) for h in hands], 640, 480)
+    assert zoom.is_active and zoom.current_zoom == pytest.approx(100, abs=1)
+
+    # The right hand leaves and another enters twice as far away
+    for _ in range(6):
+        hands = tracker.update([hand(0.3), hand(0.9)], ["Left", "Right"])
+        engine._assign_hands(hands)
+        zoom.process(FRAME, [wrap(h) for h in hands], 640, 480)
+    assert zoom.current_zoom == pytest.approx(100, abs=1)
+
+    # Spreading the new pair zooms from there
+    for _ in range(10):
+        hands = tracker.update([hand(0.2), hand(0.95)], ["Left", "Right"])
+        engine._assign_hands(hands)
+        zoom.process(FRAME, [wrap(h) for h in hands], 640, 480)
+    assert zoom.current_zoom > 105
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from core.hand_tracker import HandTracker
+
+
+def hand(x, y):
+    return [SimpleNamespace(x=x, y=y) for _ in range(21)]
+
+
+def test_ids_survive_detection_order_swaps():
+    tracker = HandTracker()
+    first = tracker.update([hand(0.2, 0.5), hand(0.8, 0.5)], ["Left", "Right"])
+    ids = {round(h.landmarks[0].x, 1): h.id for h in first}
+    swapped = tracker.update([hand(0.81, 0.5), hand(0.21, 0.5)], ["Right", "Left"])
+    assert {round(h.landmarks[0].x, 1): h.id for h in swapped} == ids
+
+
+def test_state_follows_the_hand():
+    tracker = HandTracker()
+    [a, b] = tracker.update([hand(0.2, 0.5), hand(0.8, 0.5)], ["Left", "Right"])
+    states = {a.id: a.state, b.id: b.state}
+    for h in tracker.update([hand(0.79, 0.5), hand(0.22, 0.5)], ["Right", "Left"]):
+        assert h.state is states[h.id]
+
+
+def test_one_wrong_label_does_not_flip_handedness():
+    tracker = HandTracker()
+    [h] = tracker.update([hand(0.5, 0.5)], ["Left"])
+    tracker.update([hand(0.5, 0.5)], ["Right"])
+    tracker.update([hand(0.5, 0.5)], ["Left"])
+    assert h.label == "Left" and tracker.label_flips == 1
+
+
+def test_sustained_disagreement_flips_after_four_frames():
+    tracker = HandTracker()
+    [h] = tracker.update([hand(0.5, 0.5)], ["Left"])
+    labels = [tracker.update([hand(0.5, 0.5)], ["Right"])[0].label for _ in range(4)]
+    assert labels == ["Left", "Left", "Left", "Right"]
+
+
+def test_track_survives_max_missed_frames():
+    tracker = HandTracker(max_missed=2)
+    [h] = tracker.update([hand(0.5, 0.5)], ["Right"])
+    for _ in range(2): assert tracker.update([], []) == []
+    assert tracker.update([hand(0.52, 0.5)], ["Right"])[0].id == h.id
+    for _ in range(3): tracker.update([], [])
+    assert tracker.update([hand(0.5, 0.5)], ["Right"])[0].id != h.id
+
+
+def test_far_detection_starts_a_new_track():
+    tracker = HandTracker(max_distance=0.2)
+    [h] = tracker.update([hand(0.1, 0.5)], ["Right"])
+    [other] = tracker.update([hand(0.9, 0.5)], ["Right"])
+    assert other.id != h.id and len(tracker.tracks) == 2
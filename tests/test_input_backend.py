@@ -0,0 +1,21 @@
+import pytest
+
+from core.input_backend import XLIB_KEYSYMS, xlib_keysym_name
+from core.macros import KEY_NAMES
+
+
+def test_every_macro_key_has_an_x_keysym():
+    assert sorted(key for key in KEY_NAMES if xlib_keysym_name(key) is None) == []
+
+
+def test_function_keys():
+    assert xlib_keysym_name("f1") == "F1" and xlib_keysym_name("f24") == "F24"
+    assert xlib_keysym_name("f25") is None and xlib_keysym_name("a") is None
+
+
+def test_keysym_names_exist_in_xlib():
+    XK = pytest.importorskip("Xlib.XK")
+    XK.load_keysym_group("xf86")
+    XK.load_keysym_group("korean")
+    names = {xlib_keysym_name(key) for key in KEY_NAMES} | set(XLIB_KEYSYMS.values())
+    assert sorted(name for name in names if not XK.string_to_keysym(name)) == []
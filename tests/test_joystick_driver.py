@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from core.joystick_driver import JoystickDriver
+from core.macros import MacroEngine
+
+
+class Macros:
+    """Compiles for real (no backend) and records the arrow keys each run would press."""
+
+    def __init__(self):
+        self.compiler = MacroEngine(None)
+        self.runs = []
+
+    def compile(self, spec):
+        return self.compiler.compile(spec)
+
+    def run(self, macro):
+        self.runs.append([code for kind, events in macro if kind == "keys" for code, down in events if down])
+
+    @property
+    def keys(self):
+        return [key for run in self.runs for key in run if key != "shift"]
+
+
+@pytest.fixture
+def joystick():
+    drivers = []
+
+    def make(**kwargs):
+        driver = JoystickDriver(Macros(), **kwargs)
+        driver.start()
+        drivers.append(driver)
+        return driver
+    yield make
+    for driver in drivers: driver.stop()
+
+
+def hold(driver, direction, deflection, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        driver.update(direction, deflection)
+        time.sleep(0.01)
+
+
+def test_rate_curve():
+    driver = JoystickDriver(None, min_rate=4, max_rate=25, curve=2, accel_time=1.5, max_accel=2)
+    assert driver.rate(0.0, 0.0) == 4
+    assert driver.rate(0.5, 0.0) == pytest.approx(4 + 21 * 0.25)
+    assert driver.rate(1.0, 1.5) == driver.rate(1.0, 10.0) == 50
+
+
+def test_first_key_fires_on_engage_then_waits_for_the_repeat_delay(joystick):
+    driver = joystick(initial_delay=0.3)
+    hold(driver, "LEFT", 1.0, 0.15)
+    assert driver.macros.keys == ["left"]
+    assert driver.macros.runs[0] == ["shift", "left"]  # Selection: shift held around the key
+
+
+def test_repeats_follow_the_deflection(joystick):
+    slow, fast = joystick(initial_delay=0.0, min_rate=5, max_rate=40), joystick(initial_delay=0.0, min_rate=5, max_rate=40)
+    hold(slow, "DOWN", 0.0, 0.4)
+    hold(fast, "DOWN", 1.0, 0.4)
+    assert 1 < slow.keys_sent < fast.keys_sent
+
+
+def test_direction_change_engages_at_once(joystick):
+    driver = joystick(initial_delay=0.5)
+    hold(driver, "LEFT", 1.0, 0.1)
+    hold(driver, "RIGHT", 1.0, 0.1)
+    assert driver.macros.keys == ["left", "right"]
+
+
+def test_keys_stop_when_the_hand_goes_quiet(joystick):
+    driver = joystick(initial_delay=0.0, hold_timeout=0.1)
+    driver.update("UP", 1.0)  # Never refreshed: the hand was lost
+    time.sleep(0.3)
+    sent = driver.keys_sent
+    time.sleep(0.2)
+    assert driver.keys_sent == sent
+    assert sent <= 1 + 0.1 * driver.rate(1.0, 0.1) + 1
+
+
+def test_release_stops_repeats(joystick):
+    driver = joystick(initial_delay=0.0)
+    hold(driver, "UP", 1.0, 0.1)
+    driver.release()
+    time.sleep(0.05)
+    sent = driver.keys_sent
+    time.sleep(0.15)
+    assert driver.keys_sent == sent
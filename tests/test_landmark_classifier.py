@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.landmark_classifier import LandmarkClassifier, landmark_features
+from core.training import train_classifier
+
+RNG = np.random.default_rng(0)
+POSES = {name: RNG.uniform(-0.1, 0.1, (21, 3)) for name in ("fist", "peace", "ok")}
+for pose in POSES.values():
+    pose[0] = 0.0
+    pose[9] = (0.0, -0.1, 0.0)  # Palm size 0.1
+
+
+def samples(pose, n, noise=0.003, seed=1):
+    rng = np.random.default_rng(seed)
+    offsets = rng.uniform(0.3, 0.7, (n, 1, 3)) * [1, 1, 0]
+    scales = rng.uniform(0.7, 1.5, (n, 1, 1))
+    return pose * scales + offsets + rng.normal(0, noise, (n, 21, 3))
+
+
+def as_landmarks(frame):
+    return [SimpleNamespace(x=x, y=y, z=z) for x, y, z in frame]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    classes = list(POSES)
+    frames = np.concatenate([samples(POSES[name], 120, seed=i) for i, name in enumerate(classes)])
+    labels = np.repeat(np.arange(len(classes)), 120)
+    weights, bias, accuracy, regions = train_classifier(landmark_features(frames), labels, len(classes), epochs=40)
+    assert accuracy > 0.95
+    return LandmarkClassifier(classes, weights, bias, regions=regions)
+
+
+def test_features_ignore_position_and_distance():
+    pose = POSES["fist"]
+    moved = pose * 1.7 + [0.4, 0.2, 0.0]
+    assert np.allclose(landmark_features(pose[None]), landmark_features(moved[None]), atol=1e-5)
+
+
+def test_batched_hands_match_per_frame_prediction(classifier):
+    frames = np.stack([samples(POSES["peace"], 1, seed=7)[0], samples(POSES["ok"], 1, seed=8)[0]])
+    batched = classifier.classify_hands([as_landmarks(f) for f in frames])
+    single = classifier.predict(frames)
+    assert [label for label, _ in batched] == [label for label, _ in single] == ["peace", "ok"]
+    assert [conf for _, conf in batched] == pytest.approx([conf for _, conf in single], abs=1e-5)
+
+
+def test_extra_hands_are_ignored(classifier):
+    frame = as_landmarks(samples(POSES["fist"], 1)[0])
+    assert len(classifier.classify_hands([frame] * 3)) == classifier.max_hands
+    assert classifier.classify_hands([]) == []
+
+
+def test_unknown_poses_are_rejected(classifier):
+    rng = np.random.default_rng(42)
+    random_poses = rng.uniform(-0.1, 0.1, (100, 21, 3))
+    random_poses[:, 0] = 0.0
+    random_poses[:, 9] = (0.0, -0.1, 0.0)
+    rejected = sum(label is None for label, _ in classifier.predict(random_poses + 0.5))
+    assert rejected >= 95
+    accepted = classifier.predict(samples(POSES["ok"], 50, seed=9))
+    assert all(label == "ok" for label, _ in accepted)
+
+
+def test_window_averages_recent_frames(classifier):
+    smoothed = LandmarkClassifier(classifier.classes, classifier.weights, classifier.bias, window=3,
+                                  regions=classifier.regions)
+    fist, peace = (as_landmarks(samples(POSES[name], 1, seed=3)[0]) for name in ("fist", "peace"))
+    for _ in range(3): smoothed.classify_hands([fist])
+    label, _ = smoothed.classify_hands([peace])[0]
+    assert label != "peace"  # One frame cannot flip a settled hand
+
+
+def test_save_and_load(classifier, tmp_path):
+    path = str(tmp_path / "model.npz")
+    classifier.save(path)
+    loaded = LandmarkClassifier.load(path)
+    frames = samples(POSES["fist"], 5, seed=4)
+    assert loaded.predict(frames) == classifier.predict(frames)
+    assert loaded.regions is not None
+
+
+def test_model_without_regions_still_loads(classifier, tmp_path):
+    path = str(tmp_path / "old.npz")
+    LandmarkClassifier(classifier.classes, classifier.weights, classifier.bias).save(path)
+    loaded = LandmarkClassifier.load(path)
+    assert loaded.regions is None
+    assert loaded.predict(samples(POSES["peace"], 1, seed=5))[0][0] == "peace"
+
+
+def test_window_restarts_when_hand_count_changes(classifier):
+    smoothed = LandmarkClassifier(classifier.classes, classifier.weights, classifier.bias, window=3,
+                                  regions=classifier.regions)
+    fist, peace = (as_landmarks(samples(POSES[name], 1, seed=3)[0]) for name in ("fist", "peace"))
+    for _ in range(3): smoothed.classify_hands([fist])
+    labels = [label for label, _ in smoothed.classify_hands([peace, fist])]
+    assert labels == ["peace", "fist"]  # Second hand appeared: stale rows are not averaged in
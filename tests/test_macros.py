@@ -0,0 +1,51 @@
+import pytest
+
+from core.macros import MacroEngine
+
+compile_macro = MacroEngine(None).compile
+
+
+def tap(key):
+    return ((key, True), (key, False))
+
+
+def test_plain_chord():
+    assert compile_macro(["Control", "c"]) == (("keys", (("ctrl", True), ("c", True), ("c", False), ("ctrl", False))),)
+
+
+def test_repeat_merges_into_one_batch():
+    assert compile_macro([{"press": "down", "repeat": 3}]) == (("keys", tap("down") * 3),)
+
+
+def test_hold_wraps_inner_steps():
+    macro = compile_macro([{"hold": "alt", "steps": ["tab", "tab"]}])
+    assert macro == (("keys", (("alt", True),) + tap("tab") * 2 + (("alt", False),)),)
+
+
+def test_text_adds_shift_for_shifted_characters():
+    [(kind, events)] = compile_macro([{"text": "Hi!"}])
+    assert events == (("shift", True), ("h", True), ("h", False), ("shift", False),
+                      *tap("i"),
+                      ("shift", True), ("1", True), ("1", False), ("shift", False))
+
+
+def test_delays_split_batches_and_merge():
+    macro = compile_macro(["a", {"delay": 0.1}, {"delay": 0.2}, "b"])
+    assert [kind for kind, _ in macro] == ["keys", "delay", "keys"]
+    assert macro[1][1] == pytest.approx(0.3)
+
+
+@pytest.mark.parametrize("spec", [
+    [],
+    ["ctrl", "notakey"],
+    [{"press": "é"}],
+    [{"press": ""}],
+    [{"hotkey": ["ctrl", 5]}],
+    [{"press": "a", "repeat": 0}],
+    [{"delay": 10}],
+    [{"jump": "a"}],
+    [42],
+])
+def test_invalid_specs_are_rejected_without_a_backend(spec):
+    with pytest.raises(ValueError):
+        compile_macro(spec)
@@ -0,0 +1,128 @@
+import pytest
+
+from core import module_guard
+from core.module_guard import CLOSED, HALF_OPEN, OPEN, ModuleGuard
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(module_guard.time, "monotonic", clock)
+    monkeypatch.setattr(module_guard.time, "perf_counter", clock)
+    return clock
+
+
+def boom():
+    raise RuntimeError("boom")
+
+
+def costs(clock, ms):
+    def fn():
+        clock.now += ms / 1000
+        return "ok"
+    return fn
+
+
+def test_breaker_opens_probes_and_closes(clock):
+    events = []
+    guard = ModuleGuard(failure_limit=3, cooldown=2.0, on_state=lambda name, state: events.append(state))
+    for _ in range(3):
+        assert guard.call("swipe", boom) is None
+    assert guard.stats()["swipe"]["state"] == OPEN
+
+    assert guard.call("swipe", lambda: "ok") is None  # Still cooling down
+    assert guard.stats()["swipe"]["skipped"] == 1
+
+    clock.now += 2.0
+    assert guard.call("swipe", lambda: "ok") == "ok"
+    assert events == [OPEN, HALF_OPEN, CLOSED]
+    assert guard.stats()["swipe"]["trips"] == 1
+
+
+def test_failed_probe_doubles_the_cooldown(clock):
+    guard = ModuleGuard(failure_limit=1, cooldown=2.0, max_cooldown=5.0)
+    guard.call("snap", boom)
+    clock.now += 2.0
+    guard.call("snap", boom)  # Probe fails: open for 4 s
+    assert guard.stats()["snap"]["state"] == OPEN
+    clock.now += 3.9
+    assert guard.call("snap", lambda: "ok") is None
+    clock.now += 0.1
+    guard.call("snap", boom)  # Capped at max_cooldown
+    clock.now += 4.9
+    assert guard.call("snap", lambda: "ok") is None
+    clock.now += 0.1
+    assert guard.call("snap", lambda: "ok") == "ok"
+
+
+def test_success_resets_the_failure_count(clock):
+    guard = ModuleGuard(failure_limit=2)
+    guard.call("copy", boom)
+    guard.call("copy", lambda: None)
+    guard.call("copy", boom)
+    assert guard.stats()["copy"]["state"] == CLOSED
+    assert guard.stats()["copy"]["last_error"] == "RuntimeError: boom"
+
+
+def test_slow_module_runs_every_nth_frame(clock):
+    guard = ModuleGuard(budget_ms=8.0, max_stride=4, alpha=1.0)
+    guard.call("zoom", costs(clock, 20))
+    assert guard.stats()["zoom"]["stride"] == 3
+    ran = [guard.call("zoom", costs(clock, 20)) for _ in range(6)]
+    assert ran.count("ok") == 2
+
+
+def test_stride_is_capped_and_recovers(clock):
+    guard = ModuleGuard(budget_ms=8.0, max_stride=2, alpha=1.0)
+    guard.call("zoom", costs(clock, 30))
+    assert guard.stats()["zoom"]["stride"] == 2
+    for _ in range(2): guard.call("zoom", costs(clock, 1))
+    assert guard.stats()["zoom"]["stride"] == 1
+
+
+def test_one_outlier_does_not_throttle(clock):
+    guard = ModuleGuard(budget_ms=8.0, max_stride=30)
+    for _ in range(5): guard.call("volume", costs(clock, 1))
+    guard.call("volume", costs(clock, 300))
+    stats = guard.stats()["volume"]
+    assert stats["max_ms"] == pytest.approx(300)
+    assert stats["cost_ms"] < 8.0 and stats["stride"] == 1
+
+
+def test_zero_budget_disables_throttling(clock):
+    guard = ModuleGuard(budget_ms=0)
+    for _ in range(3): assert guard.call("text", costs(clock, 50)) == "ok"
+    assert guard.stats()["text"]["stride"] == 1
+
+
+def test_reset(clock):
+    events = []
+    guard = ModuleGuard(failure_limit=1, on_state=lambda name, state: events.append(state))
+    guard.call("snap", boom)
+    guard.reset("snap")
+    assert guard.stats()["snap"]["state"] == CLOSED and guard.stats()["snap"]["errors"] == 0
+    assert events == [OPEN, CLOSED]
+    with pytest.raises(KeyError):
+        guard.reset("missing")
+
+
+def test_callback_errors_are_ignored(clock):
+    guard = ModuleGuard(failure_limit=1, on_state=lambda name, state: 1 / 0)
+    guard.call("snap", boom)
+    assert guard.stats()["snap"]["state"] == OPEN
+
+
+@pytest.mark.parametrize("field, value", [("budget_ms", -1), ("max_stride", 0), ("failure_limit", 0), ("cooldown", 0)])
+def test_configure_rejects_out_of_range(field, value):
+    guard = ModuleGuard()
+    with pytest.raises(ValueError):
+        guard.configure(**{field: value})
+    assert guard.config() == ModuleGuard().config()
@@ -0,0 +1,72 @@
+import pytest
+
+from core.motion import MotionTrack
+
+
+def moving(fps, duration=0.3, vx=0.5, vy=-0.25):
+    track = MotionTrack()
+    for i in range(int(duration * fps) + 1):
+        t = i / fps
+        track.push(t, 0.2 + vx * t, 0.8 + vy * t)
+    return track
+
+
+@pytest.mark.parametrize("fps", [5, 8, 15, 30, 60])
+def test_velocity_is_independent_of_frame_rate(fps):
+    vx, vy = moving(fps).velocity(0.2)
+    assert vx == pytest.approx(0.5)
+    assert vy == pytest.approx(-0.25)
+
+
+@pytest.mark.parametrize("fps", [5, 8])
+def test_low_frame_rates_fall_back_to_the_newest_samples(fps):
+    track = moving(fps, duration=1.0)
+    assert track.velocity(0.1) == pytest.approx((0.5, -0.25))  # Screenshot window
+    assert track.span(0.15) >= 0.09                            # Swipe gate
+    assert track.acceleration(0.2) == pytest.approx((0.0, 0.0), abs=1e-9)
+
+
+def test_velocity_is_none_across_a_frame_gap():
+    track = moving(30)
+    track.push(1.0, 0.9, 0.9)  # 0.7 s after the previous frame: the hand was lost
+    assert track.velocity(0.1) is None
+    assert track.span(0.15) == 0.0
+    assert track.velocity(1.0) is not None
+
+
+def test_velocity_needs_two_samples():
+    track = MotionTrack()
+    assert track.velocity() is None
+    track.push(0.0, 0.5, 0.5)
+    assert track.velocity() is None
+
+
+def test_span_covers_the_window():
+    track = moving(30, duration=2.0)
+    assert track.span(0.11) == pytest.approx(0.1)
+    assert track.span(10) == pytest.approx(31 / 30)  # Capacity 32 samples
+    assert MotionTrack().span(0.1) == 0.0
+
+
+def test_acceleration_of_a_parabola():
+    track = MotionTrack()
+    for i in range(10):
+        t = i / 30
+        track.push(t, 3.0 * t * t, 0.5)
+    ax, ay = track.acceleration(0.5)
+    assert ax == pytest.approx(6.0)
+    assert ay == pytest.approx(0.0, abs=1e-9)
+
+
+def test_ring_keeps_the_newest_samples():
+    track = MotionTrack(capacity=4)
+    for i in range(10): track.push(i * 0.01, float(i), 0.0)
+    assert len(track) == 4
+    assert track.last() == (9.0, 0.0)
+    assert track.velocity(1.0)[0] == pytest.approx(100.0)
+
+
+def test_clear():
+    track = moving(30)
+    track.clear()
+    assert len(track) == 0 and track.velocity() is None and track.acceleration() is None
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from core import motion_gate
+from core.motion_gate import MotionGate
+
+
+def result(x0=0.4, y0=0.4, x1=0.6, y1=0.6):
+    corners = [SimpleNamespace(x=x, y=y) for x in (x0, x1) for y in (y0, y1)]
+    return SimpleNamespace(hand_landmarks=[corners])
+
+
+def frame(seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (480, 640), dtype=np.uint8)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(motion_gate.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_off_by_default():
+    gate = MotionGate()
+    gate.update(frame(), result())
+    assert not gate.enabled and not gate.reuse(frame())
+
+
+def test_static_frame_is_reused(clock):
+    gate = MotionGate(max_reuse=3)
+    gray = frame()
+    gate.update(gray, result())
+    noisy = np.clip(gray.astype(int) + 5, 0, 255).astype(np.uint8)  # Sensor noise only
+    assert gate.reuse(noisy)
+    assert gate.stats()["hits"] == 1
+
+
+def test_motion_inside_the_hand_forces_a_detection(clock):
+    gate = MotionGate(max_reuse=3)
+    gray = frame()
+    gate.update(gray, result())
+    moved = gray.copy()
+    moved[200:280, 260:380] = 255 - moved[200:280, 260:380]
+    assert not gate.reuse(moved)
+
+
+def test_motion_outside_the_hand_is_ignored(clock):
+    gate = MotionGate(max_reuse=3)
+    gray = frame()
+    gate.update(gray, result())
+    moved = gray.copy()
+    moved[:100, :100] = 255 - moved[:100, :100]
+    assert gate.reuse(moved)
+
+
+def test_staleness_limits(clock):
+    gate = MotionGate(max_reuse=2, max_age=0.5)
+    gray = frame()
+    gate.update(gray, result())
+    assert gate.reuse(gray) and gate.reuse(gray)
+    assert not gate.reuse(gray)  # max_reuse in a row
+    gate.update(gray, result())
+    clock[0] += 0.6
+    assert not gate.reuse(gray)  # Older than max_age
+    assert gate.stats()["forced"] == 2
+
+
+def test_no_hand_always_detects(clock):
+    gate = MotionGate(max_reuse=5)
+    gate.update(frame(), SimpleNamespace(hand_landmarks=[]))
+    assert not gate.reuse(frame())
+
+
+def test_reset(clock):
+    gate = MotionGate(max_reuse=5)
+    gate.update(frame(), result())
+    gate.reset()
+    assert gate.result is None and not gate.reuse(frame())
+
+
+@pytest.mark.parametrize("field, value", [("max_reuse", 61), ("max_age", 0), ("threshold", 1), ("noise", 256)])
+def test_configure_rejects_out_of_range(field, value):
+    gate = MotionGate()
+    with pytest.raises(ValueError):
+        gate.configure(**{field: value})
+    assert gate.config() == MotionGate().config()
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from core.scroll_output import ScrollOutput
+
+
+class Backend:
+    def __init__(self, wheel_resolution=1):
+        self.wheel_resolution = wheel_resolution
+        self.calls = []
+
+    def wheel(self, units):
+        self.calls.append(units)
+
+
+@pytest.fixture
+def scroll():
+    outputs = []
+
+    def make(resolution=1, **kwargs):
+        output = ScrollOutput(Backend(resolution), **kwargs)
+        output.start()
+        outputs.append(output)
+        return output
+    yield make
+    for output in outputs: output.stop()
+
+
+def track(output, velocity, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        output.update(velocity)
+        time.sleep(0.01)
+
+
+def test_tracks_the_published_velocity(scroll):
+    output = scroll()
+    track(output, 20.0, 0.5)
+    output.release()
+    assert 6 <= output.units <= 11  # 20 notches/s for 0.5 s, less the catch-up ramp
+    assert all(units > 0 for units in output.backend.calls)
+
+
+def test_negative_velocity_scrolls_down(scroll):
+    output = scroll()
+    track(output, -20.0, 0.3)
+    assert output.units < 0
+
+
+def test_fine_wheel_units_are_batched(scroll):
+    output = scroll(resolution=120)
+    track(output, 4.0, 0.4)
+    assert output.backend.calls and min(abs(units) for units in output.backend.calls) >= 15  # 1/8 notch
+
+
+def test_release_flings_and_decays(scroll):
+    output = scroll(fling_tau=0.1)
+    track(output, 30.0, 0.3)
+    output.release()
+    at_release = output.units
+    time.sleep(0.6)
+    coasted = output.units - at_release
+    assert 1 <= coasted <= 30 * 0.1 + 1  # About velocity * tau
+    time.sleep(0.1)
+    assert output.units - at_release == coasted  # Stopped
+
+
+def test_slow_release_does_not_fling(scroll):
+    output = scroll(fling_min=5.0)
+    track(output, 3.0, 0.5)
+    output.release()
+    time.sleep(0.02)
+    units = output.units
+    time.sleep(0.3)
+    assert output.units == units
+
+
+def test_lost_hand_counts_as_release(scroll):
+    output = scroll(hold_timeout=0.05, fling_min=100.0)
+    output.update(50.0)  # Never refreshed
+    time.sleep(0.3)
+    units = output.units
+    time.sleep(0.2)
+    assert output.units == units <= 50 * 0.05 + 1
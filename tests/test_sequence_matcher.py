@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from core.sequence_matcher import (
+    WINDOW, SequenceMatcher, circle_template, dtw_early_abandon, resample, znorm,
+)
+
+
+def feed(matcher, path):
+    result = None
+    for point in path:
+        matcher.push(point)
+        result = matcher.match() or result
+    return result
+
+
+def test_resample_spaces_points_along_the_arc():
+    out = resample([[0, 0], [10, 0]], 6)
+    assert out.shape == (6, 2)
+    assert np.allclose(out[:, 0], [0, 2, 4, 6, 8, 10])
+
+
+def test_znorm_is_translation_and_scale_invariant():
+    path = circle_template()
+    assert np.allclose(znorm(path), znorm(path * 7 + 3), atol=1e-5)
+
+
+def test_dtw_abandons_above_the_limit():
+    a = np.zeros((8, 2), dtype=np.float32)
+    b = np.ones((8, 2), dtype=np.float32)
+    assert dtw_early_abandon(a, a, 2, 1.0) == 0.0
+    assert dtw_early_abandon(a, b, 2, 1.0) == float("inf")
+
+
+def test_matches_a_scaled_circle_and_not_its_mirror():
+    matcher = SequenceMatcher()
+    matcher.add_template("cw", circle_template(clockwise=True), threshold=4.0)
+    assert feed(matcher, circle_template(clockwise=True) * 3 + 5) == "cw"
+    matcher.reset()
+    assert feed(matcher, circle_template(clockwise=False) * 3 + 5) is None
+
+
+def test_best_template_wins_and_fires_once():
+    matcher = SequenceMatcher()
+    matcher.add_template("cw", circle_template(clockwise=True), threshold=4.0)
+    matcher.add_template("ccw", circle_template(clockwise=False), threshold=4.0)
+    path = circle_template(clockwise=False) * 3
+    assert feed(matcher, path) == "ccw"
+    assert matcher.match() is None  # Buffer cleared after a match
+
+
+def test_still_hand_never_matches():
+    matcher = SequenceMatcher()
+    matcher.add_template("cw", circle_template(), threshold=100.0)
+    rng = np.random.default_rng(0)
+    assert feed(matcher, rng.normal(0, 0.05, (WINDOW * 2, 2))) is None  # Below min_extent
+
+
+def test_replacing_and_removing_templates():
+    matcher = SequenceMatcher()
+    matcher.add_template("a", circle_template(), 4.0)
+    matcher.add_template("a", circle_template(clockwise=False), 4.0)
+    assert matcher.names == ["a"]
+    matcher.remove_template("a")
+    assert matcher.names == []
+
+
+@pytest.mark.parametrize("points, threshold", [
+    ([[0], [1, 2]], 4.0),            # Ragged
+    ([[0, 0, 0], [1, 1, 1]], 4.0),   # Wrong dimension
+    ([[0, 0]], 4.0),                 # Single point
+    ([[1, 1], [1, 1]], 4.0),         # No extent
+    ([[0, 0], [float("nan"), 1]], 4.0),
+    ([[0, 0], [1, 1]], 0.0),         # Threshold
+])
+def test_add_template_rejects_malformed_input(points, threshold):
+    matcher = SequenceMatcher()
+    with pytest.raises(ValueError):
+        matcher.add_template("bad", points, threshold)
+    assert matcher.names == []
@@ -0,0 +1,53 @@
+from core.settings import SettingsStore
+
+
+def store():
+    return SettingsStore({
+        "swipe": {"name": "Swipe", "trigger": "palm", "enabled": True, "sensitivity": 0.7, "cooldown": 1.0},
+        "volume": {"name": "Volume", "trigger": "pinch", "enabled": True},
+    })
+
+
+def test_update_ignores_null_and_later_updates_apply():
+    settings = store()
+    assert settings.update("swipe", {"sensitivity": None})
+    assert settings.gestures["swipe"].sensitivity == 0.7
+    settings.update("swipe", {"sensitivity": 0.9})
+    assert settings.gestures["swipe"].sensitivity == 0.9
+
+
+def test_absent_fields_stay_absent():
+    settings = store()
+    settings.update("volume", {"cooldown": 2.0, "bogus": 1})
+    assert settings.gestures["volume"].cooldown is None
+    assert "cooldown" not in settings.gestures["volume"].to_dict()
+
+
+def test_changes_bump_version_and_etag():
+    settings = store()
+    before = settings.current
+    settings.update("swipe", {"enabled": False})
+    assert settings.current.version == before.version + 1
+    assert settings.current.etag != before.etag
+    assert before.gestures["swipe"].enabled  # Old snapshot is untouched
+    assert b'"enabled": false' in settings.current.body
+
+
+def test_no_op_update_keeps_the_snapshot():
+    settings = store()
+    before = settings.current
+    settings.update("swipe", {"enabled": True})
+    assert settings.current is before
+
+
+def test_unknown_gesture():
+    assert store().update("missing", {"enabled": False}) is False
+
+
+def test_add_does_not_overwrite():
+    settings = store()
+    settings.add("custom_fist", name="fist", trigger="fist", enabled=False)
+    assert settings.gestures["custom_fist"].enabled is False
+    version = settings.current.version
+    settings.add("custom_fist", name="other", trigger="other")
+    assert settings.gestures["custom_fist"].name == "fist" and settings.current.version == version
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from core.volume_backend import FakeVolumeBackend, VolumeService
+
+
+class RecordingBackend(FakeVolumeBackend):
+    def __init__(self, level=50):
+        super().__init__(level)
+        self.reads = 0
+        self.write_times = []
+        self.closed = False
+        self.written = threading.Event()
+
+    def read(self):
+        self.reads += 1
+        return super().read()
+
+    def write(self, percent):
+        super().write(percent)
+        self.write_times.append(time.monotonic())
+        self.written.set()
+
+    def close(self):
+        self.closed = True
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline: return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture
+def service():
+    services = []
+
+    def make(backend, **kwargs):
+        service = VolumeService(backend, **kwargs)
+        service.start()
+        services.append(service)
+        return service
+    yield make
+    for service in services: service.stop()
+
+
+def test_set_is_cached_and_clamped(service):
+    volume = service(RecordingBackend(), max_rate_hz=100)
+    volume.set(140)
+    assert volume.get() == 100
+    volume.set(-5)
+    assert volume.get() == 0
+    assert wait_for(lambda: volume.backend.level == 0)
+
+
+def test_rapid_sets_coalesce_to_the_newest(service):
+    backend = RecordingBackend()
+    volume = service(backend, max_rate_hz=4)
+    volume.set(10)
+    assert backend.written.wait(1)
+    for level in range(20, 100, 10): volume.set(level)
+    assert wait_for(lambda: backend.writes[-1] == 90)
+    assert backend.writes == [10, 90]
+
+
+def test_writes_are_rate_capped(service):
+    backend = RecordingBackend()
+    volume = service(backend, max_rate_hz=20)
+    for level in range(30):
+        volume.set(level)
+        time.sleep(0.005)
+    assert wait_for(lambda: backend.level == 29)
+    gaps = [b - a for a, b in zip(backend.write_times, backend.write_times[1:])]
+    assert len(backend.writes) < 30
+    assert min(gaps) >= 0.05 * 0.9
+
+
+def test_idle_service_does_not_poll(service):
+    backend = RecordingBackend()
+    volume = service(backend, refresh_interval=0.02, idle_after=0.1)
+    assert wait_for(lambda: backend.reads == 1)
+    time.sleep(0.15)
+    assert backend.reads == 1
+
+    volume.touch()  # In use again: refreshed at once, then every refresh_interval
+    assert wait_for(lambda: backend.reads >= 4)
+    backend.level = 70
+    assert wait_for(lambda: volume.get() == 70)
+
+    time.sleep(0.15)  # Idle again
+    reads = backend.reads
+    time.sleep(0.15)
+    assert backend.reads == reads
+
+
+def test_stop_flushes_the_pending_write_and_closes():
+    backend = RecordingBackend()
+    volume = VolumeService(backend, max_rate_hz=4)
+    volume.start()
+    volume.set(10)
+    assert backend.written.wait(1)
+    volume.set(80)  # Held back by the rate cap
+    volume.stop()
+    assert backend.writes == [10, 80]
+    assert backend.closed
+
+
+def test_restart_after_stop(service):
+    backend = RecordingBackend()
+    volume = service(backend, max_rate_hz=100)
+    volume.stop()
+    volume.start()
+    volume.set(33)
+    assert wait_for(lambda: backend.level == 33)
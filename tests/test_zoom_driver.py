@@ -0,0 +1,117 @@
+import math
+import time
+
+import pytest
+
+from core.macros import MacroEngine
+from core.zoom_driver import ZoomDriver
+
+
+class Macros:
+    """Compiles for real (no backend) and records the zoom keys each run would press."""
+
+    def __init__(self):
+        self.compiler = MacroEngine(None)
+        self.runs = []
+
+    def compile(self, spec):
+        return self.compiler.compile(spec)
+
+    def run(self, macro):
+        self.runs.append([code for kind, events in macro if kind == "keys" for code, down in events if down])
+
+    @property
+    def keys(self):
+        return [key for run in self.runs for key in run if key in "+-"]
+
+
+class Backend:
+    def __init__(self):
+        self.events = []
+
+    def resolve(self, key):
+        return key
+
+    def send_keys(self, events):
+        self.events.extend(events)
+
+    def scroll(self, clicks):
+        self.events.append(("scroll", clicks))
+
+
+@pytest.fixture
+def driver():
+    drivers = []
+
+    def make(**kwargs):
+        driver = ZoomDriver(Macros(), Backend(), **kwargs)
+        driver.start()
+        drivers.append(driver)
+        return driver
+    yield make
+    for driver in drivers: driver.stop()
+
+
+def settle(driver, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while abs(driver.error()) >= 0.5 and time.monotonic() < deadline: time.sleep(0.01)
+    time.sleep(0.05)
+
+
+def steps(level):
+    return round(math.log(level / 100) / math.log(1.1))
+
+
+def test_first_update_is_the_baseline(driver):
+    zoom = driver()
+    zoom.update(180)
+    settle(zoom)
+    assert zoom.steps_sent == 0
+
+
+@pytest.mark.parametrize("level, key", [(200, "+"), (50, "-")])
+def test_reaches_the_target_without_overshoot(driver, level, key):
+    zoom = driver()
+    zoom.update(100)
+    settle(zoom)
+    zoom.update(level)
+    settle(zoom)
+    assert zoom.macros.keys == [key] * abs(steps(level))
+    assert all(run[0] == "ctrl" for run in zoom.macros.runs)
+
+
+def test_steps_are_rate_limited(driver):
+    zoom = driver(max_rate=20.0, max_batch=1)
+    zoom.update(100)
+    settle(zoom)
+    zoom.update(300)  # 12 steps at most 20/s
+    time.sleep(0.2)
+    assert 1 <= zoom.steps_sent <= 6
+    settle(zoom)
+    assert zoom.steps_sent == steps(300)
+
+
+def test_reset_forgets_the_baseline(driver):
+    zoom = driver()
+    zoom.update(100)
+    settle(zoom)
+    zoom.reset()
+    zoom.update(250)
+    settle(zoom)
+    assert zoom.steps_sent == 0
+
+
+def test_wheel_output_holds_the_modifier(driver):
+    zoom = driver(output="wheel", modifier="command")
+    zoom.update(100)
+    settle(zoom)
+    zoom.update(121)
+    settle(zoom)
+    events = zoom.backend.events
+    assert events[0] == ("command", True) and events[-1] == ("command", False)
+    assert sum(clicks for kind, clicks in events if kind == "scroll") == 2
+
+
+def test_unknown_output():
+    with pytest.raises(ValueError):
+        ZoomDriver(None, None, output="pinch")